@@ -80,6 +80,12 @@ public function makePrediction(
         }
     }
 
+    /**
+     * Rows the script could not score before its deadline are listed in unprocessed_indices
+     * (keys of $entities) so the caller can retry only those.
+     *
+     * @return array{predictions: MLPrediction[], status: string, unprocessed_indices: int[]}
+     */
     public function makeBatchPredictions(
         MLModel $model,
         array $entities,
@@ -96,10 +102,15 @@ public function makeBatchPredictions(
             }
 
             // Process batch through Python
-            $batchResults = $this->executeBatchPythonPrediction($model, $batchInputData);
+            $batchOutput = $this->executeBatchPythonPrediction($model, $batchInputData);
+            $batchResults = $batchOutput['predictions'];
 
-            // Create prediction records
+            // Create prediction records (rows the script could not finish before its deadline are skipped)
             foreach ($entities as $index => $entity) {
+                if (!isset($batchResults[$index])) {
+                    continue;
+                }
+
                 $inputData = $batchInputData[$index];
                 $result = $batchResults[$index];
                 $processedData = $result['processed_features'] ?? $inputData;
@@ -117,13 +128,25 @@ public function makeBatchPredictions(
                 $predictions[] = $prediction;
             }
 
+            $unprocessedIndices = $batchOutput['unprocessed_indices'];
+            if (!empty($unprocessedIndices)) {
+                Log::warning("Batch ML Prediction hit its deadline, returning partial results", [
+                    'model_id' => $model->id,
+                    'unprocessed_count' => count($unprocessedIndices),
+                ]);
+            }
+
             $totalTime = (microtime(true) - $startTime) * 1000;
             $averageTime = $totalTime / count($entities);
             
             // Update model performance
             $model->recordPrediction(true, $averageTime);
 
-            return $predictions;
+            return [
+                'predictions' => $predictions,
+                'status' => $batchOutput['status'],
+                'unprocessed_indices' => $unprocessedIndices,
+            ];
 
         } catch (Exception $e) {
             Log::error("Batch ML Prediction failed: " . $e->getMessage(), [
@@ -248,6 +271,7 @@ private function executeBatchPythonPrediction(MLModel $model, array $batchData):
     {
         $inputFile = $this->createTempInputFile(['batch_data' => $batchData]);
         $outputFile = tempnam(sys_get_temp_dir(), 'ml_batch_prediction_output_');
+        $deadlineMs = (int) config('ml.batch_deadline_ms', 50000);
 
         try {
             $command = [
@@ -257,16 +281,31 @@ private function executeBatchPythonPrediction(MLModel $model, array $batchData):
                 '--input-file', $inputFile,
                 '--output-file', $outputFile,
                 '--model-type', $model->type,
+                '--model-algorithm', $model->algorithm,
+                '--deadline-ms', (string) $deadlineMs,
             ];
 
-            $result = Process::run(implode(' ', array_map('escapeshellarg', $command)));
+            // The script stops itself at the deadline; the process timeout only guards against hangs
+            $result = Process::timeout((int) ceil($deadlineMs / 1000) + 10)
+                ->run(implode(' ', array_map('escapeshellarg', $command)));
 
             if (!$result->successful()) {
                 throw new Exception("Python batch prediction failed: " . $result->errorOutput());
             }
 
             $output = json_decode(file_get_contents($outputFile), true);
-            return $output['predictions'] ?? [];
+
+            // Key results by their original batch index; partial runs omit unprocessed rows
+            $predictions = [];
+            foreach ($output['predictions'] ?? [] as $position => $prediction) {
+                $predictions[$prediction['batch_index'] ?? $position] = $prediction;
+            }
+
+            return [
+                'predictions' => $predictions,
+                'status' => $output['batch_metadata']['status'] ?? 'complete',
+                'unprocessed_indices' => $output['unprocessed_indices'] ?? [],
+            ];
 
         } finally {
             @unlink($inputFile);
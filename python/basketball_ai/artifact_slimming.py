@@ -0,0 +1,337 @@
+"""
+Artifact Slimming für Basketball Analytics
+Kompakte, verlustfreie Speicherung von sklearn Tree-Modellen in Model-Artefakten
+"""
+
+import copy
+import io
+import logging
+import time
+from typing import Dict, List, Tuple, Any, Optional
+
+import joblib
+import numpy as np
+from sklearn.tree._tree import NODE_DTYPE, Tree
+
+logger = logging.getLogger(__name__)
+
+SLIM_VERSION = 1
+
+# Nur für Training/Diagnose, für predict/predict_proba nicht nötig.
+# Gradient Boosting train_score_/_rng bleiben: warm_start (update_model) braucht sie.
+TRAINING_ONLY_ATTRIBUTES = (
+    'oob_score_', 'oob_decision_function_', 'oob_prediction_',
+    'oob_improvement_', 'oob_scores_',
+)
+
+TREE_LEAF = -1
+TREE_UNDEFINED = -2
+
+
+def _smallest_float(values: np.ndarray) -> np.ndarray:
+    """
+    Kleinster Float-Dtype, der alle Werte exakt darstellt
+    """
+    for dtype in (np.float16, np.float32):
+        candidate = values.astype(dtype)
+        if np.array_equal(candidate.astype(np.float64), values, equal_nan=True):
+            return candidate
+    return values
+
+
+def _float32_thresholds(thresholds: np.ndarray) -> np.ndarray:
+    """
+    Thresholds als float32, zur nächstkleineren float32-Zahl gerundet
+
+    sklearn castet X beim Predict auf float32. Für jedes float32 x gilt
+    x <= t genau dann, wenn x <= round_down_float32(t), daher bleiben
+    alle Split-Entscheidungen identisch.
+    """
+    rounded = thresholds.astype(np.float32)
+    above = rounded.astype(np.float64) > thresholds
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+    return rounded
+
+
+def _pack_trees(trees: List[Tree]) -> Dict[str, Any]:
+    """
+    Knoten aller Trees in gemeinsame flache Arrays packen
+
+    Struktur innerer Knoten, Knoten-Werte, Impurity und Sample-Zähler,
+    jeweils im kleinsten verlustfreien Dtype. Werte innerer Knoten und die
+    Zähler braucht predict nicht, wohl aber feature_importances_ und das
+    Depth-Capping beim Pruning. Wenige große Arrays statt Arrays pro Tree
+    halten auch die Ladezeit klein.
+    """
+    states = [tree.__getstate__() for tree in trees]
+    nodes = np.concatenate([state['nodes'] for state in states])
+    values = np.concatenate([state['values'] for state in states])
+    node_counts = np.array([state['node_count'] for state in states])
+
+    is_leaf = nodes['left_child'] == TREE_LEAF
+    internal = ~is_leaf
+    # Kinder-Indizes sind lokal pro Tree
+    index_dtype = np.min_scalar_type(max(int(node_counts.max()) - 1, 0))
+    first = trees[0]
+
+    packed = {
+        'node_counts': node_counts.astype(np.min_scalar_type(int(node_counts.max()))),
+        'max_depths': np.array([state['max_depth'] for state in states], dtype=np.int32),
+        'n_features': int(first.n_features),
+        'n_classes': np.asarray(first.n_classes),
+        'n_outputs': int(first.n_outputs),
+        'is_leaf': np.packbits(is_leaf),
+        'left': nodes['left_child'][internal].astype(index_dtype),
+        'right': nodes['right_child'][internal].astype(index_dtype),
+        'feature': nodes['feature'][internal].astype(np.min_scalar_type(max(first.n_features - 1, 0))),
+        'threshold': _float32_thresholds(nodes['threshold'][internal]),
+        'values': _smallest_float(values),
+        'impurity': _smallest_float(nodes['impurity']),
+        'n_node_samples': nodes['n_node_samples'].astype(np.min_scalar_type(int(nodes['n_node_samples'].max()))),
+        'weighted_n_node_samples': _smallest_float(nodes['weighted_n_node_samples']),
+    }
+
+    if 'missing_go_to_left' in nodes.dtype.names:
+        packed['missing_go_to_left'] = np.packbits(nodes['missing_go_to_left'][internal].astype(bool))
+
+    return packed
+
+
+def _unpack_trees(packed: Dict[str, Any]) -> List[Tree]:
+    """
+    sklearn Trees aus _pack_trees wiederherstellen
+    """
+    node_counts = packed['node_counts'].astype(np.intp)
+    n_nodes = int(node_counts.sum())
+    is_leaf = np.unpackbits(packed['is_leaf'], count=n_nodes).astype(bool)
+    internal = ~is_leaf
+
+    nodes = np.zeros(n_nodes, dtype=NODE_DTYPE)
+    nodes['left_child'] = TREE_LEAF
+    nodes['right_child'] = TREE_LEAF
+    nodes['feature'] = TREE_UNDEFINED
+    nodes['threshold'] = TREE_UNDEFINED
+    nodes['left_child'][internal] = packed['left']
+    nodes['right_child'][internal] = packed['right']
+    nodes['feature'][internal] = packed['feature']
+    nodes['threshold'][internal] = packed['threshold']
+
+    if 'missing_go_to_left' in packed:
+        nodes['missing_go_to_left'][internal] = np.unpackbits(
+            packed['missing_go_to_left'], count=int(internal.sum())
+        )
+
+    nodes['impurity'] = packed['impurity']
+    nodes['n_node_samples'] = packed['n_node_samples']
+    nodes['weighted_n_node_samples'] = packed['weighted_n_node_samples']
+    values = packed['values'].astype(np.float64)
+
+    n_classes = packed['n_classes'].astype(np.intp)
+    offsets = np.concatenate([[0], np.cumsum(node_counts)])
+    trees = []
+
+    for i, node_count in enumerate(node_counts):
+        tree = Tree(packed['n_features'], n_classes, packed['n_outputs'])
+        tree.__setstate__({
+            'max_depth': int(packed['max_depths'][i]),
+            'node_count': int(node_count),
+            'nodes': nodes[offsets[i]:offsets[i + 1]],
+            'values': values[offsets[i]:offsets[i + 1]],
+        })
+        trees.append(tree)
+
+    return trees
+
+
+def _tree_estimators(model: Any) -> List[Any]:
+    """
+    Alle Tree-Estimators eines Models in fester Reihenfolge (Forest: Liste, GB: Stages x K)
+    """
+    if hasattr(model, 'tree_'):
+        return [model]
+    estimators = getattr(model, 'estimators_', None)
+    if estimators is None:
+        return []
+    flat = list(estimators.flat) if isinstance(estimators, np.ndarray) else list(estimators)
+    return flat if flat and all(hasattr(est, 'tree_') for est in flat) else []
+
+
+def is_slimmable(model: Any) -> bool:
+    return bool(_tree_estimators(model))
+
+
+class SlimTreeModel:
+    """
+    Gepacktes sklearn Tree-Model im Artefakt
+
+    Pickle enthält ein Model-Skelett ohne tree_ sowie die gepackten
+    Knoten-Arrays; restore() baut das sklearn-Model wieder zusammen.
+    """
+
+    def __init__(self, skeleton: Any, packed_trees: Dict[str, Any]):
+        self.version = SLIM_VERSION
+        self.skeleton = skeleton
+        self.packed_trees = packed_trees
+        self._model = None
+
+    def restore(self) -> Any:
+        """
+        sklearn-Model mit wiederhergestellten Trees (einmal pro geladenem Objekt)
+        """
+        if self._model is None:
+            model = copy.copy(self.skeleton)
+            if not hasattr(model, 'estimators_'):
+                # Einzelner Decision Tree
+                trees = [model]
+            else:
+                estimators = model.estimators_
+                if isinstance(estimators, np.ndarray):
+                    estimators = estimators.copy()
+                    trees = [copy.copy(est) for est in estimators.flat]
+                    for idx, est in zip(np.ndindex(estimators.shape), trees):
+                        estimators[idx] = est
+                else:
+                    estimators = [copy.copy(est) for est in estimators]
+                    trees = estimators
+                model.estimators_ = estimators
+
+            for est, tree in zip(trees, _unpack_trees(self.packed_trees)):
+                est.tree_ = tree
+
+            self._model = model
+
+        return self._model
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {'version': self.version, 'skeleton': self.skeleton, 'packed_trees': self.packed_trees}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        if state.get('version') != SLIM_VERSION:
+            raise ValueError(f"Unbekannte Slim-Artefakt Version: {state.get('version')}")
+        self.version = state['version']
+        self.skeleton = state['skeleton']
+        self.packed_trees = state['packed_trees']
+        self._model = None
+
+
+def restore_model(model: Any) -> Any:
+    """
+    Model aus einem Artefakt, gepackte Tree-Modelle werden wiederhergestellt
+    """
+    return model.restore() if isinstance(model, SlimTreeModel) else model
+
+
+def _build_skeleton(model: Any) -> Tuple[Any, Dict[str, Any], List[str]]:
+    """
+    Flache Kopie ohne Trainings-Attribute und ohne tree_, plus gepackte Trees
+    """
+    skeleton = copy.copy(model)
+    removed = [name for name in TRAINING_ONLY_ATTRIBUTES if name in vars(skeleton)]
+    for name in removed:
+        delattr(skeleton, name)
+
+    if hasattr(model, 'tree_'):
+        trees = [skeleton]
+    else:
+        estimators = model.estimators_
+        if isinstance(estimators, np.ndarray):
+            copied = np.empty_like(estimators)
+            for idx in np.ndindex(estimators.shape):
+                copied[idx] = copy.copy(estimators[idx])
+            trees = list(copied.flat)
+        else:
+            copied = [copy.copy(est) for est in estimators]
+            trees = copied
+        skeleton.estimators_ = copied
+
+    packed_trees = _pack_trees([est.tree_ for est in trees])
+    for est in trees:
+        del est.tree_
+        # Pro-Tree random_state nur fürs Training relevant
+        if 'random_state' in vars(est):
+            est.random_state = None
+
+    return skeleton, packed_trees, removed
+
+
+def _predictions(model: Any, X: np.ndarray) -> List[np.ndarray]:
+    outputs = [np.asarray(model.predict(X))]
+    if hasattr(model, 'predict_proba'):
+        outputs.append(np.asarray(model.predict_proba(X)))
+    return outputs
+
+
+def _serialize(obj: Any, repeats: int = 3) -> Tuple[bytes, float]:
+    """
+    Serialisierte Bytes und beste Lade-Zeit (inkl. restore)
+    """
+    buffer = io.BytesIO()
+    joblib.dump(obj, buffer)
+    payload = buffer.getvalue()
+
+    load_seconds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        restore_model(joblib.load(io.BytesIO(payload)))
+        load_seconds.append(time.perf_counter() - start)
+
+    return payload, min(load_seconds)
+
+
+def slim_tree_model(model: Any, X_check: Any) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """
+    Tree-Model packen und gegen das Original verifizieren
+
+    Args:
+        model: Gefittetes sklearn Tree-Model (Forest, Gradient Boosting, Decision Tree)
+        X_check: Zeilen für die Verifikation (z.B. Holdout)
+
+    Returns:
+        (SlimTreeModel, Report) oder (Original, None), wenn nicht packbar
+        oder Predictions bzw. Feature Importances nicht identisch sind
+    """
+    if not is_slimmable(model):
+        return model, None
+
+    X = X_check.to_numpy(dtype=np.float64) if hasattr(X_check, 'to_numpy') else np.asarray(X_check, dtype=np.float64)
+
+    skeleton, packed_trees, removed = _build_skeleton(model)
+    slim = SlimTreeModel(skeleton, packed_trees)
+
+    original_bytes, original_load = _serialize(model)
+    slim_bytes, slim_load = _serialize(slim)
+
+    # Verifikation nach Pickle-Roundtrip, wie es die Inference lädt
+    restored = restore_model(joblib.load(io.BytesIO(slim_bytes)))
+    identical = all(
+        np.array_equal(before, after)
+        for before, after in zip(_predictions(model, X), _predictions(restored, X))
+    )
+    if identical and hasattr(model, 'feature_importances_'):
+        identical = np.array_equal(model.feature_importances_, restored.feature_importances_)
+    if not identical:
+        logger.warning(f"Slimming für {type(model).__name__} verworfen: Predictions nicht identisch")
+        return model, None
+
+    report = {
+        'version': SLIM_VERSION,
+        'trees': len(packed_trees['node_counts']),
+        'removed_attributes': removed,
+        'bytes_before': len(original_bytes),
+        'bytes_after': len(slim_bytes),
+        'size_reduction_percent': (1 - len(slim_bytes) / len(original_bytes)) * 100,
+        'load_seconds_before': original_load,
+        'load_seconds_after': slim_load,
+        'verified_rows': int(len(X)),
+        'dtypes': {
+            key: str(packed_trees[key].dtype) for key in ('left', 'feature', 'threshold', 'values')
+        },
+    }
+
+    logger.info(
+        f"Artifact Slimming {type(model).__name__}: {report['bytes_before'] / 1024:.0f} KB -> "
+        f"{report['bytes_after'] / 1024:.0f} KB ({report['size_reduction_percent']:.0f}%), "
+        f"Laden {original_load * 1000:.0f}ms -> {slim_load * 1000:.0f}ms"
+    )
+
+    return slim, report
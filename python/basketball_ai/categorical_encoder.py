@@ -0,0 +1,295 @@
+"""
+Categorical Encoder Plan für Basketball Analytics
+Single-Pass Encoding kategorischer Features mit JSON-persistierbarem Plan
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+import numpy as np
+
+# pandas wird nur für fit/transform auf DataFrames gebraucht, nicht für
+# encode_record/encode_records (Inference aus scripts/ml)
+
+logger = logging.getLogger(__name__)
+
+PLAN_VERSION = 1
+
+
+class CategoricalEncoderPlan:
+    """
+    Gefitteter Encoding-Plan: One-Hot (drop_first) für Low-Cardinality,
+    Frequency Encoding für High-Cardinality Spalten
+    """
+
+    def __init__(
+        self,
+        max_onehot_categories: int = 10,
+        dtype: str = 'float32'
+    ):
+        """
+        Initialize Encoder Plan
+
+        Args:
+            max_onehot_categories: Ab mehr eindeutigen Werten Frequency statt One-Hot
+            dtype: Dtype der Ausgabe-Matrix
+        """
+        self.max_onehot_categories = max_onehot_categories
+        self.dtype = dtype
+
+        self.numeric_columns = []
+        self.columns = []
+        self.feature_names_out = []
+
+    @property
+    def is_fitted(self) -> bool:
+        return bool(self.feature_names_out)
+
+    def fit(self, df: 'pd.DataFrame', exclude: Optional[List[str]] = None) -> 'CategoricalEncoderPlan':
+        """
+        Alle kategorischen Mappings in einem Durchlauf über die Spalten fitten
+
+        Args:
+            df: DataFrame (Missing Values bereits behandelt)
+            exclude: Spalten, die weder encodiert noch übernommen werden (z.B. Target)
+        """
+        import pandas as pd
+
+        exclude = set(exclude or [])
+        self.numeric_columns = []
+        self.columns = []
+
+        for col in df.columns:
+            if col in exclude:
+                continue
+
+            series = df[col]
+
+            if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+                self.numeric_columns.append(col)
+                continue
+
+            if not (isinstance(series.dtype, pd.CategoricalDtype)
+                    or pd.api.types.is_object_dtype(series)
+                    or pd.api.types.is_string_dtype(series)):
+                continue
+
+            counts = series.astype(str).value_counts(normalize=True)
+            # Category-Spalten enthalten evtl. ungenutzte Kategorien
+            counts = counts[counts > 0]
+            # Modus wie in MLTrainer._handle_missing_values, ersetzt fehlende Werte bei der Inference
+            fill_value = str(series.astype(str).mode().iloc[0]) if len(counts) else None
+
+            if len(counts) > self.max_onehot_categories:
+                self.columns.append({
+                    'column': col,
+                    'kind': 'frequency',
+                    'frequencies': {str(value): float(freq) for value, freq in counts.items()},
+                    'fill_value': fill_value,
+                    'output': [f'{col}_freq'],
+                })
+            else:
+                # Wie pd.get_dummies(drop_first=True): sortierte Kategorien, erste entfällt
+                categories = sorted(counts.index.tolist())
+                self.columns.append({
+                    'column': col,
+                    'kind': 'onehot',
+                    'categories': categories,
+                    'fill_value': fill_value,
+                    'output': [f'{col}_{value}' for value in categories[1:]],
+                })
+
+        self.feature_names_out = list(self.numeric_columns)
+        for spec in self.columns:
+            self.feature_names_out.extend(spec['output'])
+
+        logger.info(
+            f"Encoder Plan: {len(self.columns)} kategorische Spalten -> "
+            f"{len(self.feature_names_out) - len(self.numeric_columns)} Features"
+        )
+
+        return self
+
+    def transform(self, df: 'pd.DataFrame', sparse: bool = False) -> Any:
+        """
+        Encodiere einen DataFrame mit einer einzigen Allokation der Ausgabe-Matrix
+
+        Args:
+            df: DataFrame mit den Spalten aus fit()
+            sparse: scipy.sparse CSR-Matrix statt DataFrame zurückgeben
+
+        Returns:
+            DataFrame (Spalten = feature_names_out) oder CSR-Matrix
+        """
+        import pandas as pd
+
+        if sparse:
+            return self._transform_sparse(df)
+
+        n_rows = len(df)
+        out = np.zeros((n_rows, len(self.feature_names_out)), dtype=self.dtype)
+
+        for j, col in enumerate(self.numeric_columns):
+            out[:, j] = df[col].to_numpy(dtype=self.dtype, na_value=np.nan)
+
+        offset = len(self.numeric_columns)
+        rows = np.arange(n_rows)
+
+        for spec in self.columns:
+            codes = self._codes(self._filled(df[spec['column']], spec), self._lookup_values(spec))
+
+            if spec['kind'] == 'frequency':
+                # Unbekannte Werte (Code -1) -> letzter Eintrag 0.0
+                table = np.append(np.fromiter(spec['frequencies'].values(), dtype=self.dtype), 0)
+                out[:, offset] = table[codes]
+            else:
+                # Code 0 ist die gedroppte Referenzkategorie
+                hit = codes > 0
+                out[rows[hit], offset + codes[hit] - 1] = 1
+
+            offset += len(spec['output'])
+
+        return pd.DataFrame(out, columns=self.feature_names_out, index=df.index, copy=False)
+
+    def _transform_sparse(self, df: 'pd.DataFrame') -> Any:
+        """
+        CSR-Variante von transform (One-Hot-Blöcke ohne dichte Zwischenmatrix)
+        """
+        from scipy import sparse as sp
+
+        n_rows = len(df)
+        rows = np.arange(n_rows)
+        blocks = []
+
+        if self.numeric_columns:
+            blocks.append(sp.csr_matrix(df[self.numeric_columns].to_numpy(dtype=self.dtype, na_value=np.nan)))
+
+        for spec in self.columns:
+            codes = self._codes(self._filled(df[spec['column']], spec), self._lookup_values(spec))
+
+            if spec['kind'] == 'frequency':
+                table = np.append(np.fromiter(spec['frequencies'].values(), dtype=self.dtype), 0)
+                blocks.append(sp.csr_matrix(table[codes].reshape(-1, 1)))
+            else:
+                hit = codes > 0
+                blocks.append(sp.csr_matrix(
+                    (np.ones(hit.sum(), dtype=self.dtype), (rows[hit], codes[hit] - 1)),
+                    shape=(n_rows, len(spec['output']))
+                ))
+
+        return sp.hstack(blocks, format='csr')
+
+    @staticmethod
+    def _filled(series: 'pd.Series', spec: Dict[str, Any]) -> 'pd.Series':
+        """
+        Fehlende Werte durch den Trainings-Modus ersetzen (Pläne ohne fill_value: unverändert)
+        """
+        fill_value = spec.get('fill_value')
+        if fill_value is None or not series.isna().any():
+            return series
+        return series.astype(object).where(series.notna(), fill_value)
+
+    @staticmethod
+    def _lookup_values(spec: Dict[str, Any]) -> List[str]:
+        return list(spec['frequencies']) if spec['kind'] == 'frequency' else spec['categories']
+
+    @staticmethod
+    def _codes(series: 'pd.Series', values: List[str]) -> np.ndarray:
+        """
+        Position jedes Werts in values, -1 für unbekannte Werte
+        """
+        import pandas as pd
+
+        index = pd.Index(values)
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Nur die Kategorien nachschlagen, nicht jede Zeile
+            lookup = np.append(index.get_indexer(series.cat.categories.astype(str)), -1)
+            return lookup[series.cat.codes.to_numpy()]
+
+        return index.get_indexer(series.astype(str))
+
+    def encode_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Encodiere einen einzelnen Input-Datensatz ohne pandas
+
+        Kategorische Keys werden durch ihre encodierten Features ersetzt,
+        alle anderen Keys bleiben unverändert. Fehlende Werte werden wie im
+        Training durch den Modus der Spalte ersetzt.
+        """
+        encoded = dict(record)
+
+        for spec in self.columns:
+            value = encoded.pop(spec['column'], None)
+            # value != value: NaN aus pandas-Datensätzen
+            if value is None or value != value:
+                value = spec.get('fill_value')
+            key = None if value is None else str(value)
+
+            if spec['kind'] == 'frequency':
+                encoded[spec['output'][0]] = spec['frequencies'].get(key, 0.0)
+            else:
+                for name, category in zip(spec['output'], spec['categories'][1:]):
+                    encoded[name] = 1.0 if key == category else 0.0
+
+        return encoded
+
+    def encode_records(self, records: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Encodiere mehrere Datensätze direkt in die Matrix (Spalten = feature_names_out)
+        """
+        position = {name: j for j, name in enumerate(self.feature_names_out)}
+        out = np.zeros((len(records), len(self.feature_names_out)), dtype=self.dtype)
+
+        for i, record in enumerate(records):
+            for name, value in self.encode_record(record).items():
+                j = position.get(name)
+                if j is not None and value is not None:
+                    out[i, j] = value
+
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serialisierbare Form des Plans
+        """
+        return {
+            'version': PLAN_VERSION,
+            'max_onehot_categories': self.max_onehot_categories,
+            'dtype': self.dtype,
+            'numeric_columns': [str(col) for col in self.numeric_columns],
+            'columns': self.columns,
+            'feature_names_out': self.feature_names_out,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CategoricalEncoderPlan':
+        """
+        Plan aus to_dict() wiederherstellen
+        """
+        if data.get('version') != PLAN_VERSION:
+            raise ValueError(f"Unbekannte Encoder-Plan Version: {data.get('version')}")
+
+        plan = cls(data['max_onehot_categories'], data['dtype'])
+        plan.numeric_columns = list(data['numeric_columns'])
+        plan.columns = data['columns']
+        plan.feature_names_out = list(data['feature_names_out'])
+
+        return plan
+
+    def save(self, path: Union[str, Path]):
+        """
+        Plan als JSON speichern
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'CategoricalEncoderPlan':
+        """
+        Plan aus JSON laden
+        """
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,197 @@
+"""
+Training Data Loader für Basketball Analytics
+Chunk-weises Laden von CSV-Trainingsdaten mit Dtype-Optimierung
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+logger = logging.getLogger(__name__)
+
+
+class TrainingDataLoader:
+    """
+    Speicherschonender CSV-Loader für Trainingsdaten
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Training Data Loader
+
+        Args:
+            config: Konfiguration (csv_chunk_size, category_max_ratio, float_dtype)
+        """
+        self.chunk_size = config.get('csv_chunk_size', 50000)
+        # String-Spalten mit höchstens diesem Anteil eindeutiger Werte werden category
+        self.category_max_ratio = config.get('category_max_ratio', 0.5)
+        self.float_dtype = config.get('float_dtype', 'float32')
+
+        self.last_report = None
+
+    def load_csv(
+        self,
+        path: Union[str, Path],
+        keep_columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Lade eine CSV-Datei chunk-weise mit verkleinerten Dtypes
+
+        Args:
+            path: Pfad zur CSV-Datei
+            keep_columns: Spalten, die nicht heruntergecastet werden (z.B. Target)
+
+        Returns:
+            DataFrame mit float32, kleinen Integer- und category-Dtypes
+        """
+        logger.info(f"Lade Trainingsdaten chunk-weise: {path}")
+
+        keep_columns = set(keep_columns or [])
+        chunks = []
+        category_columns = None
+        default_bytes = 0
+
+        for chunk in pd.read_csv(path, chunksize=self.chunk_size, low_memory=False):
+            # Speicher, den ein Default-Load (int64/float64/object) belegen würde
+            default_bytes += int(chunk.memory_usage(deep=True).sum())
+
+            # Category-Entscheidung am ersten Chunk, danach für alle Chunks gleich
+            if category_columns is None:
+                category_columns = self._category_columns(chunk, keep_columns)
+
+            chunks.append(self._optimize_chunk(chunk, category_columns, keep_columns))
+            del chunk
+
+        if not chunks:
+            raise ValueError(f"Keine Daten in {path}")
+
+        df = self._combine_chunks(chunks, category_columns)
+        del chunks
+
+        self.last_report = self._memory_report(df, default_bytes)
+        logger.info(
+            f"Trainingsdaten geladen: {len(df)} Zeilen, "
+            f"{self.last_report['memory_default_mb']:.1f} MB -> {self.last_report['memory_optimized_mb']:.1f} MB "
+            f"(-{self.last_report['reduction_percent']:.0f}%)"
+        )
+
+        return df
+
+    def optimize_dtypes(
+        self,
+        df: pd.DataFrame,
+        keep_columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Dtype-Optimierung für einen bereits geladenen DataFrame
+        """
+        keep_columns = set(keep_columns or [])
+        default_bytes = int(df.memory_usage(deep=True).sum())
+
+        optimized = self._optimize_chunk(df, self._category_columns(df, keep_columns), keep_columns)
+        self.last_report = self._memory_report(optimized, default_bytes)
+
+        return optimized
+
+    def _category_columns(self, chunk: pd.DataFrame, keep_columns: set) -> List[str]:
+        """
+        String-Spalten mit niedriger Kardinalität
+        """
+        columns = []
+
+        for col in chunk.select_dtypes(include=['object', 'string']).columns:
+            if col in keep_columns:
+                continue
+            if chunk[col].nunique(dropna=True) <= max(1, self.category_max_ratio * len(chunk)):
+                columns.append(col)
+
+        return columns
+
+    def _optimize_chunk(
+        self,
+        chunk: pd.DataFrame,
+        category_columns: List[str],
+        keep_columns: set
+    ) -> pd.DataFrame:
+        """
+        Numerische Spalten herunterbrechen, Strings in category umwandeln
+        """
+        converted = {}
+
+        for col in chunk.columns:
+            series = chunk[col]
+
+            if col in keep_columns:
+                converted[col] = series
+            elif col in category_columns:
+                converted[col] = series.astype('category')
+            elif pd.api.types.is_bool_dtype(series):
+                converted[col] = series
+            elif pd.api.types.is_integer_dtype(series):
+                converted[col] = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_float_dtype(series):
+                converted[col] = series.astype(self.float_dtype)
+            else:
+                converted[col] = series
+
+        return pd.DataFrame(converted, index=chunk.index)
+
+    def _combine_chunks(self, chunks: List[pd.DataFrame], category_columns: List[str]) -> pd.DataFrame:
+        """
+        Chunks zusammenführen, Kategorien über alle Chunks vereinigen
+
+        pd.concat würde category-Spalten mit unterschiedlichen Kategorien
+        zurück in object umwandeln.
+        """
+        if len(chunks) == 1:
+            return chunks[0]
+
+        categoricals = {
+            col: union_categoricals(self._common_categories([chunk[col] for chunk in chunks]), sort_categories=True)
+            for col in category_columns
+        }
+
+        df = pd.concat(
+            [chunk.drop(columns=category_columns) for chunk in chunks],
+            ignore_index=True
+        )
+
+        for col in category_columns:
+            df[col] = pd.Categorical(categoricals[col])
+
+        # Ursprüngliche Spaltenreihenfolge
+        return df[chunks[0].columns]
+
+    @staticmethod
+    def _common_categories(parts: List[pd.Series]) -> List[pd.Series]:
+        """
+        Kategorien aller Chunks auf einen Dtype bringen
+
+        Ein Chunk ohne Werte in der Spalte wird als float64 gelesen, ein Chunk
+        mit nur Ziffern als int; union_categoricals verlangt gleiche Dtypes.
+        """
+        if len({str(part.cat.categories.dtype) for part in parts}) == 1:
+            return parts
+
+        return [
+            part.cat.rename_categories(pd.Index(part.cat.categories.astype(str), dtype=object))
+            for part in parts
+        ]
+
+    def _memory_report(self, df: pd.DataFrame, default_bytes: int) -> Dict[str, Any]:
+        """
+        Speicher vor/nach der Optimierung
+        """
+        optimized_bytes = int(df.memory_usage(deep=True).sum())
+
+        return {
+            'rows': len(df),
+            'columns': df.shape[1],
+            'memory_default_mb': default_bytes / 1024 ** 2,
+            'memory_optimized_mb': optimized_bytes / 1024 ** 2,
+            'reduction_percent': 100 * (1 - optimized_bytes / default_bytes) if default_bytes else 0.0,
+            'dtypes': df.dtypes.astype(str).value_counts().to_dict(),
+        }
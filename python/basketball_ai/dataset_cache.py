@@ -0,0 +1,227 @@
+"""
+Preprocessed Dataset Cache für Basketball Analytics
+Content-adressierter Disk-Cache für vorverarbeitete Feature-Matrizen und Feature-Auswahl
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+logger = logging.getLogger(__name__)
+
+# Module, deren Code das Preprocessing-Ergebnis bestimmt
+PIPELINE_MODULES = [
+    'ml_trainer.py', 'feature_selector.py', 'fold_cache.py', 'dataset_cache.py', 'categorical_encoder.py',
+    'feature_registry.py'
+]
+
+# Config-Keys, die Preprocessing und Feature Selection lesen
+PIPELINE_CONFIG_KEYS = (
+    'max_onehot_categories', 'encoded_dtype',  # _encode_categorical_features
+    'engineered_features',  # _engineer_features
+    'random_state',  # CV-Splits der Feature Selection (FoldCache)
+)
+
+TARGET_COLUMN = '__target__'
+
+
+class PreprocessedDatasetCache:
+    """
+    Disk-Cache für das Ergebnis von Preprocessing und Feature Selection
+
+    Key = Hash aus Input-Daten, Target, pipeline-relevanter Config und
+    Code-Version (Quelltext der Pipeline-Module, pandas/sklearn Version).
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Dataset Cache
+
+        Args:
+            config: Konfiguration (dataset_cache_enabled, dataset_cache_dir, dataset_cache_max_entries)
+        """
+        self.enabled = config.get('dataset_cache_enabled', True)
+        self.cache_dir = Path(config.get(
+            'dataset_cache_dir',
+            Path(config.get('models_dir', 'models')) / 'dataset_cache'
+        ))
+        self.max_entries = config.get('dataset_cache_max_entries', 20)
+
+        self.config_fingerprint = self._config_fingerprint(config)
+        self.code_version = self._code_version()
+
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, data: pd.DataFrame, target_column: str, use_auto_features: bool) -> str:
+        """
+        Content-Key für einen Trainings-Input
+        """
+        digest = hashlib.sha256()
+        digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in data.dtypes.items()]).encode())
+        digest.update(json.dumps({
+            'target_column': target_column,
+            'use_auto_features': use_auto_features,
+            'config': self.config_fingerprint,
+            'code': self.code_version,
+        }, sort_keys=True).encode())
+
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[Tuple[pd.DataFrame, Any, Optional[List[str]], Dict[str, Any]]]:
+        """
+        Lade einen gecachten Datensatz
+
+        Returns:
+            (X, y, selected_features, artifacts) oder None
+        """
+        entry_dir = self.cache_dir / key
+        meta_path = entry_dir / 'meta.json'
+
+        if not meta_path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+
+            if meta['format'] == 'parquet':
+                df = pd.read_parquet(entry_dir / 'features.parquet')
+            else:
+                arrays = np.load(entry_dir / 'features.npz', allow_pickle=False)
+                df = pd.DataFrame(
+                    {col: arrays[f'col_{i}'] for i, col in enumerate(meta['columns'])},
+                    index=arrays['index']
+                )
+                df[TARGET_COLUMN] = arrays['y']
+        except Exception as e:
+            logger.warning(f"Dataset Cache Eintrag {key[:12]} unlesbar, wird neu berechnet: {e}")
+            self.misses += 1
+            return None
+
+        y = df.pop(TARGET_COLUMN)
+        y = y.to_numpy() if meta['target_is_array'] else y.rename(meta['target_name'])
+
+        # LRU über mtime
+        os.utime(meta_path)
+        self.hits += 1
+        logger.info(f"Dataset Cache Hit {key[:12]}: {df.shape[1]} Features, {df.shape[0]} Samples")
+
+        return df, y, meta['selected_features'], meta.get('artifacts', {})
+
+    def save(
+        self,
+        key: str,
+        X: pd.DataFrame,
+        y: Any,
+        selected_features: Optional[List[str]] = None,
+        artifacts: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Speichere Feature-Matrix, Target und Feature-Auswahl atomar
+
+        Args:
+            artifacts: JSON-serialisierbare Preprocessing-Artefakte (z.B. Encoder Plan)
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_dir = Path(tempfile.mkdtemp(prefix=f".{key[:12]}_", dir=self.cache_dir))
+
+        try:
+            df = X.copy()
+            df[TARGET_COLUMN] = np.asarray(y)
+
+            try:
+                df.to_parquet(tmp_dir / 'features.parquet')
+                storage_format = 'parquet'
+            except ImportError:
+                # Ohne pyarrow/fastparquet: NPZ, eine Array pro Spalte (Dtypes bleiben erhalten)
+                np.savez(
+                    tmp_dir / 'features.npz',
+                    y=np.asarray(y),
+                    index=X.index.to_numpy(),
+                    **{f'col_{i}': X.iloc[:, i].to_numpy() for i in range(X.shape[1])}
+                )
+                storage_format = 'npz'
+
+            meta = {
+                'format': storage_format,
+                'columns': [str(col) for col in X.columns],
+                'selected_features': selected_features,
+                'artifacts': artifacts or {},
+                'target_name': getattr(y, 'name', None),
+                'target_is_array': not isinstance(y, pd.Series),
+                'code_version': self.code_version,
+                'created_at': datetime.now().isoformat(),
+            }
+            with open(tmp_dir / 'meta.json', 'w') as f:
+                json.dump(meta, f, indent=2)
+
+            entry_dir = self.cache_dir / key
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except Exception as e:
+            logger.warning(f"Dataset Cache konnte nicht geschrieben werden: {e}")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+
+        logger.info(f"Dataset Cache gespeichert {key[:12]} ({storage_format})")
+        self._evict()
+
+    def _evict(self):
+        """
+        Älteste Einträge über max_entries entfernen
+        """
+        entries = sorted(
+            (path for path in self.cache_dir.iterdir() if (path / 'meta.json').exists()),
+            key=lambda path: (path / 'meta.json').stat().st_mtime
+        )
+
+        for path in entries[:max(0, len(entries) - self.max_entries)]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _config_fingerprint(self, config: Dict[str, Any]) -> str:
+        """
+        Hash der pipeline-relevanten Config
+        """
+        relevant = {key: config[key] for key in PIPELINE_CONFIG_KEYS if key in config}
+        return hashlib.sha256(json.dumps(relevant, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _code_version(self) -> str:
+        """
+        Hash des Pipeline-Quelltexts und der Library-Versionen
+        """
+        digest = hashlib.sha256()
+        module_dir = Path(__file__).resolve().parent
+
+        for module in PIPELINE_MODULES:
+            path = module_dir / module
+            if path.exists():
+                digest.update(path.read_bytes())
+
+        digest.update(f"pandas={pd.__version__};sklearn={sklearn.__version__}".encode())
+
+        return digest.hexdigest()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Cache-Statistiken
+        """
+        return {
+            'enabled': self.enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'code_version': self.code_version[:12],
+        }
@@ -0,0 +1,241 @@
+"""
+Feature Registry für Basketball Analytics
+Eine deklarative Definition pro Feature, gemeinsam für Training und Inference
+"""
+
+import logging
+from typing import Dict, List, Tuple, Any, Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Alternative Spaltennamen der Inputs (z.B. 'minutes' aus den PHP-Services)
+COLUMN_ALIASES = {
+    'minutes_played': ('minutes',),
+}
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """
+    Quote, 0 bei Nenner <= 0
+    """
+    out = np.zeros(len(numerator), dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _per_minute(value: np.ndarray, minutes: np.ndarray) -> np.ndarray:
+    return value / np.maximum(minutes, 1)
+
+
+class FeatureDefinition:
+    """
+    Ein Feature: Inputs und vektorisierte Formel über numpy-Arrays
+    """
+
+    def __init__(
+        self,
+        name: str,
+        inputs: Tuple[str, ...],
+        formula: Callable[..., np.ndarray],
+        defaults: Optional[Dict[str, float]] = None,
+        model_types: Optional[Tuple[str, ...]] = None
+    ):
+        self.name = name
+        self.inputs = inputs
+        self.formula = formula
+        # Optionale Inputs mit Ersatzwert, wenn die Spalte fehlt
+        self.defaults = defaults or {}
+        # Nur für diese Model-Typen im Default-Plan der Inference
+        self.model_types = model_types
+
+
+class FeaturePlan:
+    """
+    Ausführungsplan: aufgelöste Inputs und Reihenfolge der zu berechnenden Features
+
+    Inputs werden einmal als float64 gelesen (fehlende Werte = 0), alle
+    Features in einem Durchlauf in eine vorab allozierte Matrix geschrieben.
+    """
+
+    def __init__(self, features: List[FeatureDefinition], sources: List[List[Optional[str]]]):
+        self.features = features
+        self.sources = sources
+        self.names = [feature.name for feature in features]
+        self.input_columns = list(dict.fromkeys(
+            column for columns in sources for column in columns if column is not None
+        ))
+
+    def compute(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Feature-Matrix (Zeilen x geplante Features)
+        """
+        inputs = {
+            column: np.nan_to_num(pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64), nan=0.0)
+            for column in self.input_columns
+        }
+
+        matrix = np.empty((len(df), len(self.features)), dtype=np.float64)
+        for j, (feature, columns) in enumerate(zip(self.features, self.sources)):
+            arguments = [
+                inputs[column] if column is not None else np.full(len(df), feature.defaults[name], dtype=np.float64)
+                for name, column in zip(feature.inputs, columns)
+            ]
+            matrix[:, j] = feature.formula(*arguments)
+
+        return matrix
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Geplante Features in df schreiben (in-place, bestehende Spalten werden ersetzt)
+        """
+        if self.features:
+            df[self.names] = self.compute(df)
+        return df
+
+
+class FeatureRegistry:
+    """
+    Alle Basketball-Features mit Inputs und Formel an einer Stelle
+    """
+
+    def __init__(self):
+        self._features = {}
+        self._plans = {}
+
+    def register(
+        self,
+        name: str,
+        inputs: Tuple[str, ...],
+        formula: Callable[..., np.ndarray],
+        defaults: Optional[Dict[str, float]] = None,
+        model_types: Optional[Tuple[str, ...]] = None
+    ):
+        self._features[name] = FeatureDefinition(name, tuple(inputs), formula, defaults, model_types)
+        self._plans.clear()
+
+    def names(self) -> List[str]:
+        return list(self._features)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._features
+
+    def plan(
+        self,
+        features: Optional[Iterable[str]],
+        columns: Iterable[str],
+        model_type: Optional[str] = None
+    ) -> FeaturePlan:
+        """
+        Plan für die angeforderten Features, die aus den vorhandenen Spalten berechenbar sind
+
+        Args:
+            features: Benötigte Feature-Namen (z.B. feature_names eines Models);
+                Namen ohne Registry-Eintrag (Rohspalten) werden ignoriert. None = alle.
+            columns: Vorhandene Spalten
+            model_type: Lässt Features weg, deren model_types ihn nicht enthalten
+
+        Returns:
+            FeaturePlan (gecacht pro Anfrage und Spaltenmenge)
+        """
+        columns = tuple(columns)
+        requested = tuple(features) if features is not None else None
+        cache_key = (requested, columns, model_type)
+        if cache_key in self._plans:
+            return self._plans[cache_key]
+
+        available = set(columns)
+        planned, sources = [], []
+
+        for name in requested if requested is not None else self._features:
+            feature = self._features.get(name)
+            if feature is None:
+                continue
+            if model_type is not None and feature.model_types and model_type not in feature.model_types:
+                continue
+
+            resolved = [self._resolve(column, available) for column in feature.inputs]
+            if any(source is None and column not in feature.defaults for source, column in zip(resolved, feature.inputs)):
+                continue
+
+            planned.append(feature)
+            sources.append(resolved)
+
+        plan = FeaturePlan(planned, sources)
+        self._plans[cache_key] = plan
+        return plan
+
+    @staticmethod
+    def _resolve(column: str, available: set) -> Optional[str]:
+        for candidate in (column,) + COLUMN_ALIASES.get(column, ()):
+            if candidate in available:
+                return candidate
+        return None
+
+
+FEATURE_REGISTRY = FeatureRegistry()
+
+# Shooting
+FEATURE_REGISTRY.register('shooting_percentage', ('shots_made', 'shots_attempted'), _safe_divide)
+FEATURE_REGISTRY.register('fg_percentage', ('field_goals_made', 'field_goals_attempted'), _safe_divide)
+FEATURE_REGISTRY.register('three_point_percentage', ('three_pointers_made', 'three_pointers_attempted'), _safe_divide)
+FEATURE_REGISTRY.register('free_throw_percentage', ('free_throws_made', 'free_throws_attempted'), _safe_divide)
+FEATURE_REGISTRY.register(
+    'effective_fg_percentage', ('field_goals_made', 'three_pointers_made', 'field_goals_attempted'),
+    lambda fgm, tpm, fga: _safe_divide(fgm + 0.5 * tpm, fga)
+)
+FEATURE_REGISTRY.register('shooting_efficiency', ('points', 'field_goals_attempted'), _safe_divide)
+
+# Effizienz
+FEATURE_REGISTRY.register('points_per_minute', ('points', 'minutes_played'), _safe_divide)
+FEATURE_REGISTRY.register(
+    'efficiency', ('rebounds', 'assists', 'turnovers'),
+    lambda reb, ast, tov: (reb + ast) / np.maximum(tov, 1)
+)
+FEATURE_REGISTRY.register(
+    'efficiency_rating', ('points', 'rebounds', 'assists', 'steals', 'blocks', 'minutes_played'),
+    lambda pts, reb, ast, stl, blk, minutes: _per_minute(pts + reb + ast + stl + blk, minutes),
+    defaults={'minutes_played': 1.0}
+)
+for _name in ('assist_turnover_ratio', 'assist_to_turnover_ratio'):
+    FEATURE_REGISTRY.register(_name, ('assists', 'turnovers'), lambda ast, tov: ast / np.maximum(tov, 1))
+del _name
+FEATURE_REGISTRY.register('rebounds_per_minute', ('rebounds', 'minutes_played'), _per_minute)
+FEATURE_REGISTRY.register('usage_rate', ('field_goals_attempted', 'team_field_goals_attempted'), _safe_divide)
+
+# Defense
+FEATURE_REGISTRY.register('defensive_actions', ('steals', 'blocks'), lambda stl, blk: stl + blk)
+FEATURE_REGISTRY.register('steals_per_minute', ('steals', 'minutes_played'), _per_minute)
+FEATURE_REGISTRY.register('blocks_per_minute', ('blocks', 'minutes_played'), _per_minute)
+
+# Belastung (Injury Risk)
+FEATURE_REGISTRY.register(
+    'avg_minutes_per_game', ('minutes_last_7_days', 'games_last_7_days'), _safe_divide,
+    model_types=('injury_risk',)
+)
+FEATURE_REGISTRY.register(
+    'age_experience_interaction', ('age', 'experience_years'), lambda age, years: age * years,
+    model_types=('injury_risk',)
+)
+
+# Spielkontext (Game Outcome)
+FEATURE_REGISTRY.register(
+    'home_win_percentage', ('home_wins', 'home_losses'), lambda wins, losses: _safe_divide(wins, wins + losses),
+    model_types=('game_outcome',)
+)
+FEATURE_REGISTRY.register(
+    'away_win_percentage', ('away_wins', 'away_losses'), lambda wins, losses: _safe_divide(wins, wins + losses),
+    model_types=('game_outcome',)
+)
+
+# Standard-Sets der Pipeline-Stufen
+TRAINER_FEATURES = ('shooting_percentage', 'points_per_minute', 'defensive_actions', 'efficiency')
+INFERENCE_FEATURES = (
+    'shooting_efficiency', 'assist_to_turnover_ratio', 'points_per_minute', 'usage_rate', 'defensive_actions',
+    'avg_minutes_per_game', 'age_experience_interaction', 'home_win_percentage', 'away_win_percentage',
+)
+SHOOTING_FEATURES = ('fg_percentage', 'three_point_percentage', 'free_throw_percentage', 'effective_fg_percentage')
+EFFICIENCY_FEATURES = ('efficiency_rating', 'assist_turnover_ratio', 'rebounds_per_minute')
+DEFENSIVE_FEATURES = ('defensive_actions', 'steals_per_minute', 'blocks_per_minute')
@@ -16,6 +16,8 @@ from sklearn.linear_model import LassoCV, ElasticNetCV
 from sklearn.preprocessing import StandardScaler
 from scipy import stats
 import warnings
+from fold_cache import FoldCache
+from feature_registry import FEATURE_REGISTRY, SHOOTING_FEATURES, EFFICIENCY_FEATURES, DEFENSIVE_FEATURES
 warnings.filterwarnings('ignore')
 
 logger = logging.getLogger(__name__)
@@ -25,14 +27,16 @@ class FeatureSelector:
     Automatische Feature Selection für Basketball-ML-Models
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], fold_cache: Optional[FoldCache] = None):
         """
         Initialize Feature Selector
         
         Args:
             config: Konfiguration für Feature Selection
+            fold_cache: Geteilter Fold Cache (z.B. vom MLTrainer)
         """
         self.config = config
+        self.fold_cache = fold_cache or FoldCache(config)
         self.selection_methods = {
             'statistical': self._statistical_selection,
             'recursive': self._recursive_selection,
@@ -216,8 +220,13 @@ class FeatureSelector:
         if k_features:
             selector = RFE(estimator=estimator, n_features_to_select=k_features)
         else:
-            # Cross-Validation RFE
-            selector = RFECV(estimator=estimator, cv=3, min_features_to_select=1)
+            # Cross-Validation RFE (Splits wie cv=3, aber aus dem Fold Cache)
+            folds = self.fold_cache.get(
+                X, y, 3,
+                stratified=problem_type != 'regression',
+                shuffle=False
+            ).folds
+            selector = RFECV(estimator=estimator, cv=folds, min_features_to_select=1)
         
         selector.fit(X, y)
         selected_features = X.columns[selector.support_].tolist()
@@ -465,100 +474,37 @@ class FeatureSelector:
 class BasketballFeatureEngineer:
     """
     Basketball-spezifische Feature Engineering Methoden
+    
+    Formeln kommen aus der Feature Registry (wie Trainer und predict.py).
+    Die create_* Methoden ergänzen die Spalten direkt in df, ohne Kopie.
     """
     
     def __init__(self):
         pass
     
+    def create_features(self, df: pd.DataFrame, features: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Beliebige Registry-Features in einem Durchlauf (None = alle berechenbaren)
+        """
+        return FEATURE_REGISTRY.plan(features, df.columns).apply(df)
+    
     def create_shooting_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Erstelle Shooting-bezogene Features
         """
-        df = df.copy()
-        
-        # Shooting Percentages
-        if 'field_goals_made' in df.columns and 'field_goals_attempted' in df.columns:
-            df['fg_percentage'] = np.where(
-                df['field_goals_attempted'] > 0,
-                df['field_goals_made'] / df['field_goals_attempted'],
-                0
-            )
-        
-        # Three-Point Shooting
-        if 'three_pointers_made' in df.columns and 'three_pointers_attempted' in df.columns:
-            df['three_point_percentage'] = np.where(
-                df['three_pointers_attempted'] > 0,
-                df['three_pointers_made'] / df['three_pointers_attempted'],
-                0
-            )
-        
-        # Free Throw Shooting
-        if 'free_throws_made' in df.columns and 'free_throws_attempted' in df.columns:
-            df['free_throw_percentage'] = np.where(
-                df['free_throws_attempted'] > 0,
-                df['free_throws_made'] / df['free_throws_attempted'],
-                0
-            )
-        
-        # Effective Field Goal Percentage
-        if all(col in df.columns for col in ['field_goals_made', 'three_pointers_made', 'field_goals_attempted']):
-            df['effective_fg_percentage'] = np.where(
-                df['field_goals_attempted'] > 0,
-                (df['field_goals_made'] + 0.5 * df['three_pointers_made']) / df['field_goals_attempted'],
-                0
-            )
-        
-        return df
+        return self.create_features(df, SHOOTING_FEATURES)
     
     def create_efficiency_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Erstelle Effizienz-Features
         """
-        df = df.copy()
-        
-        # Player Efficiency Rating (vereinfacht)
-        if all(col in df.columns for col in ['points', 'rebounds', 'assists', 'steals', 'blocks']):
-            df['efficiency_rating'] = (
-                df['points'] + df['rebounds'] + df['assists'] + 
-                df['steals'] + df['blocks']
-            ) / np.maximum(df.get('minutes_played', 1), 1)
-        
-        # Assist to Turnover Ratio
-        if 'assists' in df.columns and 'turnovers' in df.columns:
-            df['assist_turnover_ratio'] = np.where(
-                df['turnovers'] > 0,
-                df['assists'] / df['turnovers'],
-                df['assists']
-            )
-        
-        # Rebound Rate
-        if all(col in df.columns for col in ['rebounds', 'minutes_played']):
-            df['rebounds_per_minute'] = df['rebounds'] / np.maximum(df['minutes_played'], 1)
-        
-        return df
+        return self.create_features(df, EFFICIENCY_FEATURES)
     
     def create_defensive_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Erstelle Defensive Features
         """
-        df = df.copy()
-        
-        # Defensive Actions
-        defensive_cols = ['steals', 'blocks', 'defensive_rebounds']
-        available_cols = [col for col in defensive_cols if col in df.columns]
-        
-        if available_cols:
-            df['defensive_actions'] = df[available_cols].sum(axis=1)
-        
-        # Steal Rate
-        if 'steals' in df.columns and 'minutes_played' in df.columns:
-            df['steals_per_minute'] = df['steals'] / np.maximum(df['minutes_played'], 1)
-        
-        # Block Rate
-        if 'blocks' in df.columns and 'minutes_played' in df.columns:
-            df['blocks_per_minute'] = df['blocks'] / np.maximum(df['minutes_played'], 1)
-        
-        return df
+        return self.create_features(df, DEFENSIVE_FEATURES)
 
 if __name__ == "__main__":
     # Beispiel-Usage
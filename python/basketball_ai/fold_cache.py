@@ -0,0 +1,233 @@
+"""
+Fold Cache für Cross-Validation in Basketball Analytics
+Gemeinsame CV-Splits und Fold-Matrizen für Trainer, Optimizer und Feature Selector
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import KFold, StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+# Model-Typen, die auf der standard-skalierten Matrix trainiert werden
+SCALED_MODEL_TYPES = ('svc', 'logistic_regression', 'svr', 'ridge')
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """
+    Zero-Copy View, die nicht versehentlich überschrieben werden kann
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def fit_and_score_fold(
+    model: Any,
+    fold: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    scoring: str
+) -> Tuple[float, float]:
+    """
+    Trainiere und bewerte einen CV-Fold (läuft auch im Worker-Prozess)
+
+    Args:
+        model: Unfittetes Model (wird in-place trainiert)
+        fold: (X_train, y_train, X_val, y_val)
+        scoring: Sklearn Scoring-Name
+
+    Returns:
+        Score und Wall-Clock-Dauer in Sekunden
+    """
+    X_tr, y_tr, X_val, y_val = fold
+    start = time.perf_counter()
+
+    try:
+        model.fit(X_tr, y_tr)
+        score = get_scorer(scoring)(model, X_val, y_val)
+    except Exception as e:
+        # Wie cross_val_score mit error_score=np.nan
+        logger.warning(f"Fold fehlgeschlagen für {type(model).__name__}: {e}")
+        score = np.nan
+
+    return float(score), time.perf_counter() - start
+
+
+class FoldSet:
+    """
+    CV-Splits eines Datasets mit einmalig materialisierten Fold-Matrizen
+    """
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        folds: List[Tuple[np.ndarray, np.ndarray]],
+        stratified: bool = True
+    ):
+        self.X = X
+        self.y = y
+        self.folds = folds
+        self.stratified = stratified
+        self._X_scaled = None
+        self._fold_matrices = {}
+
+    @property
+    def n_splits(self) -> int:
+        return len(self.folds)
+
+    @property
+    def X_scaled(self) -> np.ndarray:
+        """
+        Standard-skalierte Kopie (Scaler auf dem gesamten Dataset, wie bisher im Trainer)
+        """
+        if self._X_scaled is None:
+            self._X_scaled = np.ascontiguousarray(StandardScaler().fit_transform(self.X))
+        return _read_only(self._X_scaled)
+
+    def fold(self, fold_no: int, scaled: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Zusammenhängende Trainings-/Validierungs-Matrizen eines Folds
+
+        Beim ersten Zugriff einmal kopiert, danach nur noch Views.
+
+        Returns:
+            (X_train, y_train, X_val, y_val)
+        """
+        key = (fold_no, scaled)
+
+        if key not in self._fold_matrices:
+            X = self.X_scaled if scaled else self.X
+            train_idx, val_idx = self.folds[fold_no]
+            self._fold_matrices[key] = (
+                np.ascontiguousarray(X[train_idx]),
+                np.ascontiguousarray(self.y[train_idx]),
+                np.ascontiguousarray(X[val_idx]),
+                np.ascontiguousarray(self.y[val_idx]),
+            )
+
+        return tuple(_read_only(array) for array in self._fold_matrices[key])
+
+    def nbytes(self) -> int:
+        """
+        Speicherbedarf aller materialisierten Matrizen
+        """
+        total = self.X.nbytes + self.y.nbytes
+        if self._X_scaled is not None:
+            total += self._X_scaled.nbytes
+        for matrices in self._fold_matrices.values():
+            total += sum(array.nbytes for array in matrices)
+        return total
+
+
+class FoldCache:
+    """
+    Cache für CV-Splits und Fold-Matrizen, geteilt über Trainer, Optimizer und Feature Selector
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Fold Cache
+
+        Args:
+            config: Konfiguration (random_state, fold_cache_max_entries)
+        """
+        self.random_state = config.get('random_state', 42)
+        self.max_entries = config.get('fold_cache_max_entries', 8)
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(X: Any, y: Any) -> str:
+        """
+        Inhalts-Hash von Features und Target
+        """
+        digest = hashlib.sha1()
+
+        if isinstance(X, pd.DataFrame):
+            digest.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+            digest.update(','.join(map(str, X.columns)).encode())
+        else:
+            digest.update(np.ascontiguousarray(X).tobytes())
+            digest.update(str(np.shape(X)).encode())
+
+        # Über Werte statt Speicherbytes hashen (bei str/object-Labels wären das Pointer)
+        digest.update(pd.util.hash_pandas_object(pd.Series(np.ravel(y)), index=False).values.tobytes())
+        digest.update(str(np.shape(y)).encode())
+
+        return digest.hexdigest()
+
+    def get(
+        self,
+        X: Any,
+        y: Any,
+        n_splits: int,
+        stratified: bool = True,
+        shuffle: bool = True
+    ) -> FoldSet:
+        """
+        Hole (oder berechne) die Folds für ein Dataset
+
+        Args:
+            X: Feature Matrix
+            y: Target
+            n_splits: Anzahl Folds
+            stratified: StratifiedKFold (Klassifikation) statt KFold
+            shuffle: Shuffle mit random_state (False = sklearn cv=int Verhalten)
+
+        Returns:
+            FoldSet mit Splits und Fold-Matrizen
+        """
+        key = (self.fingerprint(X, y), n_splits, stratified, shuffle, self.random_state)
+
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+
+        X_values = np.ascontiguousarray(X.to_numpy(dtype=np.float64) if hasattr(X, 'to_numpy') else np.asarray(X, dtype=np.float64))
+        y_values = np.ascontiguousarray(np.asarray(y))
+
+        splitter_class = StratifiedKFold if stratified else KFold
+        if shuffle:
+            splitter = splitter_class(n_splits=n_splits, shuffle=True, random_state=self.random_state)
+        else:
+            splitter = splitter_class(n_splits=n_splits)
+
+        folds = list(splitter.split(X_values, y_values))
+        fold_set = FoldSet(X_values, y_values, folds, stratified)
+
+        self._entries[key] = fold_set
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        logger.info(f"Fold Cache: {n_splits} Folds für {X_values.shape[0]} Samples berechnet")
+
+        return fold_set
+
+    def clear(self):
+        """
+        Leere den Cache
+        """
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Cache-Statistiken
+        """
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'memory_bytes': sum(fold_set.nbytes() for fold_set in self._entries.values()),
+        }
@@ -0,0 +1,411 @@
+"""
+Group Training für Basketball Analytics
+Tausende kleine Modelle (pro Team/Spieler) mit geteiltem Tuning und einem indizierten Artefakt-Store
+"""
+
+import io
+import json
+import logging
+import multiprocessing
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional
+
+import joblib
+import numpy as np
+from sklearn.ensemble import (
+    RandomForestClassifier, RandomForestRegressor,
+    HistGradientBoostingClassifier, HistGradientBoostingRegressor
+)
+from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import KFold, StratifiedKFold, train_test_split
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from artifact_slimming import restore_model
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+
+# Pro Familie: Klassifikator, Regressor und kleines Suchgitter
+GROUP_MODEL_FAMILIES = {
+    'linear': {
+        'classification': lambda params: Pipeline([
+            ('scaler', StandardScaler()),
+            ('model', LogisticRegression(max_iter=1000, **params))
+        ]),
+        'regression': lambda params: Pipeline([('scaler', StandardScaler()), ('model', Ridge(**params))]),
+        'grid': {
+            'classification': [{'C': 0.1}, {'C': 1.0}, {'C': 10.0}],
+            'regression': [{'alpha': 0.1}, {'alpha': 1.0}, {'alpha': 10.0}],
+        },
+    },
+    'random_forest': {
+        'classification': lambda params: RandomForestClassifier(n_estimators=50, random_state=42, **params),
+        'regression': lambda params: RandomForestRegressor(n_estimators=50, random_state=42, **params),
+        'grid': [
+            {'max_depth': 3},
+            {'max_depth': 6, 'min_samples_leaf': 3},
+            {'max_depth': None, 'min_samples_leaf': 5},
+        ],
+    },
+    'hist_gradient_boosting': {
+        'classification': lambda params: HistGradientBoostingClassifier(max_iter=50, random_state=42, **params),
+        'regression': lambda params: HistGradientBoostingRegressor(max_iter=50, random_state=42, **params),
+        'grid': [
+            {'max_depth': 3, 'learning_rate': 0.1},
+            {'max_depth': 5, 'learning_rate': 0.05, 'min_samples_leaf': 10},
+        ],
+    },
+}
+
+# Threadpool-Limit des Worker-Prozesses (muss referenziert bleiben)
+_worker_limits = None
+
+
+def _family_grid(family: str, task: str) -> List[Dict[str, Any]]:
+    grid = GROUP_MODEL_FAMILIES[family]['grid']
+    return grid[task] if isinstance(grid, dict) else grid
+
+
+def build_group_model(family: str, task: str, params: Dict[str, Any]) -> Any:
+    """
+    Unfittetes Model einer Familie mit den getunten Parametern
+    """
+    if family not in GROUP_MODEL_FAMILIES:
+        raise ValueError(f"Unbekannte Model-Familie: {family}")
+    return GROUP_MODEL_FAMILIES[family][task](dict(params))
+
+
+def group_slices(groups: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List[Tuple[Any, int, int]]]:
+    """
+    Einmal nach Gruppe sortieren statt pro Gruppe zu filtern
+
+    Returns:
+        (Sortier-Reihenfolge, sortierte Keys, Liste (Key, Start, Ende) im sortierten Array)
+    """
+    order = np.argsort(groups, kind='stable')
+    sorted_groups = groups[order]
+    keys, starts = np.unique(sorted_groups, return_index=True)
+    ends = np.append(starts[1:], len(sorted_groups))
+    return order, sorted_groups, [(key, int(start), int(end)) for key, start, end in zip(keys, starts, ends)]
+
+
+def _init_worker(threads: int):
+    """
+    BLAS/OpenMP im Worker auf das Thread-Budget begrenzen
+    """
+    global _worker_limits
+    from threadpoolctl import threadpool_limits
+    _worker_limits = threadpool_limits(limits=threads)
+
+
+def _cv_score(model_factory, X: np.ndarray, y: np.ndarray, task: str, scoring: str, n_folds: int) -> float:
+    """
+    Mittlerer CV-Score eines kleinen Gruppen-Datasets (NaN, wenn nicht bewertbar)
+    """
+    if task == 'classification':
+        min_class = np.unique(y, return_counts=True)[1].min()
+        if len(np.unique(y)) < 2 or min_class < n_folds:
+            return np.nan
+        splitter = StratifiedKFold(n_splits=n_folds, shuffle=True, random_state=42)
+    else:
+        splitter = KFold(n_splits=n_folds, shuffle=True, random_state=42)
+
+    scorer = get_scorer(scoring)
+    scores = []
+    for train_idx, val_idx in splitter.split(X, y):
+        try:
+            model = model_factory().fit(X[train_idx], y[train_idx])
+            scores.append(scorer(model, X[val_idx], y[val_idx]))
+        except Exception:
+            scores.append(np.nan)
+    return float(np.nanmean(scores)) if not np.all(np.isnan(scores)) else np.nan
+
+
+def _tune_candidate(
+    family: str,
+    params: Dict[str, Any],
+    task: str,
+    scoring: str,
+    n_folds: int,
+    datasets: List[Tuple[np.ndarray, np.ndarray]]
+) -> Dict[str, Any]:
+    """
+    Eine Parameter-Kombination über alle Tuning-Gruppen bewerten (Worker)
+    """
+    start = time.perf_counter()
+    scores = [
+        _cv_score(lambda: build_group_model(family, task, params), X, y, task, scoring, n_folds)
+        for X, y in datasets
+    ]
+    valid = [score for score in scores if not np.isnan(score)]
+    return {
+        'family': family,
+        'params': params,
+        'mean_score': float(np.mean(valid)) if valid else None,
+        'scored_groups': len(valid),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _train_group_chunk(
+    family: str,
+    params: Dict[str, Any],
+    task: str,
+    scoring: str,
+    holdout_size: Optional[float],
+    chunk: List[Tuple[str, np.ndarray, np.ndarray]]
+) -> List[Dict[str, Any]]:
+    """
+    Modelle für einen Block von Gruppen trainieren und serialisieren (Worker)
+    """
+    scorer = get_scorer(scoring)
+    records = []
+
+    for key, X, y in chunk:
+        record = {'group_key': key, 'n_rows': int(len(y)), 'family': family}
+        start = time.perf_counter()
+
+        try:
+            if task == 'classification' and len(np.unique(y)) < 2:
+                raise ValueError("nur eine Klasse in der Gruppe")
+
+            metrics = {}
+            if holdout_size:
+                # Holdout-Score, danach Refit auf allen Zeilen der Gruppe
+                try:
+                    X_tr, X_val, y_tr, y_val = train_test_split(
+                        X, y, test_size=holdout_size, random_state=42,
+                        stratify=y if task == 'classification' else None
+                    )
+                    metrics[f"holdout_{scoring}"] = float(
+                        scorer(build_group_model(family, task, params).fit(X_tr, y_tr), X_val, y_val)
+                    )
+                except ValueError:
+                    metrics[f"holdout_{scoring}"] = None
+
+            model = build_group_model(family, task, params).fit(X, y)
+
+            buffer = io.BytesIO()
+            # Tausende Blobs: Kompression spart deutlich mehr als sie beim Laden kostet
+            joblib.dump(model, buffer, compress=3)
+            record.update({'status': 'ok', 'metrics': metrics, 'model_bytes': buffer.getvalue()})
+        except Exception as e:
+            record.update({'status': 'failed', 'error': str(e)})
+
+        record['seconds'] = time.perf_counter() - start
+        records.append(record)
+
+    return records
+
+
+class GroupModelStore:
+    """
+    Ein SQLite-Artefakt für alle Gruppen-Modelle
+
+    Jede Gruppe ist eine Zeile (Primary Key = Gruppe), das gemeinsame
+    Preprocessing (Encoding-Plan, Feature-Reihenfolge, Task) liegt einmal
+    in der Metadata-Tabelle. Einzelne Modelle werden über den Index
+    geladen, ohne den Rest des Stores zu lesen.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS models (
+                group_key TEXT PRIMARY KEY,
+                family TEXT NOT NULL,
+                n_rows INTEGER NOT NULL,
+                metrics TEXT,
+                trained_at TEXT NOT NULL,
+                model BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+
+    def set_metadata(self, metadata: Dict[str, Any]):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value, default=str)) for key, value in {'version': STORE_VERSION, **metadata}.items()]
+            )
+
+    def metadata(self) -> Dict[str, Any]:
+        return {key: json.loads(value) for key, value in self.connection.execute("SELECT key, value FROM metadata")}
+
+    def put_many(self, records: List[Dict[str, Any]]):
+        """
+        Modelle eines Blocks in einer Transaktion schreiben (ersetzt bestehende Gruppen)
+        """
+        trained_at = datetime.now().isoformat()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO models (group_key, family, n_rows, metrics, trained_at, model) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        record['group_key'], record['family'], record['n_rows'],
+                        json.dumps(record.get('metrics') or {}), trained_at, record['model_bytes']
+                    )
+                    for record in records
+                ]
+            )
+
+    def groups(self) -> List[str]:
+        return [row[0] for row in self.connection.execute("SELECT group_key FROM models ORDER BY group_key")]
+
+    def load(self, group_key: Any) -> Dict[str, Any]:
+        """
+        Model einer Gruppe inkl. gemeinsamer Metadata (Encoding, Feature-Namen)
+        """
+        row = self.connection.execute(
+            "SELECT family, n_rows, metrics, trained_at, model FROM models WHERE group_key = ?",
+            (str(group_key),)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Kein Model für Gruppe {group_key}")
+
+        family, n_rows, metrics, trained_at, payload = row
+        return {
+            **self.metadata(),
+            'group_key': str(group_key),
+            'model': restore_model(joblib.load(io.BytesIO(payload))),
+            'model_type': family,
+            'n_rows': n_rows,
+            'metrics': json.loads(metrics or '{}'),
+            'timestamp': trained_at,
+        }
+
+    def close(self):
+        self.connection.close()
+
+
+class GroupModelTrainer:
+    """
+    Trainiert ein kleines Model pro Gruppe in Worker-Prozessen
+
+    Tuning einmal pro Model-Familie auf einer Stichprobe von Gruppen
+    (mittlerer CV-Score), danach alle Gruppen mit der schnellsten
+    Konfiguration nahe am besten Score in Blöcken über einen Prozess-Pool.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Group Model Trainer
+
+        Args:
+            config: Konfiguration (group_model_families, group_min_rows, group_tuning_groups,
+                group_tuning_folds, group_chunk_size, group_holdout_size, group_family_tolerance)
+        """
+        self.families = config.get('group_model_families', ['linear', 'random_forest'])
+        self.min_rows = config.get('group_min_rows', 20)
+        self.tuning_groups = config.get('group_tuning_groups', 30)
+        self.tuning_folds = config.get('group_tuning_folds', 3)
+        self.chunk_size = config.get('group_chunk_size', 100)
+        # None = kein Holdout-Score pro Gruppe (nur ein Fit)
+        self.holdout_size = config.get('group_holdout_size', 0.2)
+        # Relativer Score-Abstand, innerhalb dessen die schnellere Familie gewinnt
+        self.family_tolerance = config.get('group_family_tolerance', 0.01)
+        self.random_state = config.get('random_state', 42)
+
+    def executor(self, max_workers: int, threads: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(threads,)
+        )
+
+    def tune(
+        self,
+        executor: ProcessPoolExecutor,
+        datasets: List[Tuple[np.ndarray, np.ndarray]],
+        task: str,
+        scoring: str
+    ) -> Tuple[str, Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Beste Familie und Parameter über eine Stichprobe von Gruppen
+
+        Returns:
+            (Familie, Parameter, alle bewerteten Kandidaten)
+        """
+        rng = np.random.default_rng(self.random_state)
+        if len(datasets) > self.tuning_groups:
+            sample = [datasets[i] for i in rng.choice(len(datasets), self.tuning_groups, replace=False)]
+        else:
+            sample = datasets
+
+        futures = [
+            executor.submit(_tune_candidate, family, params, task, scoring, self.tuning_folds, sample)
+            for family in self.families
+            for params in _family_grid(family, task)
+        ]
+        results = [future.result() for future in futures]
+
+        scored = [result for result in results if result['mean_score'] is not None]
+        if not scored:
+            # Keine Gruppe bewertbar (zu klein für CV): erste Konfiguration
+            family = self.families[0]
+            return family, _family_grid(family, task)[0], results
+
+        # Schnellste Konfiguration innerhalb der Toleranz zum besten Score
+        top_score = max(result['mean_score'] for result in scored)
+        threshold = top_score - self.family_tolerance * abs(top_score)
+        best = min(
+            (result for result in scored if result['mean_score'] >= threshold),
+            key=lambda result: result['seconds']
+        )
+        logger.info(
+            f"Gruppen-Tuning: {best['family']} {best['params']} "
+            f"({scoring} {best['mean_score']:.4f} über {best['scored_groups']} Gruppen)"
+        )
+        return best['family'], best['params'], results
+
+    def train(
+        self,
+        executor: ProcessPoolExecutor,
+        datasets: List[Tuple[str, np.ndarray, np.ndarray]],
+        family: str,
+        params: Dict[str, Any],
+        task: str,
+        scoring: str,
+        on_chunk=None
+    ) -> List[Dict[str, Any]]:
+        """
+        Alle Gruppen in Blöcken trainieren
+
+        Args:
+            datasets: (Gruppe, X, y) pro Gruppe
+            on_chunk: Callback pro fertigem Block (z.B. Schreiben in den Store)
+
+        Returns:
+            Status pro Gruppe (ohne Model-Bytes)
+        """
+        chunks = [datasets[i:i + self.chunk_size] for i in range(0, len(datasets), self.chunk_size)]
+        futures = [
+            executor.submit(_train_group_chunk, family, params, task, scoring, self.holdout_size, chunk)
+            for chunk in chunks
+        ]
+
+        summary = []
+        for done, future in enumerate(as_completed(futures), start=1):
+            records = future.result()
+            if on_chunk:
+                on_chunk([record for record in records if record['status'] == 'ok'])
+            for record in records:
+                record.pop('model_bytes', None)
+                summary.append(record)
+            logger.info(f"Gruppen-Training: Block {done}/{len(chunks)} fertig")
+
+        return summary
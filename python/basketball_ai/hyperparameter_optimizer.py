@@ -14,11 +14,13 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.svm import SVC
 from sklearn.naive_bayes import GaussianNB
 from sklearn.preprocessing import StandardScaler
+from sklearn.base import clone
 import xgboost as xgb
 import lightgbm as lgb
-from optuna.integration import MLflowCallback
 import mlflow
 import warnings
+from fold_cache import FoldCache, FoldSet, fit_and_score_fold, SCALED_MODEL_TYPES
+from mlflow_logger import AsyncMLflowLogger
 warnings.filterwarnings('ignore')
 
 logger = logging.getLogger(__name__)
@@ -28,14 +30,23 @@ class HyperparameterOptimizer:
     Hyperparameter Optimization für verschiedene ML-Algorithmen
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        fold_cache: Optional[FoldCache] = None,
+        tracker: Optional[AsyncMLflowLogger] = None
+    ):
         """
         Initialize Hyperparameter Optimizer
         
         Args:
             config: Konfiguration für Optimization
+            fold_cache: Geteilter Fold Cache (z.B. vom MLTrainer)
+            tracker: Geteilter asynchroner MLflow Logger (z.B. vom MLTrainer)
         """
         self.config = config
+        self.fold_cache = fold_cache or FoldCache(config)
+        self.tracker = tracker or AsyncMLflowLogger(config)
         self.n_trials = config.get('n_trials', 100)
         self.cv_folds = config.get('cv_folds', 5)
         self.random_state = config.get('random_state', 42)
@@ -48,8 +59,11 @@ class HyperparameterOptimizer:
         self.param_spaces = {
             'random_forest': self._random_forest_space,
             'gradient_boosting': self._gradient_boosting_space,
+            'hist_gradient_boosting': self._hist_gradient_boosting_space,
             'logistic_regression': self._logistic_regression_space,
             'svc': self._svc_space,
+            'ridge': self._ridge_space,
+            'svr': self._svr_space,
             'xgboost': self._xgboost_space,
             'lightgbm': self._lightgbm_space,
             'naive_bayes': self._naive_bayes_space
@@ -65,7 +79,10 @@ class HyperparameterOptimizer:
         model_type: str,
         cv_folds: int = None,
         n_trials: int = None,
-        study_name: Optional[str] = None
+        study_name: Optional[str] = None,
+        resume: bool = False,
+        problem_type: Optional[str] = None,
+        scoring: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Optimiere Hyperparameter für einen gegebenen Algorithmus
@@ -78,6 +95,10 @@ class HyperparameterOptimizer:
             cv_folds: Cross-Validation Folds
             n_trials: Anzahl Optimization Trials
             study_name: Name der Optuna Study
+            resume: Bereits abgeschlossene Trials der Study auf n_trials anrechnen
+            problem_type: Vorgegebener Problem Type (Default: aus y_train bestimmt)
+            scoring: Sklearn Scoring-Name der Trials, wie im CV des Trainers
+                (Default: r2, roc_auc bzw. f1_macro je nach Problem Type)
             
         Returns:
             Beste gefundene Parameter
@@ -86,24 +107,31 @@ class HyperparameterOptimizer:
         
         cv_folds = cv_folds or self.cv_folds
         n_trials = n_trials or self.n_trials
-        study_name = study_name or f"{model_type}_optimization"
         
         # Problem Type bestimmen
-        problem_type = self._determine_problem_type(y_train)
-        
-        # Data für Optimization vorbereiten
-        if model_type in ['svc', 'logistic_regression']:
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X_train)
-            X_opt = pd.DataFrame(X_scaled, columns=X_train.columns, index=X_train.index)
-        else:
-            X_opt = X_train
+        problem_type = problem_type or self._determine_problem_type(y_train)
+        default_scoring = self._default_scoring(problem_type)
+        scoring = scoring or default_scoring
+        
+        # Eigene Default-Study für Regression bzw. abweichendes Scoring,
+        # damit sich Trials verschiedener Metriken nicht mischen
+        if study_name is None:
+            suffix = 'regression_optimization' if problem_type == 'regression' else 'optimization'
+            study_name = f"{model_type}_{suffix}"
+            if scoring != default_scoring:
+                study_name += f"_{scoring}"
+        
+        # Folds einmal pro Dataset (inkl. skalierter Kopien für SCALED_MODEL_TYPES)
+        fold_set = self.fold_cache.get(
+            X_train, y_train, cv_folds, stratified=problem_type != 'regression'
+        )
+        scaled = model_type in SCALED_MODEL_TYPES
         
         # Objective Function definieren
         def objective(trial):
             return self._objective_function(
-                trial, algorithm_class, X_opt, y_train, 
-                model_type, problem_type, cv_folds
+                trial, algorithm_class, fold_set, scaled,
+                model_type, scoring
             )
         
         # Optuna Study erstellen
@@ -114,26 +142,49 @@ class HyperparameterOptimizer:
             load_if_exists=True
         )
         
-        # MLflow Callback
-        mlflc = MLflowCallback(
-            tracking_uri=mlflow.get_tracking_uri(),
-            metric_name='cv_score'
-        )
+        # Trials als Metrik-Serie im aktiven Run (sonst eigener Study-Run),
+        # asynchron gebündelt statt ein MLflow Run pro Trial
+        active_run = mlflow.active_run()
+        own_run = active_run is None
+        run_id = self.tracker.create_run(study_name) if own_run else active_run.info.run_id
         
-        # Optimization durchführen
-        logger.info(f"Starte {n_trials} Optimization Trials")
-        study.optimize(
-            objective,
-            n_trials=n_trials,
-            callbacks=[mlflc],
-            show_progress_bar=True
-        )
+        def log_trial(study: optuna.Study, trial: optuna.trial.FrozenTrial):
+            if trial.value is None or not np.isfinite(trial.value):
+                return
+            self.tracker.log_metric(f"{study_name}_cv_score", trial.value, step=trial.number, run_id=run_id)
         
-        best_params = study.best_params
-        best_score = study.best_value
+        # Beim Fortsetzen nur die fehlenden Trials laufen lassen
+        if resume:
+            completed = len(study.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,)))
+            if completed:
+                logger.info(f"Study {study_name}: {completed} Trials bereits abgeschlossen")
+            n_trials = max(0, n_trials - completed)
         
-        logger.info(f"Optimization abgeschlossen. Beste Score: {best_score:.4f}")
-        logger.info(f"Beste Parameter: {best_params}")
+        # Optimization durchführen
+        logger.info(f"Starte {n_trials} Optimization Trials")
+        status = 'FAILED'
+        try:
+            if n_trials > 0:
+                study.optimize(
+                    objective,
+                    n_trials=n_trials,
+                    callbacks=[log_trial],
+                    show_progress_bar=True
+                )
+            
+            best_params = study.best_params
+            best_score = study.best_value
+            
+            logger.info(f"Optimization abgeschlossen. Beste Score: {best_score:.4f}")
+            logger.info(f"Beste Parameter: {best_params}")
+            
+            self.tracker.log_metric(f"{study_name}_best_cv_score", best_score, run_id=run_id)
+            self.tracker.log_dict(best_params, f"{study_name}_best_params.json", run_id=run_id)
+            status = 'FINISHED'
+        finally:
+            # Eigener Study-Run bleibt sonst dauerhaft RUNNING
+            if own_run:
+                self.tracker.terminate_run(run_id, status)
         
         # History Update
         optimization_record = {
@@ -151,14 +202,15 @@ class HyperparameterOptimizer:
         self,
         trial: optuna.Trial,
         algorithm_class: type,
-        X_train: pd.DataFrame,
-        y_train: pd.Series,
+        fold_set: FoldSet,
+        scaled: bool,
         model_type: str,
-        problem_type: str,
-        cv_folds: int
+        scoring: str
     ) -> float:
         """
         Objective Function für Optuna
+        
+        Verwendet die gecachten Fold-Matrizen, kein Re-Slicing pro Trial.
         """
         try:
             # Parameter für Trial vorschlagen
@@ -171,26 +223,25 @@ class HyperparameterOptimizer:
             model = algorithm_class(**params)
             
             # Cross-Validation Score
-            cv_strategy = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=self.random_state)
-            
-            if problem_type == 'regression':
-                scoring = 'r2'
-            elif problem_type == 'binary_classification':
-                scoring = 'roc_auc'
-            else:
-                scoring = 'f1_macro'
+            cv_scores = [
+                fit_and_score_fold(clone(model), fold_set.fold(fold_no, scaled=scaled), scoring)[0]
+                for fold_no in range(fold_set.n_splits)
+            ]
             
-            cv_scores = cross_val_score(
-                model, X_train, y_train, 
-                cv=cv_strategy, scoring=scoring
-            )
-            
-            return cv_scores.mean()
+            return float(np.mean(cv_scores))
             
         except Exception as e:
             logger.warning(f"Trial failed: {e}")
             return -np.inf
     
+    @staticmethod
+    def _default_scoring(problem_type: str) -> str:
+        if problem_type == 'regression':
+            return 'r2'
+        if problem_type == 'binary_classification':
+            return 'roc_auc'
+        return 'f1_macro'
+    
     def _determine_problem_type(self, y: pd.Series) -> str:
         """
         Bestimme Problem Type
@@ -233,6 +284,21 @@ class HyperparameterOptimizer:
             'random_state': self.random_state
         }
     
+    def _hist_gradient_boosting_space(self, trial: optuna.Trial) -> Dict[str, Any]:
+        """
+        Parameter Space für Histogram-based Gradient Boosting (Classifier und Regressor)
+        """
+        return {
+            'max_iter': trial.suggest_int('max_iter', 50, 500),
+            'learning_rate': trial.suggest_float('learning_rate', 0.01, 0.3, log=True),
+            'max_leaf_nodes': trial.suggest_int('max_leaf_nodes', 15, 255),
+            'max_depth': trial.suggest_int('max_depth', 3, 15),
+            'min_samples_leaf': trial.suggest_int('min_samples_leaf', 5, 100),
+            'l2_regularization': trial.suggest_float('l2_regularization', 1e-8, 10.0, log=True),
+            'max_bins': trial.suggest_int('max_bins', 32, 255),
+            'random_state': self.random_state
+        }
+    
     def _logistic_regression_space(self, trial: optuna.Trial) -> Dict[str, Any]:
         """
         Parameter Space für Logistic Regression
@@ -264,6 +330,33 @@ class HyperparameterOptimizer:
         
         return params
     
+    def _ridge_space(self, trial: optuna.Trial) -> Dict[str, Any]:
+        """
+        Parameter Space für Ridge Regression
+        """
+        return {
+            'alpha': trial.suggest_float('alpha', 1e-4, 1e3, log=True),
+            'random_state': self.random_state
+        }
+    
+    def _svr_space(self, trial: optuna.Trial) -> Dict[str, Any]:
+        """
+        Parameter Space für Support Vector Regression
+        """
+        kernel = trial.suggest_categorical('kernel', ['rbf', 'poly', 'sigmoid'])
+        
+        params = {
+            'C': trial.suggest_float('C', 1e-3, 1e3, log=True),
+            'epsilon': trial.suggest_float('epsilon', 1e-3, 1.0, log=True),
+            'kernel': kernel,
+            'gamma': trial.suggest_categorical('gamma', ['scale', 'auto'])
+        }
+        
+        if kernel == 'poly':
+            params['degree'] = trial.suggest_int('degree', 2, 5)
+        
+        return params
+    
     def _xgboost_space(self, trial: optuna.Trial) -> Dict[str, Any]:
         """
         Parameter Space für XGBoost
@@ -0,0 +1,126 @@
+"""
+Inference Profile für Basketball Analytics
+Gemessene Latenz, Durchsatz, Größe, Ladezeit und Speicher eines Model-Artefakts
+"""
+
+import io
+import logging
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional
+
+import joblib
+import numpy as np
+
+from artifact_slimming import restore_model
+
+logger = logging.getLogger(__name__)
+
+PROFILE_VERSION = 1
+
+
+def _predict_fn(model: Any) -> Callable[[np.ndarray], Any]:
+    """
+    Aufruf wie in scripts/ml/predict.py: Klassifikation predict_proba + predict, Regression predict
+    """
+    if hasattr(model, 'predict_proba'):
+        return lambda X: (model.predict_proba(X), model.predict(X))
+    return model.predict
+
+
+class InferenceProfiler:
+    """
+    Misst die Inference-Kosten eines Artefakts auf Holdout-Zeilen beim Speichern
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Inference Profiler
+
+        Args:
+            config: Konfiguration (inference_profile_enabled, profile_single_rows,
+                profile_batch_rows, profile_batch_repeats)
+        """
+        self.enabled = config.get('inference_profile_enabled', True)
+        self.single_rows = config.get('profile_single_rows', 200)
+        self.batch_rows = config.get('profile_batch_rows', 1000)
+        self.batch_repeats = config.get('profile_batch_repeats', 3)
+
+    def profile(self, artifact: Dict[str, Any], X_holdout: Any) -> Optional[Dict[str, Any]]:
+        """
+        Profil für ein Artefakt (dict mit 'model') messen
+
+        Args:
+            artifact: Zu speichernde Model-Daten
+            X_holdout: Held-out Feature-Zeilen in Trainings-Spaltenreihenfolge
+
+        Returns:
+            Profil-Dict oder None (deaktiviert bzw. keine Zeilen)
+        """
+        if not self.enabled or X_holdout is None or len(X_holdout) == 0:
+            return None
+
+        # Inference bekommt numpy-Zeilen (predict.py: df.values)
+        X = X_holdout.to_numpy(dtype=np.float64) if hasattr(X_holdout, 'to_numpy') else np.asarray(X_holdout, dtype=np.float64)
+        predict = _predict_fn(restore_model(artifact['model']))
+
+        # Single-Row Latenz (nach einem Warmup-Aufruf)
+        rows = X[:self.single_rows]
+        predict(rows[:1])
+        latencies = np.empty(len(rows))
+        for i in range(len(rows)):
+            start = time.perf_counter()
+            predict(rows[i:i + 1])
+            latencies[i] = time.perf_counter() - start
+        latencies_ms = latencies * 1000
+
+        # Batch-Durchsatz, Holdout bei Bedarf wiederholt bis batch_rows
+        batch = X[np.arange(self.batch_rows) % len(X)]
+        batch_seconds = min(self._timed(predict, batch) for _ in range(self.batch_repeats))
+
+        # Größe, Ladezeit und Peak-Speicher des serialisierten Artefakts
+        buffer = io.BytesIO()
+        joblib.dump(artifact, buffer)
+        payload = buffer.getvalue()
+
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            # Laden inkl. Wiederherstellung gepackter Tree-Modelle
+            loaded = restore_model(joblib.load(io.BytesIO(payload))['model'])
+            load_seconds = time.perf_counter() - start
+            _predict_fn(loaded)(batch)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        profile = {
+            'version': PROFILE_VERSION,
+            'measured_at': datetime.now().isoformat(),
+            'single_row_rows': int(len(rows)),
+            'single_row_p50_ms': float(np.percentile(latencies_ms, 50)),
+            'single_row_p99_ms': float(np.percentile(latencies_ms, 99)),
+            'batch_rows': int(len(batch)),
+            'batch_latency_ms': batch_seconds * 1000,
+            'batch_throughput_rows_per_s': len(batch) / batch_seconds if batch_seconds > 0 else None,
+            'serialized_bytes': len(payload),
+            'load_seconds': load_seconds,
+            # Python-Allokationen beim Laden + Batch-Predict (ohne nativen xgboost/lightgbm Speicher)
+            'peak_memory_mb': peak / 1024 ** 2,
+        }
+
+        logger.info(
+            f"Inference Profile: p50 {profile['single_row_p50_ms']:.2f}ms, "
+            f"p99 {profile['single_row_p99_ms']:.2f}ms, "
+            f"{profile['batch_throughput_rows_per_s'] or 0:.0f} Zeilen/s, "
+            f"{profile['serialized_bytes'] / 1024:.0f} KB"
+        )
+
+        return profile
+
+    @staticmethod
+    def _timed(predict: Callable[[np.ndarray], Any], X: np.ndarray) -> float:
+        start = time.perf_counter()
+        predict(X)
+        return time.perf_counter() - start
@@ -5,27 +5,51 @@ Automatisiertes Training von ML-Modellen mit AutoML-Capabilities
 
 import pandas as pd
 import numpy as np
+import hashlib
 import joblib
+import json
 import logging
+import multiprocessing
+import os
+import time
+from queue import Empty
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 from datetime import datetime
 import optuna
-from optuna.integration import MLflowCallback
 import mlflow
 import mlflow.sklearn
 from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score
+from sklearn.base import clone, is_regressor
 from sklearn.preprocessing import StandardScaler, LabelEncoder
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.svm import SVC
+from sklearn.pipeline import Pipeline
+from sklearn.ensemble import (
+    RandomForestClassifier, GradientBoostingClassifier,
+    HistGradientBoostingClassifier, HistGradientBoostingRegressor,
+    RandomForestRegressor, GradientBoostingRegressor
+)
+from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.svm import SVC, SVR
 from sklearn.naive_bayes import GaussianNB
 import xgboost as xgb
 import lightgbm as lgb
 from feature_selector import FeatureSelector
 from hyperparameter_optimizer import HyperparameterOptimizer
 from model_evaluator import ModelEvaluator
+from fold_cache import FoldCache, FoldSet, fit_and_score_fold, SCALED_MODEL_TYPES
+from data_loader import TrainingDataLoader
+from dataset_cache import PreprocessedDatasetCache
+from categorical_encoder import CategoricalEncoderPlan
+from feature_registry import FEATURE_REGISTRY, TRAINER_FEATURES
+from mlflow_logger import AsyncMLflowLogger
+from training_checkpoint import TrainingCheckpoint, list_checkpoints
+from training_cost import TrainingCostEstimator
+from inference_profile import InferenceProfiler
+from artifact_slimming import slim_tree_model, restore_model
+from model_pruning import ModelPruner
+from model_distillation import ModelDistiller
+from group_training import GroupModelTrainer, GroupModelStore, group_slices
 
 # Logging Setup
 logging.basicConfig(
@@ -34,6 +58,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
 class MLTrainer:
     """
     Hauptklasse für automatisiertes ML Model Training
@@ -50,99 +75,185 @@ class MLTrainer:
         self.models_dir = Path(config.get('models_dir', 'models'))
         self.models_dir.mkdir(exist_ok=True)
         
+        # Globales Worker-Budget für parallele CV (-1 = alle Kerne)
+        self.n_jobs = config.get('n_jobs', -1)
+        
         # MLflow Setup
         mlflow.set_tracking_uri(config.get('mlflow_uri', 'sqlite:///mlflow.db'))
         mlflow.set_experiment(config.get('experiment_name', 'BasketballAI'))
         
+        # Gebündeltes Logging im Hintergrund statt einzelner Writes pro Wert
+        self.tracker = AsyncMLflowLogger(config)
+        
         # Verfügbare Algorithmen
         self.algorithms = {
             'random_forest': RandomForestClassifier,
             'gradient_boosting': GradientBoostingClassifier,
+            'hist_gradient_boosting': HistGradientBoostingClassifier,
             'logistic_regression': LogisticRegression,
             'svc': SVC,
             'naive_bayes': GaussianNB,
             'xgboost': xgb.XGBClassifier,
             'lightgbm': lgb.LGBMClassifier
         }
+        self.regression_algorithms = {
+            'random_forest': RandomForestRegressor,
+            'gradient_boosting': GradientBoostingRegressor,
+            'hist_gradient_boosting': HistGradientBoostingRegressor,
+            'ridge': Ridge,
+            'svr': SVR,
+            'xgboost': xgb.XGBRegressor,
+            'lightgbm': lgb.LGBMRegressor
+        }
+        
+        # Ab dieser Zeilenzahl ersetzt Histogram-Boosting das exakte Gradient Boosting in AutoML
+        self.hist_gradient_boosting_min_rows = config.get('hist_gradient_boosting_min_rows', 10000)
+        
+        # Gemeinsamer Fold Cache für Trainer, Optimizer und Feature Selector
+        self.fold_cache = FoldCache(config)
         
         # Feature Selector und Optimizer
-        self.feature_selector = FeatureSelector(config)
-        self.hyperparameter_optimizer = HyperparameterOptimizer(config)
+        self.feature_selector = FeatureSelector(config, fold_cache=self.fold_cache)
+        self.hyperparameter_optimizer = HyperparameterOptimizer(
+            config, fold_cache=self.fold_cache, tracker=self.tracker
+        )
         self.model_evaluator = ModelEvaluator(config)
+        self.data_loader = TrainingDataLoader(config)
+        self.dataset_cache = PreprocessedDatasetCache(config)
+        self.cost_estimator = TrainingCostEstimator(config)
+        self.inference_profiler = InferenceProfiler(config)
+        self.model_pruner = ModelPruner(config)
+        self.model_distiller = ModelDistiller(config)
+        self.group_trainer = GroupModelTrainer(config)
+        
+        # Datenanteil für das finale Fit des AutoML-Siegers (vom Kostenmodell begrenzt)
+        self.automl_fit_fraction = 1.0
+        
+        # Encoding-Plan des letzten Preprocessings (wird mit dem Model gespeichert)
+        self.categorical_encoder = None
+        
+        # Stage-Checkpoints für resume_training
+        self.checkpoint_dir = Path(config.get('checkpoint_dir', self.models_dir / 'checkpoints'))
         
         # Training History
         self.training_history = []
         
     def train_model(
         self, 
-        data: pd.DataFrame, 
+        data: Optional[pd.DataFrame], 
         target_column: str,
         model_type: str = 'auto',
         use_auto_features: bool = True,
         use_hyperopt: bool = True,
-        cv_folds: int = 5
+        cv_folds: int = 5,
+        run_name: Optional[str] = None,
+        copy_data: bool = True,
+        checkpoint_id: Optional[str] = None,
+        task: str = 'auto'
     ) -> Dict[str, Any]:
         """
         Trainiere ein ML-Model mit automatischer Optimierung
         
+        Die Pipeline läuft in Stages (preprocess -> select -> split -> search
+        -> fit -> evaluate -> save). Mit aktiviertem Checkpointing
+        (checkpoint_training oder explizite checkpoint_id) wird jede
+        abgeschlossene Stage gespeichert; ein erneuter Aufruf mit denselben
+        Argumenten bzw. resume_training setzt nach der letzten fertigen Stage fort.
+        
         Args:
-            data: Training data
+            data: Training data (None nur beim Fortsetzen eines Checkpoints)
             target_column: Name der Ziel-Variable
             model_type: Typ des Models ('auto' für AutoML)
             use_auto_features: Verwende automatische Feature-Selection
             use_hyperopt: Verwende Hyperparameter-Optimierung
             cv_folds: Cross-Validation Folds
+            run_name: Name des MLflow Runs (auch Präfix des Model-Files)
+            copy_data: False = data wird beim Preprocessing in-place verändert
+            checkpoint_id: ID des Checkpoints (Default: aus Daten und Argumenten abgeleitet)
+            task: 'classification', 'regression' oder 'auto' (aus dem Target bestimmt)
             
         Returns:
             Training-Ergebnisse
         """
         logger.info(f"Starte Training für {model_type} Model")
         
-        with mlflow.start_run():
+        params = {
+            'target_column': target_column,
+            'model_type': model_type,
+            'use_auto_features': use_auto_features,
+            'use_hyperopt': use_hyperopt,
+            'cv_folds': cv_folds,
+            'run_name': run_name,
+            'task': task,
+        }
+        checkpoint = self._open_checkpoint(checkpoint_id, data, params)
+        
+        if checkpoint.completed:
+            logger.info(f"Setze Training fort nach Stage '{checkpoint.completed[-1]}'")
+        
+        # Beim Fortsetzen in denselben MLflow Run schreiben
+        run_id = checkpoint.get_meta('mlflow_run_id')
+        with (mlflow.start_run(run_id=run_id) if run_id else mlflow.start_run(run_name=run_name)) as run:
+            checkpoint.set_meta('mlflow_run_id', run.info.run_id)
+            
             # Log Parameters
-            mlflow.log_param("model_type", model_type)
-            mlflow.log_param("use_auto_features", use_auto_features)
-            mlflow.log_param("use_hyperopt", use_hyperopt)
-            mlflow.log_param("cv_folds", cv_folds)
+            self.tracker.log_param("model_type", model_type)
+            self.tracker.log_param("use_auto_features", use_auto_features)
+            self.tracker.log_param("use_hyperopt", use_hyperopt)
+            self.tracker.log_param("cv_folds", cv_folds)
             
-            # Data Preprocessing
-            X, y = self._preprocess_data(data, target_column)
+            # Data Preprocessing + Feature Selection (oder aus dem Dataset Cache)
+            X, y = self._prepare_features(data, target_column, use_auto_features, copy_data, checkpoint)
             
-            # Feature Selection
             if use_auto_features:
-                X = self.feature_selector.select_features(X, y)
-                mlflow.log_param("selected_features", X.columns.tolist())
+                self.tracker.log_param("selected_features", X.columns.tolist())
+            
+            if task == 'auto':
+                task = self._determine_task(y)
+            self.tracker.log_param("task", task)
             
             # Train/Test Split
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42, stratify=y
-            )
+            X_train, X_test, y_train, y_test = checkpoint.run('split', lambda: tuple(train_test_split(
+                X, y, test_size=0.2, random_state=42,
+                stratify=y if task == 'classification' else None
+            )))
             
-            # Model Selection & Training
-            if model_type == 'auto':
-                best_model, best_score = self._auto_ml_selection(X_train, y_train, cv_folds)
-            else:
-                best_model, best_score = self._train_single_model(
-                    model_type, X_train, y_train, use_hyperopt, cv_folds
-                )
+            # Model Selection (nur Suche, ungefittetes Model + CV-Score)
+            study_name = f"{model_type}_{checkpoint.checkpoint_id[:12]}" if checkpoint.enabled else None
+            search = checkpoint.run('search', lambda: self._search_model(
+                model_type, X_train, y_train, use_hyperopt, cv_folds, study_name, task
+            ))
+            best_score = search['cv_score']
+            
+            # Model Training
+            best_model = checkpoint.run('fit', lambda: self._fit_model(
+                search['model'], X_train, y_train, cv_folds, search.get('fit_fraction', 1.0)
+            ))
             
             # Model Evaluation
-            evaluation_results = self.model_evaluator.evaluate_model(
+            evaluation_results = checkpoint.run('evaluate', lambda: self.model_evaluator.evaluate_model(
                 best_model, X_test, y_test
-            )
+            ))
             
-            # Log Metrics
-            for metric, value in evaluation_results.items():
-                mlflow.log_metric(metric, value)
+            # Log Metrics (nur die numerischen Basis-Metriken)
+            for metric, value in evaluation_results.get('basic_metrics', {}).items():
+                if isinstance(value, (int, float, np.number)):
+                    self.tracker.log_metric(metric, value)
             
             # Model Persistence
-            model_path = self._save_model(best_model, model_type, evaluation_results)
-            mlflow.log_artifact(str(model_path))
+            model_path = checkpoint.run('save', lambda: self._save_model(
+                best_model, model_type, evaluation_results, name=run_name,
+                feature_names=X.columns.tolist(), profile_rows=X_test
+            ))
+            self.tracker.log_artifact(str(model_path))
+            
+            checkpoint.finish(keep=self.config.get('keep_checkpoints', False))
             
             # Training History Update
             training_record = {
                 'timestamp': datetime.now(),
                 'model_type': model_type,
+                'task': task,
                 'cv_score': best_score,
                 'test_metrics': evaluation_results,
                 'model_path': model_path,
@@ -160,13 +271,174 @@ class MLTrainer:
                 'training_record': training_record
             }
     
-    def _preprocess_data(self, data: pd.DataFrame, target_column: str) -> Tuple[pd.DataFrame, pd.Series]:
+    def resume_training(self, checkpoint_id: str) -> Dict[str, Any]:
+        """
+        Setze einen abgebrochenen Trainings-Run nach der letzten fertigen Stage fort
+        
+        Args:
+            checkpoint_id: ID aus list_checkpoints()
+            
+        Returns:
+            Training-Ergebnisse wie train_model
+        """
+        checkpoint = TrainingCheckpoint(self.checkpoint_dir, checkpoint_id)
+        params = checkpoint.get_meta('params')
+        
+        if params is None:
+            raise ValueError(f"Kein Checkpoint gefunden: {checkpoint_id}")
+        
+        return self.train_model(None, checkpoint_id=checkpoint_id, **params)
+    
+    def list_checkpoints(self) -> List[Dict[str, Any]]:
+        """
+        Unvollständige Trainings-Runs, die fortgesetzt werden können
+        """
+        return list_checkpoints(self.checkpoint_dir)
+    
+    def _open_checkpoint(
+        self,
+        checkpoint_id: Optional[str],
+        data: Optional[pd.DataFrame],
+        params: Dict[str, Any]
+    ) -> TrainingCheckpoint:
+        """
+        Checkpoint für einen Trainings-Run öffnen oder anlegen
+        """
+        if not self.config.get('checkpoint_training', False) and checkpoint_id is None:
+            return TrainingCheckpoint.disabled()
+        
+        data_key = None
+        if checkpoint_id is None:
+            if data is None:
+                raise ValueError("Ohne Daten ist eine checkpoint_id nötig")
+            # Gleiche Daten + Argumente -> gleicher Checkpoint (Re-Run setzt automatisch fort)
+            data_key = self.dataset_cache.key(data, params['target_column'], params['use_auto_features'])
+            checkpoint_id = hashlib.sha256(
+                json.dumps({'data': data_key, **params}, sort_keys=True, default=str).encode()
+            ).hexdigest()[:32]
+        
+        checkpoint = TrainingCheckpoint(self.checkpoint_dir, checkpoint_id)
+        
+        # Ein abgeschlossener Run (keep_checkpoints) wird nur per resume_training wiederverwendet,
+        # sonst gäbe ein neuer Aufruf den alten MLflow Run und model_path zurück
+        if data_key is not None and checkpoint.finished:
+            checkpoint.clear()
+        
+        if checkpoint.get_meta('params') is None:
+            checkpoint.set_meta('params', params)
+        if data_key is not None and checkpoint.get_meta('dataset_cache_key') is None:
+            checkpoint.set_meta('dataset_cache_key', data_key)
+        
+        return checkpoint
+    
+    def train_from_csv(
+        self,
+        csv_path: str,
+        target_column: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Trainiere direkt aus einer CSV-Datei (z.B. vom MLTrainingService)
+        
+        Lädt chunk-weise mit kleinen Dtypes und ohne zusätzliche Kopie
+        beim Preprocessing.
+        
+        Args:
+            csv_path: Pfad zur CSV-Datei
+            target_column: Name der Ziel-Variable
+            **kwargs: Weitere Argumente für train_model
+            
+        Returns:
+            Training-Ergebnisse inkl. 'data_memory' Report
+        """
+        data = self.data_loader.load_csv(csv_path, keep_columns=[target_column])
+        memory_report = self.data_loader.last_report
+        
+        result = self.train_model(data, target_column, copy_data=False, **kwargs)
+        result['data_memory'] = memory_report
+        
+        return result
+    
+    def _prepare_features(
+        self,
+        data: Optional[pd.DataFrame],
+        target_column: str,
+        use_auto_features: bool,
+        copy_data: bool = True,
+        checkpoint: Optional[TrainingCheckpoint] = None
+    ) -> Tuple[pd.DataFrame, Any]:
+        """
+        Preprocessing und Feature Selection mit Dataset Cache und Checkpoints
+        
+        Der Cache-Key wird vor dem Preprocessing berechnet, weil data bei
+        copy_data=False in-place verändert wird.
+        """
+        checkpoint = checkpoint or TrainingCheckpoint.disabled()
+        cache_key = None
+        
+        if self.dataset_cache.enabled and not checkpoint.has('select'):
+            cache_key = checkpoint.get_meta('dataset_cache_key')
+            if cache_key is None and data is not None:
+                cache_key = self.dataset_cache.key(data, target_column, use_auto_features)
+            
+            cached = self.dataset_cache.load(cache_key) if cache_key else None
+            
+            if cached is not None:
+                X, y, selected_features, artifacts = cached
+                if selected_features is not None:
+                    self.feature_selector.selected_features = selected_features
+                if artifacts.get('categorical_encoder'):
+                    self.categorical_encoder = CategoricalEncoderPlan.from_dict(artifacts['categorical_encoder'])
+                self.tracker.log_param("dataset_cache", "hit")
+                return X, y
+        
+        if data is None and not checkpoint.has('preprocess'):
+            raise ValueError(f"Checkpoint {checkpoint.checkpoint_id} enthält keine Daten, bitte data übergeben")
+        
+        def preprocess():
+            X, y = self._preprocess_data(data, target_column, copy=copy_data)
+            encoder = self.categorical_encoder.to_dict() if self.categorical_encoder else None
+            return {'X': X, 'y': y, 'categorical_encoder': encoder}
+        
+        prepared = checkpoint.run('preprocess', preprocess)
+        X, y = prepared['X'], prepared['y']
+        if prepared['categorical_encoder']:
+            self.categorical_encoder = CategoricalEncoderPlan.from_dict(prepared['categorical_encoder'])
+        
+        def select():
+            if not use_auto_features:
+                return None
+            return self.feature_selector.select_features(X, y).columns.tolist()
+        
+        selected_features = checkpoint.run('select', select)
+        if selected_features is not None:
+            X = X[selected_features]
+            self.feature_selector.selected_features = selected_features
+        
+        if cache_key is not None:
+            artifacts = {}
+            if self.categorical_encoder is not None:
+                artifacts['categorical_encoder'] = self.categorical_encoder.to_dict()
+            self.dataset_cache.save(cache_key, X, y, selected_features, artifacts)
+            self.tracker.log_param("dataset_cache", "miss")
+        
+        return X, y
+    
+    def _preprocess_data(
+        self,
+        data: pd.DataFrame,
+        target_column: str,
+        copy: bool = True,
+        encoder_plan: Optional[CategoricalEncoderPlan] = None
+    ) -> Tuple[pd.DataFrame, pd.Series]:
         """
         Preprocessing der Trainingsdaten
         
         Args:
             data: Rohdaten
             target_column: Ziel-Variable
+            copy: False = data in-place verarbeiten (spart eine volle Kopie)
+            encoder_plan: Bestehenden Encoder Plan anwenden statt neu zu fitten
             
         Returns:
             Features und Target
@@ -174,13 +446,13 @@ class MLTrainer:
         logger.info("Starte Data Preprocessing")
         
         # Kopie der Daten
-        df = data.copy()
+        df = data.copy() if copy else data
         
         # Missing Values behandeln
         df = self._handle_missing_values(df)
         
         # Categorical Features enkodieren
-        df = self._encode_categorical_features(df)
+        df = self._encode_categorical_features(df, target_column, encoder_plan)
         
         # Feature Engineering
         df = self._engineer_features(df)
@@ -207,124 +479,422 @@ class MLTrainer:
         df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].median())
         
         # Kategorische Spalten: Mode
-        categorical_cols = df.select_dtypes(include=['object']).columns
+        categorical_cols = df.select_dtypes(include=['object', 'category']).columns
         for col in categorical_cols:
-            df[col] = df[col].fillna(df[col].mode().iloc[0] if not df[col].mode().empty else 'Unknown')
+            if not df[col].isna().any():
+                continue
+            fill_value = df[col].mode().iloc[0] if not df[col].mode().empty else 'Unknown'
+            if isinstance(df[col].dtype, pd.CategoricalDtype) and fill_value not in df[col].cat.categories:
+                df[col] = df[col].cat.add_categories([fill_value])
+            df[col] = df[col].fillna(fill_value)
         
         return df
     
-    def _encode_categorical_features(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _encode_categorical_features(
+        self,
+        df: pd.DataFrame,
+        target_column: Optional[str] = None,
+        encoder_plan: Optional[CategoricalEncoderPlan] = None
+    ) -> pd.DataFrame:
         """
         Enkodiere kategorische Features
+        
+        Frequency Encoding für High-Cardinality, One-Hot (drop_first) für
+        Low-Cardinality Spalten. Alle Mappings werden in einem Durchlauf
+        gefittet und in eine einzige Matrix geschrieben, statt pro Spalte
+        get_dummies + concat + drop auf dem ganzen Frame.
         """
-        categorical_cols = df.select_dtypes(include=['object']).columns
+        if encoder_plan is not None:
+            # Encoding eines bestehenden Models (z.B. inkrementelles Update)
+            self.categorical_encoder = encoder_plan
+            for col in encoder_plan.numeric_columns:
+                if col not in df.columns:
+                    logger.warning(f"Spalte {col} fehlt, wird mit 0 aufgefüllt")
+                    df[col] = 0.0
+            for spec in encoder_plan.columns:
+                if spec['column'] not in df.columns:
+                    df[spec['column']] = None
+        else:
+            self.categorical_encoder = CategoricalEncoderPlan(
+                max_onehot_categories=self.config.get('max_onehot_categories', 10),
+                dtype=self.config.get('encoded_dtype', 'float32')
+            ).fit(df, exclude=[target_column] if target_column else None)
         
-        for col in categorical_cols:
-            # Target encoding für High-Cardinality Features
-            if df[col].nunique() > 10:
-                # Frequency encoding
-                freq_encoding = df[col].value_counts(normalize=True).to_dict()
-                df[f'{col}_freq'] = df[col].map(freq_encoding)
-                df = df.drop(columns=[col])
-            else:
-                # One-hot encoding für Low-Cardinality
-                dummies = pd.get_dummies(df[col], prefix=col, drop_first=True)
-                df = pd.concat([df, dummies], axis=1)
-                df = df.drop(columns=[col])
+        encoded = self.categorical_encoder.transform(df)
         
-        return df
+        if target_column is not None:
+            encoded[target_column] = df[target_column].to_numpy()
+        
+        return encoded
     
     def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Basketball-spezifisches Feature Engineering
-        """
-        # Shooting Efficiency Features
-        if 'shots_made' in df.columns and 'shots_attempted' in df.columns:
-            df['shooting_percentage'] = np.where(
-                df['shots_attempted'] > 0,
-                df['shots_made'] / df['shots_attempted'],
-                0
-            )
-        
-        # Performance Ratios
-        if 'points' in df.columns and 'minutes_played' in df.columns:
-            df['points_per_minute'] = np.where(
-                df['minutes_played'] > 0,
-                df['points'] / df['minutes_played'],
-                0
-            )
         
-        # Defensive Metrics
-        if 'steals' in df.columns and 'blocks' in df.columns:
-            df['defensive_actions'] = df['steals'] + df['blocks']
-        
-        # Efficiency Metrics
-        if all(col in df.columns for col in ['rebounds', 'assists', 'turnovers']):
-            df['efficiency'] = (df['rebounds'] + df['assists']) / np.maximum(df['turnovers'], 1)
-        
-        return df
+        Formeln aus der Feature Registry (gleiche Definitionen wie predict.py),
+        Features ohne vorhandene Inputs werden übersprungen.
+        """
+        plan = FEATURE_REGISTRY.plan(self.config.get('engineered_features', TRAINER_FEATURES), df.columns)
+        return plan.apply(df)
     
     def _auto_ml_selection(
         self, 
         X_train: pd.DataFrame, 
         y_train: pd.Series, 
-        cv_folds: int
+        cv_folds: int,
+        fit: bool = True,
+        task: str = 'classification'
     ) -> Tuple[Any, float]:
         """
         Automatische Model-Auswahl mit Cross-Validation
+        
+        Mit fit=False wird das beste Model ungefittet zurückgegeben.
+        Regression verwendet KFold und regression_scoring (Default r2).
         """
         logger.info("Starte AutoML Model Selection")
         
         best_model = None
         best_score = -np.inf
         model_scores = {}
+        model_timings = {}
+        
+        # Folds und skalierte Matrix einmal pro Dataset, für alle Kandidaten identisch
+        fold_set = self.fold_cache.get(X_train, y_train, cv_folds, stratified=task == 'classification')
+        scoring = self._scoring(task)
+        
+        candidates = self._build_candidates(len(X_train), task)
+        
+        # Kostenmodell: Kandidaten über dem Budget überspringen oder auf ein Subsample begrenzen
+        cost_plan = self.cost_estimator.plan(candidates, fold_set)
+        for name, decision in cost_plan.items():
+            if 'estimated_seconds' in decision:
+                self.tracker.log_metric(f"automl_{name}_estimated_seconds", decision['estimated_seconds'])
+                self.tracker.log_metric(f"automl_{name}_estimated_memory_mb", decision['estimated_memory_mb'])
+            if decision['action'] != 'run':
+                logger.warning(f"{name}: {decision['action']} ({decision['reason']})")
+                self.tracker.log_param(f"automl_{name}_cost_action", f"{decision['action']}: {decision['reason']}")
+        self.tracker.log_dict(cost_plan, "training_cost.json")
+        
+        candidates = [c for c in candidates if cost_plan[c[0]]['action'] != 'skip']
+        if not candidates:
+            raise ValueError("Alle AutoML-Kandidaten überschreiten das Kostenbudget")
+        max_fractions = {name: cost_plan[name]['max_fraction'] for name, _, _ in candidates}
+        
+        if self.config.get('automl_strategy', 'full_cv') == 'successive_halving':
+            cv_results = self._successive_halving(candidates, fold_set, max_fractions, scoring)
+        else:
+            cv_results = self._cross_validate_limited(candidates, fold_set, None, 1.0, max_fractions, scoring)
+        
+        # Auswertung in fester Kandidaten-Reihenfolge -> deterministisch
+        for name, model, _ in candidates:
+            if name not in cv_results:
+                continue
+            
+            scores, seconds = cv_results[name]
+            
+            mean_score = scores.mean()
+            model_scores[name] = mean_score
+            model_timings[name] = seconds
+            self.tracker.log_metric(f"automl_{name}_seconds", seconds)
+            
+            logger.info(f"{name}: {mean_score:.4f} (+/- {scores.std() * 2:.4f}) in {seconds:.2f}s")
+            
+            if mean_score > best_score:
+                best_score = mean_score
+                best_model = model
+                self.automl_fit_fraction = max_fractions[name]
+        
+        # Best Model trainieren
+        if best_model is not None and fit:
+            best_model = self._fit_model(best_model, X_train, y_train, cv_folds, self.automl_fit_fraction)
         
-        # Standard Scaler für manche Algorithmen
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X_train)
+        # Log Model Scores
+        self.tracker.log_dict(model_scores, "model_comparison.json")
+        self.tracker.log_dict(model_timings, "model_timings.json")
+        self.tracker.log_dict(self.fold_cache.get_stats(), "fold_cache.json")
+        
+        logger.info(f"Bestes Model: {type(best_model).__name__} (Score: {best_score:.4f})")
+        
+        return best_model, best_score
+    
+    def _determine_task(self, y: pd.Series) -> str:
+        """
+        Bestimme den Task (gleiche Regel wie Evaluator und Feature Selector)
+        """
+        unique_values = y.nunique()
+        
+        if unique_values == 2 or (unique_values <= 10 and y.dtype in ['int64', 'object']):
+            return 'classification'
+        return 'regression'
+    
+    def _algorithms_for(self, task: str) -> Dict[str, Any]:
+        if task == 'regression':
+            return self.regression_algorithms
+        return self.algorithms
+    
+    def _scoring(self, task: str) -> str:
+        if task == 'regression':
+            return self.config.get('regression_scoring', 'r2')
+        return 'roc_auc'
+    
+    def _build_model(self, algorithm: type, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Instanziere ein Model, random_state/max_iter nur wenn der Algorithmus sie kennt
+        """
+        params = dict(params or {})
+        supported = algorithm().get_params()
         
-        for name, algorithm in self.algorithms.items():
+        if 'random_state' in supported:
+            params.setdefault('random_state', self.config.get('random_state', 42))
+        
+        return algorithm(**{key: value for key, value in params.items() if key in supported})
+    
+    def _build_candidates(self, n_rows: int = 0, task: str = 'classification') -> List[Tuple[str, Any, bool]]:
+        """
+        Erstelle AutoML-Kandidaten mit Default-Parametern
+        
+        Ab hist_gradient_boosting_min_rows Zeilen wird Histogram-Boosting statt
+        exaktem Gradient Boosting verwendet, darunter bleibt es beim exakten.
+        
+        Args:
+            n_rows: Zeilen des Trainings-Sets
+            task: 'classification' oder 'regression'
+        
+        Returns:
+            Liste von (Name, Model, benötigt Skalierung)
+        """
+        candidates = []
+        
+        use_hist = n_rows >= self.hist_gradient_boosting_min_rows
+        skip = 'gradient_boosting' if use_hist else 'hist_gradient_boosting'
+        
+        for name, algorithm in self._algorithms_for(task).items():
+            if name == skip:
+                continue
+            
             try:
-                logger.info(f"Teste {name}")
-                
                 # Model mit Default-Parametern
-                if name in ['svc', 'logistic_regression']:
-                    model = algorithm(random_state=42, max_iter=1000)
-                    X_cv = X_scaled
-                else:
-                    model = algorithm(random_state=42)
-                    X_cv = X_train
-                
-                # Cross Validation
-                cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=42)
-                scores = cross_val_score(model, X_cv, y_train, cv=cv, scoring='roc_auc')
+                needs_scaling = name in SCALED_MODEL_TYPES
+                model = self._build_model(algorithm, {'max_iter': 1000} if needs_scaling else None)
                 
-                mean_score = scores.mean()
-                model_scores[name] = mean_score
+                candidates.append((name, self._limit_model_threads(model), needs_scaling))
                 
-                logger.info(f"{name}: {mean_score:.4f} (+/- {scores.std() * 2:.4f})")
-                
-                if mean_score > best_score:
-                    best_score = mean_score
-                    best_model = model
-                    
             except Exception as e:
                 logger.warning(f"Fehler bei {name}: {e}")
                 continue
         
-        # Best Model trainieren
-        if best_model is not None:
-            if any(isinstance(best_model, alg) for alg in [SVC, LogisticRegression]):
-                best_model.fit(X_scaled, y_train)
-            else:
-                best_model.fit(X_train, y_train)
+        return candidates
+    
+    def _limit_model_threads(self, model: Any) -> Any:
+        """
+        Ein Thread pro Model, damit das globale Worker-Budget nicht überbucht wird
+        """
+        if 'n_jobs' in model.get_params():
+            model.set_params(n_jobs=1)
+        return model
+    
+    def _cross_validate_candidates(
+        self,
+        candidates: List[Tuple[str, Any, bool]],
+        fold_set: FoldSet,
+        fold_ids: Optional[List[int]] = None,
+        train_positions: Optional[Dict[int, np.ndarray]] = None,
+        scoring: str = 'roc_auc'
+    ) -> Dict[str, Tuple[np.ndarray, float]]:
+        """
+        Cross-Validation aller Kandidaten x Folds in einem Prozess-Pool
         
-        # Log Model Scores
-        mlflow.log_dict(model_scores, "model_comparison.json")
+        Alle (Kandidat, Fold)-Paare teilen sich self.n_jobs Worker. Die Ergebnisse
+        kommen in Submit-Reihenfolge zurück, daher identisch zum sequentiellen Lauf.
+        Die Fold-Matrizen kommen aus dem Fold Cache und werden nicht neu kopiert.
         
-        logger.info(f"Bestes Model: {type(best_model).__name__} (Score: {best_score:.4f})")
+        Args:
+            candidates: (Name, Model, benötigt Skalierung)
+            fold_set: Gecachte Folds des Datasets
+            fold_ids: Nur diese Folds verwenden (Default: alle)
+            train_positions: Optionales Subsample der Trainingszeilen pro Fold
+            scoring: Sklearn Scoring-Name
         
-        return best_model, best_score
+        Returns:
+            Pro Kandidat: Fold-Scores und summierte Wall-Clock-Zeit
+        """
+        fold_ids = list(range(fold_set.n_splits)) if fold_ids is None else fold_ids
+        tasks = [(name, model, needs_scaling, fold_no) for name, model, needs_scaling in candidates for fold_no in fold_ids]
+        
+        def fold_data(needs_scaling: bool, fold_no: int):
+            X_tr, y_tr, X_val, y_val = fold_set.fold(fold_no, scaled=needs_scaling)
+            if train_positions is not None and fold_no in train_positions:
+                positions = train_positions[fold_no]
+                return X_tr[positions], y_tr[positions], X_val, y_val
+            return X_tr, y_tr, X_val, y_val
+        
+        logger.info(f"Starte {len(tasks)} CV-Tasks mit n_jobs={self.n_jobs}")
+        
+        outputs = joblib.Parallel(n_jobs=self.n_jobs)(
+            joblib.delayed(fit_and_score_fold)(clone(model), fold_data(needs_scaling, fold_no), scoring)
+            for _, model, needs_scaling, fold_no in tasks
+        )
+        
+        results = {}
+        for (name, *_), (score, seconds) in zip(tasks, outputs):
+            scores, total_seconds = results.get(name, ([], 0.0))
+            results[name] = (scores + [score], total_seconds + seconds)
+        
+        return {name: (np.array(scores), seconds) for name, (scores, seconds) in results.items()}
+    
+    def _cross_validate_limited(
+        self,
+        candidates: List[Tuple[str, Any, bool]],
+        fold_set: FoldSet,
+        fold_ids: Optional[List[int]],
+        fraction: float,
+        max_fractions: Dict[str, float],
+        scoring: str = 'roc_auc'
+    ) -> Dict[str, Tuple[np.ndarray, float]]:
+        """
+        Cross-Validation mit Datenanteil pro Kandidat, höchstens max_fractions[name]
+        
+        Kandidaten mit gleichem Anteil teilen sich einen Prozess-Pool.
+        """
+        fold_ids = list(range(fold_set.n_splits)) if fold_ids is None else fold_ids
+        groups = {}
+        for candidate in candidates:
+            groups.setdefault(min(fraction, max_fractions.get(candidate[0], 1.0)), []).append(candidate)
+        
+        results = {}
+        for group_fraction, group in groups.items():
+            results.update(self._cross_validate_candidates(
+                group, fold_set, fold_ids,
+                self._subsample_folds(fold_set, fold_ids, group_fraction), scoring
+            ))
+        
+        return results
+    
+    def _successive_halving(
+        self,
+        candidates: List[Tuple[str, Any, bool]],
+        fold_set: FoldSet,
+        max_fractions: Optional[Dict[str, float]] = None,
+        scoring: str = 'roc_auc'
+    ) -> Dict[str, Tuple[np.ndarray, float]]:
+        """
+        Multi-Fidelity Model-Auswahl (Successive Halving)
+        
+        Alle Kandidaten starten auf kleinen Datenanteilen und wenigen Folds, nur das
+        beste 1/eta wird auf das nächste Budget befördert. Die letzte Stufe ist die
+        volle Cross-Validation. Ist time_budget_seconds erreicht, gewinnt die beste
+        Stufe, die noch vollständig lief. max_fractions begrenzt den Datenanteil
+        einzelner Kandidaten (Kostenmodell).
+        
+        Returns:
+            Ergebnisse der höchsten abgeschlossenen Stufe (nur deren Kandidaten)
+        """
+        eta = self.config.get('halving_eta', 3)
+        min_fraction = self.config.get('halving_min_fraction', 1 / 9)
+        time_budget = self.config.get('time_budget_seconds')
+        
+        # Datenanteile pro Stufe, z.B. [1/9, 1/3, 1]
+        fractions = [1.0]
+        while fractions[0] / eta >= min_fraction:
+            fractions.insert(0, fractions[0] / eta)
+        
+        all_folds = list(range(fold_set.n_splits))
+        start = time.perf_counter()
+        survivors = list(candidates)
+        completed = {}
+        rung_log = []
+        
+        for rung, fraction in enumerate(fractions):
+            is_last = rung == len(fractions) - 1
+            rung_folds = all_folds if is_last else all_folds[:min(2, len(all_folds))]
+            
+            # Zeitbudget: nächste Stufe aus der letzten hochrechnen
+            if time_budget is not None and rung_log:
+                elapsed = time.perf_counter() - start
+                previous = rung_log[-1]
+                estimate = previous['seconds'] * (
+                    (fraction / previous['fraction'])
+                    * (len(rung_folds) / previous['folds'])
+                    * (len(survivors) / previous['candidates'])
+                )
+                if elapsed + estimate > time_budget:
+                    logger.info(
+                        f"Zeitbudget {time_budget}s erreicht nach Stufe {rung - 1} "
+                        f"({elapsed:.1f}s, nächste Stufe ~{estimate:.1f}s)"
+                    )
+                    break
+            
+            rung_start = time.perf_counter()
+            rung_results = self._cross_validate_limited(
+                survivors, fold_set, rung_folds, fraction, max_fractions or {}, scoring
+            )
+            rung_seconds = time.perf_counter() - rung_start
+            
+            completed = rung_results
+            rung_scores = {name: float(np.nanmean(scores)) if not np.all(np.isnan(scores)) else -np.inf
+                           for name, (scores, _) in rung_results.items()}
+            rung_log.append({
+                'rung': rung,
+                'fraction': fraction,
+                'folds': len(rung_folds),
+                'candidates': len(survivors),
+                'seconds': rung_seconds,
+                'scores': rung_scores,
+            })
+            logger.info(
+                f"Successive Halving Stufe {rung}: {len(survivors)} Kandidaten, "
+                f"{fraction:.0%} Daten, {len(rung_folds)} Folds, {rung_seconds:.2f}s"
+            )
+            
+            if is_last:
+                break
+            
+            # Top 1/eta befördern (stabile Sortierung -> deterministisch)
+            keep = max(1, int(np.ceil(len(survivors) / eta)))
+            ranked = sorted(survivors, key=lambda c: -rung_scores[c[0]])
+            survivors = ranked[:keep]
+        
+        self.tracker.log_param("automl_strategy", "successive_halving")
+        self.tracker.log_dict({'rungs': rung_log}, "successive_halving.json")
+        
+        return completed
+    
+    def _subsample_folds(
+        self,
+        fold_set: FoldSet,
+        fold_ids: List[int],
+        fraction: float
+    ) -> Optional[Dict[int, np.ndarray]]:
+        """
+        Stratifiziertes Subsampling der Trainingszeilen jedes Folds
+        
+        Returns:
+            Pro Fold die Positionen innerhalb der Fold-Trainingsmatrix (None = alle)
+        """
+        if fraction >= 1.0:
+            return None
+        
+        positions = {}
+        
+        for fold_no in fold_ids:
+            y_tr = fold_set.y[fold_set.folds[fold_no][0]]
+            all_positions = np.arange(len(y_tr))
+            min_rows = len(np.unique(y_tr)) * 2 if fold_set.stratified else 2
+            n_keep = max(int(len(y_tr) * fraction), min_rows)
+            if n_keep >= len(y_tr):
+                continue
+            
+            try:
+                keep, _ = train_test_split(
+                    all_positions, train_size=n_keep, random_state=42,
+                    stratify=y_tr if fold_set.stratified else None
+                )
+            except ValueError:
+                # Zu kleine Klassen für Stratifizierung
+                keep, _ = train_test_split(all_positions, train_size=n_keep, random_state=42)
+            positions[fold_no] = np.sort(keep)
+        
+        return positions
     
     def _train_single_model(
         self,
@@ -332,54 +902,145 @@ class MLTrainer:
         X_train: pd.DataFrame,
         y_train: pd.Series,
         use_hyperopt: bool,
-        cv_folds: int
+        cv_folds: int,
+        fit: bool = True,
+        study_name: Optional[str] = None,
+        task: str = 'classification'
     ) -> Tuple[Any, float]:
         """
         Trainiere ein einzelnes Model
+        
+        Mit fit=False nur Hyperparameter-Suche und CV-Score, Model ungefittet.
+        Mit study_name wird eine bestehende Optuna Study fortgesetzt.
         """
-        logger.info(f"Trainiere {model_type} Model")
+        logger.info(f"Trainiere {model_type} Model ({task})")
         
-        if model_type not in self.algorithms:
-            raise ValueError(f"Unbekannter Model-Typ: {model_type}")
+        algorithms = self._algorithms_for(task)
+        if model_type not in algorithms:
+            raise ValueError(f"Unbekannter Model-Typ für {task}: {model_type}")
         
-        algorithm = self.algorithms[model_type]
+        algorithm = algorithms[model_type]
         
         if use_hyperopt:
             # Hyperparameter Optimierung
+            # Trials mit derselben Metrik wie der CV-Score unten (regression_scoring);
+            # Klassifikation: Default des Optimizers (roc_auc binär, f1_macro multiclass)
             best_params = self.hyperparameter_optimizer.optimize(
-                algorithm, X_train, y_train, model_type, cv_folds
+                algorithm, X_train, y_train, model_type, cv_folds,
+                study_name=study_name, resume=study_name is not None,
+                problem_type='regression' if task == 'regression' else None,
+                scoring=self._scoring(task) if task == 'regression' else None
             )
-            model = algorithm(**best_params)
+            model = self._build_model(algorithm, best_params)
         else:
             # Default Parameter
-            model = algorithm(random_state=42)
+            model = self._build_model(algorithm)
         
-        # Model trainieren
-        if model_type in ['svc', 'logistic_regression']:
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X_train)
-            model.fit(X_scaled, y_train)
-        else:
-            model.fit(X_train, y_train)
+        # Gleiche Folds wie der Optimizer (Fold Cache)
+        fold_set = self.fold_cache.get(X_train, y_train, cv_folds, stratified=task == 'classification')
+        needs_scaling = model_type in SCALED_MODEL_TYPES
         
         # Cross Validation Score
-        cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=42)
-        scores = cross_val_score(model, X_train, y_train, cv=cv, scoring='roc_auc')
-        cv_score = scores.mean()
+        cv_results = self._cross_validate_candidates(
+            [(model_type, self._limit_model_threads(clone(model)), needs_scaling)], fold_set,
+            scoring=self._scoring(task)
+        )
+        cv_score = cv_results[model_type][0].mean()
+        
+        # Model trainieren
+        if fit:
+            model = self._fit_model(model, X_train, y_train, cv_folds)
         
         return model, cv_score
     
+    def _search_model(
+        self,
+        model_type: str,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        use_hyperopt: bool,
+        cv_folds: int,
+        study_name: Optional[str] = None,
+        task: str = 'classification'
+    ) -> Dict[str, Any]:
+        """
+        Stage 'search': Model-Auswahl bzw. Hyperparameter-Suche ohne finales Fit
+        """
+        fit_fraction = 1.0
+        
+        if model_type == 'auto':
+            model, cv_score = self._auto_ml_selection(X_train, y_train, cv_folds, fit=False, task=task)
+            fit_fraction = self.automl_fit_fraction
+        else:
+            model, cv_score = self._train_single_model(
+                model_type, X_train, y_train, use_hyperopt, cv_folds,
+                fit=False, study_name=study_name, task=task
+            )
+        
+        return {'model': model, 'cv_score': float(cv_score), 'fit_fraction': fit_fraction}
+    
+    def _fit_model(
+        self,
+        model: Any,
+        X_train: pd.DataFrame,
+        y_train: pd.Series,
+        cv_folds: int,
+        fraction: float = 1.0
+    ) -> Any:
+        """
+        Stage 'fit': finales Training auf dem Trainings-Set
+        
+        Mit fraction < 1 auf einem (bei Klassifikation stratifizierten) Subsample (Kostenbudget).
+        Skalierte Modelle (SVC, LR, SVR, Ridge) werden als Pipeline mit StandardScaler
+        gefittet, damit Evaluation und Inference rohe Feature-Zeilen übergeben können.
+        """
+        stratified = not is_regressor(model)
+        
+        if isinstance(model, (SVC, LogisticRegression, SVR, Ridge)):
+            model = Pipeline([('scaler', StandardScaler()), ('model', model)])
+        X_fit = X_train
+        y_fit = y_train
+        
+        if fraction < 1.0:
+            positions = np.arange(len(y_train))
+            n_keep = int(len(positions) * fraction)
+            try:
+                keep, _ = train_test_split(
+                    positions, train_size=n_keep, random_state=42,
+                    stratify=y_train if stratified else None
+                )
+            except ValueError:
+                keep, _ = train_test_split(positions, train_size=n_keep, random_state=42)
+            keep = np.sort(keep)
+            
+            X_fit = X_fit.iloc[keep] if isinstance(X_fit, pd.DataFrame) else X_fit[keep]
+            y_fit = y_train.iloc[keep] if isinstance(y_train, pd.Series) else y_train[keep]
+            logger.info(f"Finales Fit auf Subsample: {n_keep} von {len(positions)} Zeilen")
+        
+        model.fit(X_fit, y_fit)
+        
+        return model
+    
     def _save_model(
         self, 
         model: Any, 
         model_type: str, 
-        metrics: Dict[str, float]
+        metrics: Dict[str, float],
+        name: Optional[str] = None,
+        feature_names: Optional[List[str]] = None,
+        lineage: Optional[List[Dict[str, Any]]] = None,
+        profile_rows: Optional[pd.DataFrame] = None
     ) -> Path:
         """
         Speichere trainiertes Model
+        
+        Mit profile_rows (Holdout) werden Tree-Modelle verlustfrei gepackt
+        (gegen identische Predictions verifiziert) und ein Inference Profile
+        gemessen und im Artefakt unter 'inference_profile' abgelegt.
         """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{model_type}_{timestamp}.pkl"
+        # Mit Namen, damit parallele Jobs in derselben Sekunde sich nicht überschreiben
+        filename = f"{name}_{model_type}_{timestamp}.pkl" if name else f"{model_type}_{timestamp}.pkl"
         model_path = self.models_dir / filename
         
         # Model und Metadata speichern
@@ -388,14 +1049,581 @@ class MLTrainer:
             'model_type': model_type,
             'metrics': metrics,
             'timestamp': timestamp,
-            'version': '1.0'
+            'version': '1.0',
+            'feature_names': feature_names,
+            # JSON-Plan, damit die Inference dasselbe Encoding ohne pandas anwenden kann
+            'categorical_encoder': self.categorical_encoder.to_dict() if self.categorical_encoder else None,
+            'lineage': lineage or []
         }
         
+        # Tree-Modelle packen (kleinere Dtypes, ohne Trainings-Attribute)
+        if self.config.get('slim_tree_artifacts', True) and profile_rows is not None:
+            try:
+                slim, report = slim_tree_model(model, profile_rows)
+            except Exception as e:
+                logger.warning(f"Artifact Slimming fehlgeschlagen: {e}")
+                slim, report = model, None
+            if report:
+                model_data['model'] = slim
+                model_data['slimming'] = report
+                self.tracker.log_metrics({
+                    'slim_bytes_before': report['bytes_before'],
+                    'slim_bytes_after': report['bytes_after'],
+                    'slim_load_seconds_before': report['load_seconds_before'],
+                    'slim_load_seconds_after': report['load_seconds_after'],
+                })
+        
+        # Inference-Kosten auf Holdout-Zeilen messen (Latenz, Durchsatz, Größe, Ladezeit, Speicher)
+        try:
+            profile = self.inference_profiler.profile(model_data, profile_rows)
+        except Exception as e:
+            logger.warning(f"Inference Profile fehlgeschlagen: {e}")
+            profile = None
+        model_data['inference_profile'] = profile
+        
+        if profile:
+            self.tracker.log_metrics({
+                f"inference_{key}": value for key, value in profile.items()
+                if key not in ('version', 'measured_at', 'single_row_rows', 'batch_rows') and value is not None
+            })
+        
         joblib.dump(model_data, model_path)
         logger.info(f"Model gespeichert: {model_path}")
         
         return model_path
     
+    def update_model(
+        self,
+        model_path: str,
+        new_data: pd.DataFrame,
+        target_column: str,
+        replay_data: Optional[pd.DataFrame] = None,
+        replay_ratio: Optional[float] = None,
+        n_new_estimators: Optional[int] = None,
+        run_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Inkrementelles Update eines gespeicherten Models mit neuen Spielen
+        
+        Statt eines kompletten AutoML-Zyklus wird das bestehende Model
+        weitertrainiert: zusätzliche Boosting-Runden (xgboost/lightgbm),
+        warm_start Bäume/Stages (Random Forest/Gradient Boosting) oder
+        partial_fit. Encoding und Feature-Reihenfolge kommen aus dem Artefakt.
+        
+        Args:
+            model_path: Pfad zum bisherigen Model-Artefakt
+            new_data: Neue Rohdaten (nur die neuen Zeilen)
+            target_column: Name der Ziel-Variable
+            replay_data: Ältere Rohdaten, aus denen eine Replay-Stichprobe gezogen wird
+                (nur im Update, der Holdout besteht aus neuen Zeilen)
+            replay_ratio: Replay-Zeilen relativ zur Anzahl neuer Zeilen
+            n_new_estimators: Zusätzliche Bäume bzw. Boosting-Runden
+            run_name: Name des MLflow Runs
+            
+        Returns:
+            Update-Ergebnisse inkl. neuem model_path und Lineage
+        """
+        artifact = self.load_model(model_path)
+        model = artifact['model']
+        strategy = self._update_strategy(model)
+        
+        replay_ratio = self.config.get('update_replay_ratio', 0.5) if replay_ratio is None else replay_ratio
+        n_new_estimators = n_new_estimators or self.config.get('update_new_estimators', 50)
+        
+        # Neue Zeilen + optionale Replay-Stichprobe aus alten Daten
+        data = new_data
+        replay_rows = 0
+        if replay_data is not None and replay_ratio > 0 and len(replay_data) > 0:
+            replay_rows = min(len(replay_data), int(len(new_data) * replay_ratio))
+            replay_sample = replay_data.sample(n=replay_rows, random_state=self.config.get('random_state', 42))
+            data = pd.concat([new_data, replay_sample], ignore_index=True)
+        
+        encoder_plan = None
+        if artifact.get('categorical_encoder'):
+            encoder_plan = CategoricalEncoderPlan.from_dict(artifact['categorical_encoder'])
+        
+        X, y = self._preprocess_data(data, target_column, encoder_plan=encoder_plan)
+        
+        feature_names = artifact.get('feature_names') or X.columns.tolist()
+        X = X.reindex(columns=feature_names, fill_value=0)
+        
+        # Holdout nur aus den neuen Zeilen (Positionen vor der Replay-Stichprobe),
+        # Replay-Zeilen gehen ausschließlich ins Update
+        y = pd.Series(np.asarray(y))
+        new_positions = np.arange(len(new_data))
+        replay_positions = np.arange(len(new_data), len(X))
+        holdout_size = self.config.get('test_size', 0.2)
+        can_evaluate = len(new_data) * holdout_size >= self.config.get('update_min_holdout', 20)
+        if can_evaluate:
+            update_positions, holdout_positions = train_test_split(
+                new_positions, test_size=holdout_size, random_state=self.config.get('random_state', 42)
+            )
+            X_holdout, y_holdout = X.iloc[holdout_positions], y.iloc[holdout_positions]
+            metrics_before = self.model_evaluator.evaluate_model(
+                model, X_holdout, y_holdout, include_plots=False
+            )['basic_metrics']
+        else:
+            update_positions = new_positions
+            metrics_before = None
+        
+        update_positions = np.concatenate([np.sort(update_positions), replay_positions])
+        X_update, y_update = X.iloc[update_positions], y.iloc[update_positions]
+        
+        with mlflow.start_run(run_name=run_name):
+            self.tracker.log_param("update_strategy", strategy)
+            self.tracker.log_param("parent_model", str(model_path))
+            self.tracker.log_param("new_rows", len(new_data))
+            self.tracker.log_param("replay_rows", replay_rows)
+            
+            start = time.perf_counter()
+            added = self._apply_incremental_update(model, strategy, X_update, y_update, n_new_estimators)
+            update_seconds = time.perf_counter() - start
+            
+            self.tracker.log_metric("update_seconds", update_seconds)
+            
+            metrics_after = None
+            if can_evaluate:
+                metrics_after = self.model_evaluator.evaluate_model(
+                    model, X_holdout, y_holdout, include_plots=False
+                )['basic_metrics']
+                for metric, value in metrics_after.items():
+                    if isinstance(value, (int, float, np.number)):
+                        self.tracker.log_metric(metric, value)
+            
+            lineage = list(artifact.get('lineage') or [])
+            lineage.append({
+                'parent': str(model_path),
+                'parent_timestamp': artifact.get('timestamp'),
+                'updated_at': datetime.now().isoformat(),
+                'strategy': strategy,
+                'new_rows': len(new_data),
+                'replay_rows': replay_rows,
+                'added_estimators': added,
+                'update_seconds': update_seconds,
+                'metrics_before': metrics_before,
+                'metrics_after': metrics_after,
+            })
+            
+            new_path = self._save_model(
+                model, artifact.get('model_type', type(model).__name__),
+                metrics_after or artifact.get('metrics', {}),
+                name=run_name or 'update', feature_names=feature_names, lineage=lineage,
+                profile_rows=X_holdout if can_evaluate else X_update
+            )
+            self.tracker.log_artifact(str(new_path))
+            self.tracker.log_dict({'lineage': lineage}, "lineage.json")
+        
+        logger.info(
+            f"Inkrementelles Update ({strategy}) in {update_seconds:.2f}s: "
+            f"{len(new_data)} neue + {replay_rows} Replay-Zeilen -> {new_path}"
+        )
+        
+        return {
+            'model': model,
+            'model_path': new_path,
+            'strategy': strategy,
+            'update_seconds': update_seconds,
+            'metrics_before': metrics_before,
+            'metrics_after': metrics_after,
+            'lineage': lineage
+        }
+    
+    def _update_strategy(self, model: Any) -> str:
+        """
+        Bestimme, wie ein Model inkrementell weitertrainiert werden kann
+        """
+        if isinstance(model, xgb.XGBModel):
+            return 'xgboost_continue'
+        if isinstance(model, lgb.LGBMModel):
+            return 'lightgbm_continue'
+        if isinstance(model, (
+            RandomForestClassifier, GradientBoostingClassifier, HistGradientBoostingClassifier,
+            RandomForestRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor
+        )):
+            return 'warm_start'
+        if hasattr(model, 'partial_fit'):
+            return 'partial_fit'
+        
+        raise ValueError(
+            f"{type(model).__name__} unterstützt kein inkrementelles Update, bitte train_model verwenden"
+        )
+    
+    def _apply_incremental_update(
+        self,
+        model: Any,
+        strategy: str,
+        X: pd.DataFrame,
+        y: Any,
+        n_new_estimators: int
+    ) -> int:
+        """
+        Trainiere das Model in-place weiter
+        
+        Returns:
+            Anzahl hinzugefügter Bäume/Runden (0 bei partial_fit)
+        """
+        if strategy == 'xgboost_continue':
+            booster = model.get_booster()
+            model.set_params(n_estimators=n_new_estimators)
+            model.fit(X, y, xgb_model=booster)
+            return n_new_estimators
+        
+        if strategy == 'lightgbm_continue':
+            booster = model.booster_
+            model.set_params(n_estimators=n_new_estimators)
+            model.fit(X, y, init_model=booster)
+            return n_new_estimators
+        
+        if strategy == 'warm_start':
+            # Bestehende Bäume/Stages bleiben, neue werden nur auf X gefittet
+            # (Histogram-Boosting zählt Iterationen über max_iter)
+            n_param = 'max_iter' if 'max_iter' in model.get_params() else 'n_estimators'
+            model.set_params(warm_start=True, **{n_param: model.get_params()[n_param] + n_new_estimators})
+            model.fit(X, y)
+            return n_new_estimators
+        
+        model.partial_fit(X, y)
+        return 0
+    
+    def prune_model(
+        self,
+        model_path: str,
+        validation_data: pd.DataFrame,
+        target_column: str,
+        tolerance: Optional[float] = None,
+        run_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Post-Training Pruning eines gespeicherten Ensembles
+        
+        Sucht das schnellste Sub-Ensemble (weniger Bäume/Boosting-Runden,
+        bei Forests zusätzlich Depth Caps), dessen Validierungs-Score
+        höchstens um tolerance (relativ) unter dem vollen Model liegt, und
+        speichert es als eigenes Artefakt. Das Original bleibt unverändert.
+        
+        Args:
+            model_path: Pfad zum Model-Artefakt
+            validation_data: Rohdaten, die nicht im Training waren
+            target_column: Name der Ziel-Variable
+            tolerance: Relativer erlaubter Score-Verlust (Default: prune_tolerance)
+            run_name: Name des MLflow Runs
+            
+        Returns:
+            Pruning-Ergebnisse inkl. neuem model_path (None ohne passenden Kandidaten) und Report
+        """
+        artifact = self.load_model(model_path)
+        model = artifact['model']
+        
+        encoder_plan = None
+        if artifact.get('categorical_encoder'):
+            encoder_plan = CategoricalEncoderPlan.from_dict(artifact['categorical_encoder'])
+        
+        X, y = self._preprocess_data(validation_data, target_column, encoder_plan=encoder_plan)
+        
+        feature_names = artifact.get('feature_names') or X.columns.tolist()
+        X = X.reindex(columns=feature_names, fill_value=0)
+        
+        if is_regressor(model):
+            scoring = self._scoring('regression')
+        else:
+            scoring = 'roc_auc' if len(model.classes_) == 2 else 'accuracy'
+        
+        # Auswahl und Report auf getrennten Hälften, damit der Report nicht auf die Suche overfittet
+        X_search, X_check, y_search, y_check = train_test_split(
+            X, y, test_size=0.5, random_state=self.config.get('random_state', 42),
+            stratify=None if is_regressor(model) else y
+        )
+        
+        with mlflow.start_run(run_name=run_name):
+            self.tracker.log_param("parent_model", str(model_path))
+            self.tracker.log_param("prune_scoring", scoring)
+            
+            pruned, report = self.model_pruner.prune(
+                model, X_search.to_numpy(dtype=np.float64), y_search,
+                X_check.to_numpy(dtype=np.float64), y_check, scoring, tolerance=tolerance
+            )
+            
+            if report is None or not report['accepted']:
+                return {'model': model, 'model_path': None, 'report': report}
+            
+            self.tracker.log_metrics({
+                f"prune_{key}": value for key, value in report.items()
+                if isinstance(value, (int, float)) and not isinstance(value, bool)
+            })
+            
+            metrics = self.model_evaluator.evaluate_model(
+                pruned, X_check, y_check, include_plots=False
+            )['basic_metrics']
+            
+            lineage = list(artifact.get('lineage') or [])
+            lineage.append({
+                'parent': str(model_path),
+                'parent_timestamp': artifact.get('timestamp'),
+                'updated_at': datetime.now().isoformat(),
+                'strategy': 'pruning',
+                **{key: value for key, value in report.items() if key != 'candidates'},
+            })
+            
+            new_path = self._save_model(
+                pruned, artifact.get('model_type', type(model).__name__), metrics,
+                name=run_name or 'pruned', feature_names=feature_names, lineage=lineage,
+                profile_rows=X_check
+            )
+            self.tracker.log_artifact(str(new_path))
+            self.tracker.log_dict(report, "pruning.json")
+        
+        return {
+            'model': pruned,
+            'model_path': new_path,
+            'report': report,
+            'lineage': lineage
+        }
+    
+    def distill_model(
+        self,
+        model_path: str,
+        data: pd.DataFrame,
+        target_column: str,
+        students: Optional[List[str]] = None,
+        run_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Knowledge Distillation eines gespeicherten Models in kompakte Students
+        
+        Die Students (z.B. flaches Histogram-Boosting, logistische Regression)
+        lernen die Teacher-Wahrscheinlichkeiten auf echten und augmentierten
+        Feature-Zeilen. Jeder Student wird als reguläres Artefakt gespeichert
+        (gleiches Encoding und Feature-Reihenfolge, nutzbar mit predict.py),
+        mit Agreement- und Kalibrierungs-Report gegen den Teacher.
+        
+        Args:
+            model_path: Pfad zum Teacher-Artefakt
+            data: Rohdaten (Labels nur für den Holdout-Report benötigt)
+            target_column: Name der Ziel-Variable
+            students: Student-Typen (Default: distill_students)
+            run_name: Name des MLflow Runs
+            
+        Returns:
+            Pro Student: model, model_path, report
+        """
+        artifact = self.load_model(model_path)
+        teacher = artifact['model']
+        
+        encoder_plan = None
+        if artifact.get('categorical_encoder'):
+            encoder_plan = CategoricalEncoderPlan.from_dict(artifact['categorical_encoder'])
+        
+        X, y = self._preprocess_data(data, target_column, encoder_plan=encoder_plan)
+        
+        feature_names = artifact.get('feature_names') or X.columns.tolist()
+        X = X.reindex(columns=feature_names, fill_value=0)
+        
+        X_train, X_holdout, _, y_holdout = train_test_split(
+            X, y, test_size=self.config.get('test_size', 0.2),
+            random_state=self.config.get('random_state', 42),
+            stratify=None if is_regressor(teacher) else y
+        )
+        
+        teacher_profile = artifact.get('inference_profile') or {}
+        results = {}
+        
+        with mlflow.start_run(run_name=run_name or 'distillation'):
+            self.tracker.log_param("teacher_model", str(model_path))
+            
+            distilled = self.model_distiller.distill(teacher, X_train, X_holdout, y_holdout, students=students)
+            
+            for name, student, report in distilled:
+                with mlflow.start_run(run_name=f"student_{name}", nested=True):
+                    self.tracker.log_param("student", name)
+                    self.tracker.log_metrics({
+                        f"distill_{key}": value for key, value in report.items()
+                        if isinstance(value, (int, float))
+                    })
+                    
+                    metrics = self.model_evaluator.evaluate_model(
+                        student, X_holdout, y_holdout, include_plots=False
+                    )['basic_metrics']
+                    
+                    lineage = list(artifact.get('lineage') or [])
+                    lineage.append({
+                        'parent': str(model_path),
+                        'parent_timestamp': artifact.get('timestamp'),
+                        'updated_at': datetime.now().isoformat(),
+                        'strategy': 'distillation',
+                        'student': name,
+                        **report,
+                    })
+                    
+                    student_path = self._save_model(
+                        student, f"{name}_student", metrics,
+                        name=run_name or 'student', feature_names=feature_names, lineage=lineage,
+                        profile_rows=X_holdout
+                    )
+                    
+                    # Latenz-Vergleich aus den Inference Profiles
+                    student_profile = self.load_model(student_path).get('inference_profile') or {}
+                    for key in ('single_row_p50_ms', 'single_row_p99_ms', 'batch_latency_ms'):
+                        if key in teacher_profile and key in student_profile:
+                            report[f"teacher_{key}"] = teacher_profile[key]
+                            report[f"student_{key}"] = student_profile[key]
+                    
+                    self.tracker.log_artifact(str(student_path))
+                    self.tracker.log_dict(report, "distillation.json")
+                
+                results[name] = {'model': student, 'model_path': student_path, 'report': report}
+            
+            self.tracker.log_dict(
+                {name: result['report'] for name, result in results.items()}, "distillation.json"
+            )
+        
+        return results
+    
+    def train_group_models(
+        self,
+        data: pd.DataFrame,
+        target_column: str,
+        group_column: str,
+        store_path: Optional[str] = None,
+        task: str = 'auto',
+        run_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Bulk Training eines kleinen Models pro Gruppe (z.B. pro Team oder Spieler)
+        
+        Preprocessing und Tuning laufen einmal für alle Gruppen (ein
+        Encoding-Plan, eine getunte Konfiguration pro Model-Familie), ohne
+        Feature Selection und ohne MLflow Run pro Gruppe. Die Gruppen werden
+        blockweise über Worker-Prozesse trainiert und in einen einzigen
+        SQLite-Store mit Index auf der Gruppe geschrieben.
+        
+        Args:
+            data: Rohdaten aller Gruppen
+            target_column: Name der Ziel-Variable
+            group_column: Spalte mit dem Gruppen-Key (wird kein Feature)
+            store_path: Ziel-Datei (Default: models_dir/{run_name}_{group_column}.sqlite)
+            task: 'classification', 'regression' oder 'auto'
+            run_name: Name des MLflow Runs
+            
+        Returns:
+            Store-Pfad, gewählte Familie/Parameter und Status pro Gruppe
+        """
+        start = time.perf_counter()
+        
+        group_keys = data[group_column].astype(str).to_numpy()
+        # drop() kopiert bereits
+        X, y = self._preprocess_data(data.drop(columns=[group_column]), target_column, copy=False)
+        y = pd.Series(y)
+        if task == 'auto':
+            task = self._determine_task(y)
+        scoring = self._scoring(task)
+        
+        X_values = X.to_numpy(dtype=np.float64)
+        y_values = y.to_numpy()
+        
+        # Einmal sortieren, jede Gruppe ist danach ein zusammenhängender Block
+        order, _, slices = group_slices(group_keys)
+        X_sorted, y_sorted = X_values[order], y_values[order]
+        datasets = [
+            (key, X_sorted[begin:end], y_sorted[begin:end])
+            for key, begin, end in slices if end - begin >= self.group_trainer.min_rows
+        ]
+        skipped = len(slices) - len(datasets)
+        
+        if not datasets:
+            raise ValueError(f"Keine Gruppe mit mindestens {self.group_trainer.min_rows} Zeilen")
+        
+        store_path = Path(store_path or self.models_dir / f"{run_name or 'groups'}_{group_column}.sqlite")
+        # Neuer Store in einer Temp-Datei, ersetzt den alten erst nach erfolgreichem Training,
+        # damit keine Gruppen eines früheren Runs unter der neuen Metadata liegen bleiben
+        build_path = store_path.with_name(store_path.name + '.tmp')
+        build_path.unlink(missing_ok=True)
+        store = GroupModelStore(build_path)
+        limits = self._batch_job_limits()
+        
+        logger.info(
+            f"Gruppen-Training: {len(datasets)} Gruppen ({skipped} mit < {self.group_trainer.min_rows} Zeilen "
+            f"übersprungen), {limits['max_workers']} Worker"
+        )
+        
+        with mlflow.start_run(run_name=run_name or 'group_training'):
+            self.tracker.log_params({
+                'group_column': group_column,
+                'task': task,
+                'groups': len(datasets),
+                'skipped_groups': skipped,
+            })
+            
+            try:
+                with self.group_trainer.executor(limits['max_workers'], limits['threads']) as executor:
+                    tuning_start = time.perf_counter()
+                    family, params, tuning = self.group_trainer.tune(
+                        executor, [(X_g, y_g) for _, X_g, y_g in datasets], task, scoring
+                    )
+                    tuning_seconds = time.perf_counter() - tuning_start
+                    
+                    store.set_metadata({
+                        'group_column': group_column,
+                        'target_column': target_column,
+                        'task': task,
+                        'family': family,
+                        'params': params,
+                        'feature_names': X.columns.tolist(),
+                        'categorical_encoder': self.categorical_encoder.to_dict() if self.categorical_encoder else None,
+                    })
+                    
+                    results = self.group_trainer.train(
+                        executor, datasets, family, params, task, scoring, on_chunk=store.put_many
+                    )
+            finally:
+                store.close()
+            
+            os.replace(build_path, store_path)
+            
+            total_seconds = time.perf_counter() - start
+            failed = [result for result in results if result['status'] != 'ok']
+            holdout_key = f"holdout_{scoring}"
+            holdout_scores = [
+                result['metrics'][holdout_key] for result in results
+                if result['status'] == 'ok' and result['metrics'].get(holdout_key) is not None
+            ]
+            
+            self.tracker.log_param('family', family)
+            self.tracker.log_params({f"param_{key}": value for key, value in params.items()})
+            self.tracker.log_metrics({
+                'trained_groups': len(results) - len(failed),
+                'failed_groups': len(failed),
+                'tuning_seconds': tuning_seconds,
+                'total_seconds': total_seconds,
+                **({f"median_{holdout_key}": float(np.median(holdout_scores))} if holdout_scores else {}),
+            })
+            self.tracker.log_dict({'tuning': tuning, 'failed': failed}, "group_training.json")
+        
+        logger.info(
+            f"Gruppen-Training abgeschlossen: {len(results) - len(failed)} Modelle, "
+            f"{len(failed)} fehlgeschlagen, {total_seconds:.1f}s -> {store_path}"
+        )
+        
+        return {
+            'store_path': store_path,
+            'task': task,
+            'family': family,
+            'params': params,
+            'tuning': tuning,
+            'groups': results,
+            'skipped_groups': skipped,
+            'total_seconds': total_seconds
+        }
+    
+    def load_group_model(self, store_path: str, group_key: Any) -> Dict[str, Any]:
+        """
+        Lade das Model einer Gruppe aus einem Gruppen-Store
+        """
+        store = GroupModelStore(store_path)
+        try:
+            return store.load(group_key)
+        finally:
+            store.close()
+    
     def batch_training(
         self, 
         datasets: List[Dict[str, Any]],
@@ -404,15 +1632,23 @@ class MLTrainer:
         """
         Batch Training für multiple Datasets/Models
         
+        Bei parallel=True läuft jedes Dataset in einem eigenen Prozess (spawn)
+        mit Thread- und Memory-Limit und eigenem MLflow Run. Ein Absturz oder
+        OOM eines Jobs beendet nur diesen Job. Die Ergebnisse enthalten dann
+        statt des Model-Objekts nur 'model_path' (load_model zum Laden).
+        
         Args:
             datasets: Liste von Dataset-Configs
             parallel: Parallele Ausführung
             
         Returns:
-            Training-Ergebnisse
+            Training-Ergebnisse (Reihenfolge wie datasets)
         """
         logger.info(f"Starte Batch Training für {len(datasets)} Datasets")
         
+        if parallel and len(datasets) > 1:
+            return self._parallel_batch_training(datasets)
+        
         results = []
         
         for i, dataset_config in enumerate(datasets):
@@ -429,6 +1665,127 @@ class MLTrainer:
         
         return results
     
+    def _batch_job_limits(self) -> Dict[str, Any]:
+        """
+        Limits pro Batch-Job und Anzahl gleichzeitiger Jobs
+        """
+        threads = max(1, int(self.config.get('batch_job_threads', 1)))
+        max_workers = self.config.get('batch_max_workers') or max(1, (os.cpu_count() or 1) // threads)
+        
+        return {
+            'threads': threads,
+            'memory_mb': self.config.get('batch_job_memory_mb'),
+            'cpu_seconds': self.config.get('batch_job_cpu_seconds'),
+            'max_workers': int(max_workers),
+        }
+    
+    def _parallel_batch_training(self, datasets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Trainiere Datasets in isolierten Worker-Prozessen
+        """
+        limits = self._batch_job_limits()
+        context = multiprocessing.get_context('spawn')
+        result_queue = context.Queue()
+        
+        pending = list(enumerate(datasets))
+        running = {}
+        results = [None] * len(datasets)
+        report = [None] * len(datasets)
+        last_progress = None
+        
+        logger.info(
+            f"Parallel Batch Training: {limits['max_workers']} Worker, "
+            f"{limits['threads']} Threads/Job, Memory-Limit {limits['memory_mb'] or '-'} MB"
+        )
+        
+        def collect(timeout: float):
+            try:
+                job_id, payload = result_queue.get(timeout=timeout)
+            except Empty:
+                return
+            results[job_id] = payload
+        
+        while pending or running:
+            # Freie Slots auffüllen
+            while pending and len(running) < limits['max_workers']:
+                job_id, dataset_config = pending.pop(0)
+                process = context.Process(
+                    target=_batch_training_worker,
+                    args=(job_id, self.config, dataset_config, limits, result_queue),
+                    name=f"batch_job_{job_id + 1}"
+                )
+                process.start()
+                running[job_id] = (process, time.monotonic())
+            
+            collect(timeout=0.5)
+            
+            for job_id, (process, started) in list(running.items()):
+                if process.is_alive():
+                    continue
+                
+                process.join()
+                # Ergebnis kann noch in der Queue stecken, wenn der Prozess schon beendet ist
+                deadline = time.monotonic() + 2.0
+                while results[job_id] is None and time.monotonic() < deadline:
+                    collect(timeout=0.1)
+                
+                if results[job_id] is None:
+                    results[job_id] = {
+                        'status': _exit_status(process.exitcode),
+                        'error': f"Worker-Prozess beendet mit Exit-Code {process.exitcode}",
+                    }
+                
+                results[job_id].setdefault('duration_seconds', time.monotonic() - started)
+                report[job_id] = {
+                    'job': job_id + 1,
+                    'status': results[job_id]['status'],
+                    'exit_code': process.exitcode,
+                    'duration_seconds': round(results[job_id]['duration_seconds'], 2),
+                    'peak_rss_mb': results[job_id].get('peak_rss_mb'),
+                    'cv_score': results[job_id].get('cv_score'),
+                    'model_path': str(results[job_id].get('model_path', '')) or None,
+                    'error': results[job_id].get('error'),
+                }
+                del running[job_id]
+                
+                if results[job_id]['status'] != 'ok':
+                    logger.error(f"Batch Job {job_id + 1} fehlgeschlagen ({results[job_id]['status']}): {results[job_id].get('error')}")
+            
+            done = sum(entry is not None for entry in report)
+            progress = (done, len(running))
+            if progress != last_progress:
+                failed = sum(entry is not None and entry['status'] != 'ok' for entry in report)
+                logger.info(
+                    f"Batch Training Fortschritt: {done}/{len(datasets)} fertig "
+                    f"({failed} fehlgeschlagen), {len(running)} laufend"
+                )
+                last_progress = progress
+        
+        result_queue.close()
+        
+        summary = {
+            'jobs': report,
+            'succeeded': sum(entry['status'] == 'ok' for entry in report),
+            'failed': sum(entry['status'] != 'ok' for entry in report),
+            'limits': limits,
+        }
+        report_path = self.models_dir / 'batch_training_report.json'
+        with open(report_path, 'w') as f:
+            json.dump(summary, f, indent=2, default=str)
+        self.last_batch_report = summary
+        
+        # Erfolgreiche Jobs in die History übernehmen
+        for result in results:
+            if result.get('status') == 'ok' and 'training_record' in result:
+                self.training_history.append(result['training_record'])
+        
+        logger.info(
+            f"Batch Training abgeschlossen. {summary['succeeded']} Modelle trainiert, "
+            f"{summary['failed']} fehlgeschlagen (Report: {report_path})"
+        )
+        
+        return results
+    
     def get_training_history(self) -> List[Dict[str, Any]]:
         """
         Gebe Training History zurück
@@ -440,9 +1797,86 @@ class MLTrainer:
         Lade ein gespeichertes Model
         """
         model_data = joblib.load(model_path)
+        model_data['model'] = restore_model(model_data['model'])
         logger.info(f"Model geladen: {model_path}")
         return model_data
 
+def _exit_status(exitcode: Optional[int]) -> str:
+    """
+    Status eines Worker-Prozesses ohne Ergebnis anhand des Exit-Codes
+    """
+    if exitcode == -9:
+        # SIGKILL, typischerweise der OOM-Killer
+        return 'out_of_memory'
+    if exitcode == -24:
+        # SIGXCPU durch RLIMIT_CPU
+        return 'cpu_limit_exceeded'
+    return 'crashed'
+
+
+def _apply_job_limits(limits: Dict[str, Any]):
+    """
+    Setze Memory- und CPU-Zeit-Limits für den aktuellen Worker-Prozess
+    """
+    try:
+        import resource
+    except ImportError:
+        logger.warning("resource-Modul nicht verfügbar, Job-Limits werden ignoriert")
+        return
+    
+    if limits.get('memory_mb'):
+        limit_bytes = int(limits['memory_mb']) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+    
+    if limits.get('cpu_seconds'):
+        cpu_seconds = int(limits['cpu_seconds'])
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 5))
+
+
+def _batch_training_worker(
+    job_id: int,
+    config: Dict[str, Any],
+    dataset_config: Dict[str, Any],
+    limits: Dict[str, Any],
+    result_queue: Any
+):
+    """
+    Einstiegspunkt eines Batch-Jobs im Worker-Prozess
+    """
+    from threadpoolctl import threadpool_limits
+    
+    started = time.monotonic()
+    
+    try:
+        _apply_job_limits(limits)
+        
+        # BLAS/OpenMP und joblib auf das Thread-Budget des Jobs begrenzen
+        with threadpool_limits(limits=limits['threads']):
+            trainer = MLTrainer({**config, 'n_jobs': limits['threads']})
+            result = trainer.train_model(
+                **{'run_name': f"batch_job_{job_id + 1}", **dataset_config}
+            )
+            # atexit läuft in multiprocessing-Workern nicht, daher explizit
+            trainer.tracker.close()
+        
+        # Model bleibt auf der Platte, nur Pfad und Metriken zurückgeben
+        result.pop('model', None)
+        payload = {'status': 'ok', **result}
+    except MemoryError:
+        payload = {'status': 'out_of_memory', 'error': 'MemoryError'}
+    except Exception as e:
+        payload = {'status': 'failed', 'error': str(e)}
+    
+    try:
+        import resource
+        payload['peak_rss_mb'] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    except ImportError:
+        pass
+    
+    payload['duration_seconds'] = time.monotonic() - started
+    result_queue.put((job_id, payload))
+
+
 # Beispiel-Config
 DEFAULT_CONFIG = {
     'models_dir': 'models',
@@ -451,6 +1885,46 @@ DEFAULT_CONFIG = {
     'optuna_storage': 'sqlite:///basketball_optuna.db',
     'n_trials': 100,
     'cv_folds': 5,
+    'n_jobs': -1,
+    'automl_strategy': 'full_cv',  # oder 'successive_halving'
+    'time_budget_seconds': None,
+    'hist_gradient_boosting_min_rows': 10000,
+    'regression_scoring': 'r2',  # oder 'neg_mean_absolute_error'
+    'candidate_time_budget_seconds': 600,  # CV + finales Fit pro AutoML-Kandidat
+    'candidate_memory_budget_mb': None,
+    'cost_probe_rows': [250, 1000],
+    'cost_min_subsample_rows': 1000,
+    'batch_max_workers': None,  # None = CPU-Kerne / batch_job_threads
+    'batch_job_threads': 1,
+    'batch_job_memory_mb': None,
+    'batch_job_cpu_seconds': None,
+    'csv_chunk_size': 50000,
+    'category_max_ratio': 0.5,
+    'dataset_cache_enabled': True,
+    'dataset_cache_max_entries': 20,
+    'max_onehot_categories': 10,
+    'encoded_dtype': 'float32',
+    'update_new_estimators': 50,
+    'update_replay_ratio': 0.5,
+    'mlflow_async_logging': True,
+    'mlflow_flush_interval': 2.0,
+    'checkpoint_training': False,
+    'inference_profile_enabled': True,
+    'slim_tree_artifacts': True,
+    'profile_single_rows': 200,
+    'profile_batch_rows': 1000,
+    'prune_tolerance': 0.002,  # relativer Score-Verlust für prune_model
+    'prune_depth_caps': [4, 6, 8, 12],
+    'distill_students': ['logistic_regression', 'hist_gradient_boosting'],
+    'distill_augment_ratio': 1.0,  # augmentierte Zeilen je echter Zeile
+    'distill_augment_noise': 0.1,
+    'group_model_families': ['linear', 'random_forest'],
+    'group_min_rows': 20,
+    'group_tuning_groups': 30,  # Stichprobe für das geteilte Tuning
+    'group_chunk_size': 100,  # Gruppen pro Worker-Task
+    'group_holdout_size': 0.2,  # None = ohne Holdout-Score pro Gruppe
+    'group_family_tolerance': 0.01,
+    'keep_checkpoints': False,
     'test_size': 0.2,
     'random_state': 42
 }
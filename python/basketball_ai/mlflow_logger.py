@@ -0,0 +1,420 @@
+"""
+Asynchrones MLflow Logging für Basketball Analytics
+Gebündeltes Logging von Params, Metrics und Artifacts in einem Hintergrund-Thread
+"""
+
+import atexit
+import json
+import logging
+import math
+import os
+import queue
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+import mlflow
+import requests
+from mlflow.entities import Metric, Param
+from mlflow.exceptions import MlflowException
+from mlflow.tracking import MlflowClient
+
+logger = logging.getLogger(__name__)
+
+# Limits von MlflowClient.log_batch
+MAX_PARAMS_PER_BATCH = 100
+MAX_METRICS_PER_BATCH = 1000
+
+# Fehlercodes, bei denen ein erneuter Schreibversuch sinnvoll ist
+TRANSIENT_ERROR_CODES = {
+    'TEMPORARILY_UNAVAILABLE', 'INTERNAL_ERROR', 'DEADLINE_EXCEEDED',
+    'RESOURCE_EXHAUSTED', 'REQUEST_LIMIT_EXCEEDED', 'ABORTED'
+}
+
+# Queue-Marker: sofort schreiben statt bis flush_interval zu sammeln
+_FLUSH_NOW = object()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Prüfen, ob ein Schreibfehler vorübergehend ist und wiederholt werden sollte
+    """
+    if 'database is locked' in str(error):
+        return True
+    if isinstance(error, MlflowException):
+        return error.error_code in TRANSIENT_ERROR_CODES or error.get_http_status_code() >= 500
+    return isinstance(error, (ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout))
+
+
+class AsyncMLflowLogger:
+    """
+    Logging-Queue für MLflow mit Batch-Flush im Hintergrund
+
+    Jeder Eintrag wird vor dem Einreihen in ein Journal (JSON Lines,
+    eine Datei pro Prozess) geschrieben. Nach einem Absturz werden nicht
+    bestätigte Einträge beim nächsten Start nachgeliefert (at-least-once).
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Async MLflow Logger
+
+        Args:
+            config: Konfiguration (mlflow_flush_interval, mlflow_journal_dir, mlflow_async_logging)
+        """
+        self.enabled = config.get('mlflow_async_logging', True)
+        self.experiment_name = config.get('experiment_name', 'BasketballAI')
+        self.flush_interval = config.get('mlflow_flush_interval', 2.0)
+        self.max_retries = config.get('mlflow_flush_retries', 5)
+        self.journal_dir = Path(config.get(
+            'mlflow_journal_dir',
+            Path(config.get('models_dir', 'models')) / 'mlflow_journal'
+        ))
+
+        self.client = MlflowClient()
+        self._queue = queue.Queue()
+        self._pending = 0
+        self._failed = 0
+        # Schützt Journal, Sequenznummer und Zähler (Aufrufer- und Flush-Thread)
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._seq = 0
+        self._journal = None
+        self._thread = None
+        self._closed = False
+
+        self.stats = {'enqueued': 0, 'flushed': 0, 'batches': 0, 'errors': 0, 'dropped': 0, 'replayed': 0}
+
+        if self.enabled:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            self.journal_path = self.journal_dir / f"{os.getpid()}_{int(time.time() * 1000)}.jsonl"
+            self._journal = open(self.journal_path, 'a', buffering=1)
+
+            self._thread = threading.Thread(target=self._run, name='mlflow-logger', daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+            self._replay_journals()
+
+    # Öffentliche API (Signaturen wie mlflow.log_*)
+
+    def log_param(self, key: str, value: Any, run_id: Optional[str] = None):
+        self._submit({'op': 'param', 'key': key, 'value': str(value)}, run_id)
+
+    def log_params(self, params: Dict[str, Any], run_id: Optional[str] = None):
+        for key, value in params.items():
+            self.log_param(key, value, run_id)
+
+    def log_metric(self, key: str, value: float, step: Optional[int] = None, run_id: Optional[str] = None):
+        self._submit({
+            'op': 'metric', 'key': key, 'value': float(value),
+            'step': step or 0, 'timestamp': int(time.time() * 1000)
+        }, run_id)
+
+    def log_metrics(self, metrics: Dict[str, float], step: Optional[int] = None, run_id: Optional[str] = None):
+        for key, value in metrics.items():
+            self.log_metric(key, value, step, run_id)
+
+    def log_dict(self, dictionary: Dict[str, Any], artifact_file: str, run_id: Optional[str] = None):
+        # Als JSON-Text, damit der Inhalt zum Zeitpunkt des Aufrufs ins Journal kommt
+        self._submit({
+            'op': 'dict', 'artifact_file': artifact_file,
+            'content': json.dumps(dictionary, default=str)
+        }, run_id)
+
+    def log_artifact(self, local_path: str, artifact_path: Optional[str] = None, run_id: Optional[str] = None):
+        self._submit({'op': 'artifact', 'local_path': str(local_path), 'artifact_path': artifact_path}, run_id)
+
+    def create_run(self, run_name: str) -> str:
+        """
+        Eigenen Run anlegen (wenn kein Run aktiv ist)
+        """
+        experiment = mlflow.get_experiment_by_name(self.experiment_name)
+        experiment_id = experiment.experiment_id if experiment else self.client.create_experiment(self.experiment_name)
+        run = self.client.create_run(experiment_id, run_name=run_name)
+        return run.info.run_id
+
+    def terminate_run(self, run_id: str, status: str = 'FINISHED', timeout: Optional[float] = None):
+        """
+        Mit create_run angelegten Run beenden, nachdem seine Einträge geschrieben sind
+        """
+        self.flush(timeout)
+        self.client.set_terminated(run_id, status=status)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Warte, bis alle eingereihten Einträge geschrieben sind
+
+        Returns:
+            True, wenn die Queue leer ist
+        """
+        if not self.enabled:
+            return True
+        self._queue.put(_FLUSH_NOW)
+        return self._idle.wait(timeout)
+
+    def close(self, timeout: float = 30.0):
+        """
+        Restliche Einträge schreiben und den Hintergrund-Thread beenden
+        """
+        if not self.enabled or self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+        if self._journal is not None:
+            self._journal.close()
+            # Journal nur entfernen, wenn alles geschrieben wurde
+            if self._pending == 0 and self._failed == 0:
+                self.journal_path.unlink(missing_ok=True)
+
+    # Interna
+
+    def _submit(self, entry: Dict[str, Any], run_id: Optional[str]):
+        run_id = run_id or self._active_run_id()
+        if run_id is None:
+            logger.warning(f"Kein aktiver MLflow Run, {entry['op']} '{entry.get('key', '')}' verworfen")
+            return
+
+        entry['run_id'] = run_id
+
+        if not self.enabled or self._closed:
+            # Synchroner Fallback
+            self._write_batch([entry])
+            return
+
+        with self._lock:
+            self._seq += 1
+            entry['seq'] = self._seq
+            self._journal.write(json.dumps(entry) + '\n')
+            self._pending += 1
+            self._idle.clear()
+            self.stats['enqueued'] += 1
+
+        self._queue.put(entry)
+
+    @staticmethod
+    def _active_run_id() -> Optional[str]:
+        run = mlflow.active_run()
+        return run.info.run_id if run else None
+
+    def _run(self):
+        """
+        Hintergrund-Thread: ab dem ersten Eintrag bis flush_interval sammeln, dann als Batch schreiben
+        """
+        stop = False
+
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                break
+            if item is _FLUSH_NOW:
+                continue
+
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if item is _FLUSH_NOW:
+                    break
+                batch.append(item)
+
+            self._flush_with_retry(batch)
+
+    def _flush_with_retry(self, batch: List[Dict[str, Any]]):
+        for entries, write in self._write_units(batch):
+            self._write_unit_with_retry(entries, write)
+
+    def _write_unit_with_retry(self, entries: List[Dict[str, Any]], write: Callable[[], None]):
+        """
+        Eine Schreib-Einheit schreiben und ihre Einträge bestätigen
+
+        Nur transiente Fehler (Verbindung, "database is locked", 5xx) werden
+        wiederholt. Lehnt MLflow eine Einheit mit mehreren Einträgen ab, werden
+        diese einzeln geschrieben; abgelehnte Einträge werden verworfen und
+        bestätigt, damit sie nicht aus dem Journal nachgeliefert werden.
+        """
+        for attempt in range(self.max_retries):
+            try:
+                write()
+                break
+            except Exception as e:
+                if not _is_transient(e):
+                    if len(entries) > 1:
+                        for sub_entries, sub_write in self._write_units(entries, single=True):
+                            self._write_unit_with_retry(sub_entries, sub_write)
+                        return
+
+                    entry = entries[0]
+                    logger.error(
+                        f"MLflow-Eintrag verworfen ({entry['op']} "
+                        f"'{entry.get('key') or entry.get('artifact_file') or entry.get('local_path')}'): {e}"
+                    )
+                    self.stats['dropped'] += len(entries)
+                    self._mark_done(len(entries), acked=[entry['seq'] for entry in entries if 'seq' in entry])
+                    return
+
+                self.stats['errors'] += 1
+                logger.warning(f"MLflow Flush fehlgeschlagen (Versuch {attempt + 1}): {e}")
+                time.sleep(min(2 ** attempt * 0.5, 10))
+        else:
+            # Einträge bleiben im Journal und werden beim nächsten Start nachgeliefert
+            logger.error(f"{len(entries)} MLflow-Einträge nicht geschrieben, bleiben im Journal")
+            with self._lock:
+                self._failed += len(entries)
+            self._mark_done(len(entries), acked=[])
+            return
+
+        self._mark_done(len(entries), acked=[entry['seq'] for entry in entries if 'seq' in entry])
+
+    def _mark_done(self, count: int, acked: List[int]):
+        with self._lock:
+            if acked and self._journal is not None and not self._journal.closed:
+                self._journal.write(json.dumps({'ack': acked}) + '\n')
+
+            self._pending -= count
+            if acked:
+                self.stats['flushed'] += len(acked)
+            if self._pending <= 0:
+                self._pending = 0
+                self._idle.set()
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """
+        Einträge synchron schreiben (Fallback ohne Queue), Fehler werden weitergereicht
+        """
+        for _, write in self._write_units(batch):
+            write()
+
+    def _write_units(self, batch: List[Dict[str, Any]],
+                     single: bool = False) -> List[Tuple[List[Dict[str, Any]], Callable[[], None]]]:
+        """
+        Einträge pro Run in einzeln bestätigbare Schreib-Einheiten zerlegen
+
+        Artifacts werden einzeln geschrieben, Params und Metrics mit log_batch
+        (mit single=True ein Aufruf pro Param-Key bzw. Metric).
+
+        Returns:
+            Liste von (Einträge, Schreibfunktion)
+        """
+        runs = {}
+        for entry in batch:
+            runs.setdefault(entry['run_id'], []).append(entry)
+
+        units = []
+        for run_id, entries in runs.items():
+            # Params: letzter Wert pro Key (log_batch lehnt doppelte Keys ab)
+            params = {}
+            metrics = []
+
+            for entry in entries:
+                if entry['op'] == 'param':
+                    params.setdefault(entry['key'], []).append(entry)
+                elif entry['op'] == 'metric':
+                    metrics.append(entry)
+                elif entry['op'] == 'dict':
+                    units.append(([entry], partial(self._log_dict, run_id, entry)))
+                elif entry['op'] == 'artifact':
+                    units.append(([entry], partial(self._log_artifact, run_id, entry)))
+
+            param_keys = list(params)
+            params_per_call = 1 if single else MAX_PARAMS_PER_BATCH
+            metrics_per_call = 1 if single else MAX_METRICS_PER_BATCH
+            n_calls = max(
+                math.ceil(len(param_keys) / params_per_call),
+                math.ceil(len(metrics) / metrics_per_call)
+            )
+
+            for i in range(n_calls):
+                keys = param_keys[i * params_per_call:(i + 1) * params_per_call]
+                chunk = metrics[i * metrics_per_call:(i + 1) * metrics_per_call]
+                unit_entries = [entry for key in keys for entry in params[key]] + chunk
+                units.append((unit_entries, partial(
+                    self._log_batch,
+                    run_id,
+                    [Param(key, params[key][-1]['value']) for key in keys],
+                    [Metric(e['key'], e['value'], e['timestamp'], e['step']) for e in chunk]
+                )))
+
+        return units
+
+    def _log_batch(self, run_id: str, params: List[Param], metrics: List[Metric]):
+        self.client.log_batch(run_id, metrics=metrics, params=params)
+        self.stats['batches'] += 1
+
+    def _log_dict(self, run_id: str, entry: Dict[str, Any]):
+        self.client.log_dict(run_id, json.loads(entry['content']), entry['artifact_file'])
+
+    def _log_artifact(self, run_id: str, entry: Dict[str, Any]):
+        if os.path.exists(entry['local_path']):
+            self.client.log_artifact(run_id, entry['local_path'], entry.get('artifact_path'))
+        else:
+            logger.warning(f"Artifact nicht mehr vorhanden: {entry['local_path']}")
+
+    def _replay_journals(self):
+        """
+        Nicht bestätigte Einträge aus Journals beendeter Prozesse nachliefern
+        """
+        for path in self.journal_dir.glob('*.jsonl'):
+            if path == self.journal_path:
+                continue
+
+            try:
+                pid = int(path.name.split('_', 1)[0])
+            except ValueError:
+                continue
+
+            if _pid_alive(pid):
+                continue
+
+            entries = {}
+            acked = set()
+
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Letzte Zeile nach Absturz evtl. unvollständig
+                        continue
+                    if 'ack' in record:
+                        acked.update(record['ack'])
+                    else:
+                        entries[record['seq']] = record
+
+            unacked = [entry for seq, entry in sorted(entries.items()) if seq not in acked]
+
+            for entry in unacked:
+                entry.pop('seq', None)
+                self._submit(entry, entry['run_id'])
+
+            self.stats['replayed'] += len(unacked)
+            path.unlink(missing_ok=True)
+
+            if unacked:
+                logger.info(f"MLflow Journal {path.name}: {len(unacked)} Einträge nachgeliefert")
@@ -0,0 +1,247 @@
+"""
+Model Distillation für Basketball Analytics
+Kompakte Student-Modelle, die die Wahrscheinlichkeiten eines großen Ensembles nachbilden
+"""
+
+import logging
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.base import is_regressor
+from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
+from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.metrics import r2_score, roc_auc_score, accuracy_score, brier_score_loss
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+
+def _logistic_student(params: Dict[str, Any], regression: bool) -> Any:
+    # Scaler im Artefakt, damit predict.py rohe Feature-Zeilen übergeben kann
+    if regression:
+        return Pipeline([('scaler', StandardScaler()), ('model', Ridge(**params))])
+    return Pipeline([
+        ('scaler', StandardScaler()),
+        ('model', LogisticRegression(**{'max_iter': 1000, **params}))
+    ])
+
+
+def _boosting_student(params: Dict[str, Any], regression: bool) -> Any:
+    defaults = {'max_depth': 3, 'max_iter': 50, 'learning_rate': 0.2, 'early_stopping': False, 'random_state': 42}
+    algorithm = HistGradientBoostingRegressor if regression else HistGradientBoostingClassifier
+    return algorithm(**{**defaults, **params})
+
+
+STUDENT_MODELS = {
+    'logistic_regression': _logistic_student,
+    'hist_gradient_boosting': _boosting_student,
+}
+
+
+def _fit_weighted(model: Any, X: pd.DataFrame, y: np.ndarray, sample_weight: np.ndarray) -> Any:
+    """
+    Fit mit sample_weight, bei Pipelines an den letzten Schritt durchgereicht
+    """
+    if isinstance(model, Pipeline):
+        return model.fit(X, y, **{f"{model.steps[-1][0]}__sample_weight": sample_weight})
+    return model.fit(X, y, sample_weight=sample_weight)
+
+
+def expected_calibration_error(y_true: np.ndarray, probabilities: np.ndarray, classes: np.ndarray, n_bins: int = 10) -> float:
+    """
+    ECE über die Konfidenz der vorhergesagten Klasse
+    """
+    confidence = probabilities.max(axis=1)
+    correct = classes[probabilities.argmax(axis=1)] == np.asarray(y_true)
+    bins = np.minimum((confidence * n_bins).astype(int), n_bins - 1)
+
+    ece = 0.0
+    for b in np.unique(bins):
+        in_bin = bins == b
+        ece += in_bin.mean() * abs(correct[in_bin].mean() - confidence[in_bin].mean())
+    return float(ece)
+
+
+class ModelDistiller:
+    """
+    Trainiert Student-Modelle auf Soft Labels eines Teacher-Models
+
+    Klassifikation: jede Zeile wird pro Klasse dupliziert und mit der
+    Teacher-Wahrscheinlichkeit als sample_weight gewichtet, damit auch
+    Students ohne Soft-Label-Support die Wahrscheinlichkeiten lernen.
+    Regression: Students lernen direkt die Teacher-Vorhersage.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Model Distiller
+
+        Args:
+            config: Konfiguration (distill_students, distill_student_params, distill_augment_ratio,
+                distill_augment_noise, distill_calibration_bins)
+        """
+        self.students = config.get('distill_students', ['logistic_regression', 'hist_gradient_boosting'])
+        self.student_params = config.get('distill_student_params', {})
+        # Augmentierte Zeilen relativ zu den echten Trainingszeilen
+        self.augment_ratio = config.get('distill_augment_ratio', 1.0)
+        # Rauschen in Standardabweichungen pro stetiger Spalte
+        self.augment_noise = config.get('distill_augment_noise', 0.1)
+        self.calibration_bins = config.get('distill_calibration_bins', 10)
+        self.random_state = config.get('random_state', 42)
+
+    def augment(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Synthetische Feature-Zeilen in der Nähe der echten Daten
+
+        Zeilen werden mit Zurücklegen gezogen, stetige Spalten verrauscht und
+        auf den beobachteten Wertebereich begrenzt. Binäre Spalten (z.B.
+        One-Hot) bleiben unverändert, ganzzahlige Spalten werden gerundet.
+        """
+        n_rows = int(len(X) * self.augment_ratio)
+        if n_rows == 0:
+            return X.iloc[:0]
+
+        rng = np.random.default_rng(self.random_state)
+        values = X.to_numpy(dtype=np.float64)
+        sample = values[rng.integers(0, len(values), n_rows)]
+
+        for j in range(values.shape[1]):
+            column = values[:, j]
+            if len(np.unique(column)) <= 2:
+                continue
+            std = np.nanstd(column)
+            if not std > 0:
+                continue
+            sample[:, j] += rng.normal(0, self.augment_noise * std, n_rows)
+            np.clip(sample[:, j], np.nanmin(column), np.nanmax(column), out=sample[:, j])
+            if np.all(np.mod(column[~np.isnan(column)], 1) == 0):
+                sample[:, j] = np.round(sample[:, j])
+
+        return pd.DataFrame(sample, columns=X.columns).astype(X.dtypes.to_dict(), errors='ignore')
+
+    def soft_labels(self, teacher: Any, X: pd.DataFrame) -> np.ndarray:
+        """
+        Teacher-Wahrscheinlichkeiten (Klassifikation) bzw. Vorhersagen (Regression)
+        """
+        if is_regressor(teacher):
+            return np.asarray(teacher.predict(X), dtype=np.float64)
+        return np.asarray(teacher.predict_proba(X), dtype=np.float64)
+
+    def fit_student(self, name: str, teacher: Any, X: pd.DataFrame, targets: np.ndarray) -> Any:
+        """
+        Student auf Soft Labels trainieren
+
+        Args:
+            name: Key aus STUDENT_MODELS
+            teacher: Teacher-Model (für Task und Klassen)
+            X: Echte + augmentierte Feature-Zeilen
+            targets: Ausgabe von soft_labels für X
+        """
+        if name not in STUDENT_MODELS:
+            raise ValueError(f"Unbekannter Student: {name}")
+
+        regression = is_regressor(teacher)
+        student = STUDENT_MODELS[name](dict(self.student_params.get(name, {})), regression)
+
+        if regression:
+            return student.fit(X, targets)
+
+        classes = teacher.classes_
+        n_rows, n_classes = targets.shape
+
+        # Jede Zeile einmal pro Klasse, Gewicht = Teacher-Wahrscheinlichkeit
+        row_idx = np.tile(np.arange(n_rows), n_classes)
+        class_idx = np.repeat(np.arange(n_classes), n_rows)
+        weights = targets[row_idx, class_idx]
+        keep = weights > 1e-6
+
+        return _fit_weighted(
+            student, X.iloc[row_idx[keep]], classes[class_idx[keep]], weights[keep] * n_classes
+        )
+
+    def compare(self, teacher: Any, student: Any, X: pd.DataFrame, y: Any) -> Dict[str, Any]:
+        """
+        Übereinstimmung und Kalibrierung von Student und Teacher auf echten Holdout-Zeilen
+        """
+        y = np.asarray(y)
+
+        if is_regressor(teacher):
+            teacher_pred = teacher.predict(X)
+            student_pred = student.predict(X)
+            return {
+                'agreement_r2': float(r2_score(teacher_pred, student_pred)),
+                'mae_to_teacher': float(np.mean(np.abs(teacher_pred - student_pred))),
+                'teacher_r2': float(r2_score(y, teacher_pred)),
+                'student_r2': float(r2_score(y, student_pred)),
+            }
+
+        classes = teacher.classes_
+        teacher_proba = teacher.predict_proba(X)
+        student_proba = student.predict_proba(X)
+        teacher_label = classes[teacher_proba.argmax(axis=1)]
+        student_label = classes[student_proba.argmax(axis=1)]
+
+        report = {
+            'agreement': float(np.mean(teacher_label == student_label)),
+            'probability_mae': float(np.mean(np.abs(teacher_proba - student_proba))),
+            'teacher_accuracy': float(accuracy_score(y, teacher_label)),
+            'student_accuracy': float(accuracy_score(y, student_label)),
+            'teacher_ece': expected_calibration_error(y, teacher_proba, classes, self.calibration_bins),
+            'student_ece': expected_calibration_error(y, student_proba, classes, self.calibration_bins),
+        }
+
+        if len(classes) == 2 and len(np.unique(y)) == 2:
+            positive = y == classes[1]
+            report.update({
+                'teacher_roc_auc': float(roc_auc_score(positive, teacher_proba[:, 1])),
+                'student_roc_auc': float(roc_auc_score(positive, student_proba[:, 1])),
+                'teacher_brier': float(brier_score_loss(positive, teacher_proba[:, 1])),
+                'student_brier': float(brier_score_loss(positive, student_proba[:, 1])),
+            })
+
+        return report
+
+    def distill(
+        self,
+        teacher: Any,
+        X_train: pd.DataFrame,
+        X_holdout: pd.DataFrame,
+        y_holdout: Any,
+        students: Optional[List[str]] = None
+    ) -> List[Tuple[str, Any, Dict[str, Any]]]:
+        """
+        Alle Students trainieren und gegen den Teacher vergleichen
+
+        Args:
+            teacher: Gefittetes Teacher-Model
+            X_train: Echte Feature-Zeilen (Labels werden nicht benötigt)
+            X_holdout/y_holdout: Echte Zeilen mit Labels für den Report
+            students: Überschreibt distill_students
+
+        Returns:
+            Liste (Name, Student, Report)
+        """
+        augmented = self.augment(X_train)
+        X_distill = pd.concat([X_train, augmented], ignore_index=True)
+        targets = self.soft_labels(teacher, X_distill)
+
+        logger.info(f"Distillation auf {len(X_train)} echten + {len(augmented)} augmentierten Zeilen")
+
+        results = []
+        for name in students or self.students:
+            student = self.fit_student(name, teacher, X_distill, targets)
+            report = {
+                'real_rows': int(len(X_train)),
+                'augmented_rows': int(len(augmented)),
+                **self.compare(teacher, student, X_holdout, y_holdout),
+            }
+            logger.info(
+                f"Student {name}: " + ", ".join(
+                    f"{key} {value:.4f}" for key, value in report.items() if isinstance(value, float)
+                )
+            )
+            results.append((name, student, report))
+
+        return results
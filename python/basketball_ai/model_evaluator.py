@@ -401,6 +401,9 @@ class ModelEvaluator:
         Extrahiere Feature Importance vom Model
         """
         try:
+            # Skalierte Modelle sind Pipelines (Scaler + Model)
+            if hasattr(model, 'steps'):
+                model = model.steps[-1][1]
             if hasattr(model, 'feature_importances_'):
                 return dict(zip(feature_names, model.feature_importances_))
             elif hasattr(model, 'coef_'):
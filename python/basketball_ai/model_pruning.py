@@ -0,0 +1,301 @@
+"""
+Model Pruning für Basketball Analytics
+Kleinstes Sub-Ensemble, dessen Validierungs-Score innerhalb einer Toleranz bleibt
+"""
+
+import copy
+import logging
+import time
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingClassifier, HistGradientBoostingRegressor
+from sklearn.ensemble._forest import BaseForest
+from sklearn.ensemble._gb import BaseGradientBoosting
+from sklearn.metrics import get_scorer
+import xgboost as xgb
+import lightgbm as lgb
+
+logger = logging.getLogger(__name__)
+
+TREE_LEAF = -1
+TREE_UNDEFINED = -2
+
+
+def _cap_tree_depth(estimator: Any, max_depth: int) -> Any:
+    """
+    Kopie eines gefitteten Decision Trees, abgeschnitten bei max_depth
+
+    Knoten auf max_depth werden zu Leaves mit ihrem (bereits gespeicherten)
+    Knoten-Wert, unerreichbare Knoten werden entfernt.
+    """
+    tree = estimator.tree_
+    state = tree.__getstate__()
+    nodes, values = state['nodes'], state['values']
+
+    # Breitensuche ab Root, neue Indizes in Besuchsreihenfolge
+    keep, depths, new_index = [0], [0], {0: 0}
+    position = 0
+    while position < len(keep):
+        node, depth = keep[position], depths[position]
+        position += 1
+        if nodes['left_child'][node] != TREE_LEAF and depth < max_depth:
+            for child in (nodes['left_child'][node], nodes['right_child'][node]):
+                new_index[child] = len(keep)
+                keep.append(child)
+                depths.append(depth + 1)
+
+    keep = np.array(keep)
+    depths = np.array(depths)
+    pruned_nodes = nodes[keep].copy()
+
+    cut = (pruned_nodes['left_child'] != TREE_LEAF) & (depths >= max_depth)
+    pruned_nodes['left_child'][cut] = TREE_LEAF
+    pruned_nodes['right_child'][cut] = TREE_LEAF
+    pruned_nodes['feature'][cut] = TREE_UNDEFINED
+    pruned_nodes['threshold'][cut] = TREE_UNDEFINED
+
+    internal = pruned_nodes['left_child'] != TREE_LEAF
+    pruned_nodes['left_child'][internal] = [new_index[i] for i in pruned_nodes['left_child'][internal]]
+    pruned_nodes['right_child'][internal] = [new_index[i] for i in pruned_nodes['right_child'][internal]]
+
+    new_tree = type(tree)(tree.n_features, np.asarray(tree.n_classes, dtype=np.intp), tree.n_outputs)
+    new_tree.__setstate__({
+        'max_depth': int(min(state['max_depth'], max_depth)),
+        'node_count': len(keep),
+        'nodes': pruned_nodes,
+        'values': np.ascontiguousarray(values[keep]),
+    })
+
+    capped = copy.copy(estimator)
+    capped.tree_ = new_tree
+    return capped
+
+
+def _n_members(model: Any) -> Optional[int]:
+    """
+    Anzahl Bäume bzw. Boosting-Stufen (None = nicht prunebar)
+    """
+    if isinstance(model, BaseForest):
+        return len(model.estimators_)
+    if isinstance(model, BaseGradientBoosting):
+        return model.estimators_.shape[0]
+    if isinstance(model, (HistGradientBoostingClassifier, HistGradientBoostingRegressor)):
+        return len(model._predictors)
+    if isinstance(model, xgb.XGBModel):
+        return model.get_booster().num_boosted_rounds()
+    if isinstance(model, lgb.LGBMModel):
+        return model.booster_.current_iteration()
+    return None
+
+
+def _sub_ensemble(model: Any, n_members: int, capped_trees: Optional[List[Any]] = None) -> Any:
+    """
+    Flache Kopie mit den ersten n_members Bäumen/Stufen
+
+    Forests optional mit depth-gekappten Bäumen; Boosting-Modelle nur über
+    die Stufen, weil deren innere Knoten-Werte keine Vorhersagen sind.
+    """
+    pruned = copy.copy(model)
+
+    if isinstance(model, BaseForest):
+        pruned.estimators_ = list((capped_trees or model.estimators_)[:n_members])
+        pruned.n_estimators = n_members
+    elif isinstance(model, BaseGradientBoosting):
+        pruned.estimators_ = model.estimators_[:n_members]
+        pruned.train_score_ = model.train_score_[:n_members]
+        pruned.n_estimators = n_members
+        pruned.n_estimators_ = n_members
+    elif isinstance(model, (HistGradientBoostingClassifier, HistGradientBoostingRegressor)):
+        pruned._predictors = model._predictors[:n_members]
+        pruned.max_iter = n_members
+    elif isinstance(model, xgb.XGBModel):
+        pruned._Booster = model.get_booster()[:n_members]
+        pruned.n_estimators = n_members
+    elif isinstance(model, lgb.LGBMModel):
+        pruned._Booster = lgb.Booster(model_str=model.booster_.model_to_string(num_iteration=n_members))
+        pruned.n_estimators = n_members
+    else:
+        raise ValueError(f"{type(model).__name__} unterstützt kein Pruning")
+
+    return pruned
+
+
+def _predict_fn(model: Any):
+    """
+    Inference-Aufruf wie in scripts/ml/predict.py
+    """
+    return model.predict_proba if hasattr(model, 'predict_proba') else model.predict
+
+
+class ModelPruner:
+    """
+    Sucht das schnellste Sub-Ensemble (weniger Bäume, Depth Caps) innerhalb der Score-Toleranz
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Model Pruner
+
+        Args:
+            config: Konfiguration (prune_tolerance, prune_member_fractions, prune_depth_caps)
+        """
+        # Relativer erlaubter Score-Verlust, 0.002 = 0.2%
+        self.tolerance = config.get('prune_tolerance', 0.002)
+        self.member_fractions = config.get('prune_member_fractions', [1 / 32, 1 / 16, 1 / 8, 1 / 4, 1 / 2, 3 / 4])
+        self.depth_caps = config.get('prune_depth_caps', [4, 6, 8, 12])
+        self.latency_rows = config.get('profile_batch_rows', 1000)
+
+    def prune(
+        self,
+        model: Any,
+        X_search: np.ndarray,
+        y_search: Any,
+        X_check: np.ndarray,
+        y_check: Any,
+        scoring: str,
+        tolerance: Optional[float] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Kandidaten auf X_search bewerten, Toleranz und Report auf X_check
+
+        Der schnellste Kandidat muss die Toleranz auch auf X_check halten,
+        sonst wird der nächstlangsamere geprüft.
+
+        Args:
+            model: Gefittetes Ensemble
+            X_search/y_search: Zeilen für die Auswahl
+            X_check/y_check: Separate Zeilen für den Vorher/Nachher-Report
+            scoring: Sklearn Scoring-Name (höher = besser)
+            tolerance: Überschreibt prune_tolerance
+
+        Returns:
+            (Gepruntes Model, Report); ohne passenden Kandidaten das Original
+            und None bzw. ein Report mit accepted=False
+        """
+        n_total = _n_members(model)
+        if n_total is None:
+            raise ValueError(f"{type(model).__name__} unterstützt kein Pruning")
+
+        tolerance = self.tolerance if tolerance is None else tolerance
+        scorer = get_scorer(scoring)
+
+        full_score = scorer(model, X_search, y_search)
+        min_score = full_score - tolerance * abs(full_score)
+
+        member_counts = sorted({max(1, int(round(n_total * fraction))) for fraction in self.member_fractions} | {n_total})
+
+        # Depth Caps nur für Forests (Knoten-Werte = Vorhersage des Teilbaums)
+        depth_options = [None]
+        if isinstance(model, BaseForest):
+            max_depth = max(est.tree_.max_depth for est in model.estimators_)
+            depth_options += [cap for cap in sorted(self.depth_caps) if cap < max_depth]
+
+        candidates = []
+        for depth in depth_options:
+            capped = None if depth is None else [_cap_tree_depth(est, depth) for est in model.estimators_]
+
+            # Kleinste Baumanzahl, die die Toleranz hält (pro Depth Cap)
+            for n_members in member_counts:
+                pruned = _sub_ensemble(model, n_members, capped)
+                score = scorer(pruned, X_search, y_search)
+                if score >= min_score:
+                    candidates.append({
+                        'model': pruned,
+                        'n_members': n_members,
+                        'max_depth': depth,
+                        'search_score': float(score),
+                        'latency_ms': self._batch_latency_ms(pruned, X_search),
+                    })
+                    break
+
+        if not candidates:
+            logger.info("Pruning: kein Kandidat innerhalb der Toleranz, Original bleibt")
+            return model, None
+
+        score_before = float(scorer(model, X_check, y_check))
+        min_check_score = score_before - tolerance * abs(score_before)
+
+        # Schnellster Kandidat, der die Toleranz auch auf X_check hält
+        best = None
+        for candidate in sorted(candidates, key=lambda c: c['latency_ms']):
+            if candidate['n_members'] == n_total and candidate['max_depth'] is None:
+                continue
+            candidate['check_score'] = float(scorer(candidate['model'], X_check, y_check))
+            if candidate['check_score'] >= min_check_score:
+                best = candidate
+                break
+
+        candidate_report = [
+            {key: value for key, value in candidate.items() if key != 'model'}
+            for candidate in candidates
+        ]
+
+        if best is None:
+            logger.info("Pruning: kein Kandidat hält die Toleranz auf den Check-Zeilen, Original bleibt")
+            return model, {
+                'scoring': scoring,
+                'tolerance': tolerance,
+                'accepted': False,
+                'score_before': score_before,
+                'candidates': candidate_report,
+            }
+
+        pruned = best['model']
+        score_after = best['check_score']
+
+        before_ms = self._batch_latency_ms(model, X_check)
+        after_ms = self._batch_latency_ms(pruned, X_check)
+
+        report = {
+            'scoring': scoring,
+            'tolerance': tolerance,
+            'accepted': True,
+            'members_before': n_total,
+            'members_after': best['n_members'],
+            'max_depth_cap': best['max_depth'],
+            'score_before': score_before,
+            'score_after': score_after,
+            'score_loss_percent': (score_before - score_after) / abs(score_before) * 100 if score_before else None,
+            'batch_latency_ms_before': before_ms,
+            'batch_latency_ms_after': after_ms,
+            'single_row_ms_before': self._single_row_ms(model, X_check),
+            'single_row_ms_after': self._single_row_ms(pruned, X_check),
+            'speedup': before_ms / after_ms if after_ms > 0 else None,
+            'latency_rows': self.latency_rows,
+            'candidates': candidate_report,
+        }
+
+        depth_note = '' if best['max_depth'] is None else f", max_depth {best['max_depth']}"
+        logger.info(
+            f"Pruning {type(model).__name__}: {n_total} -> {best['n_members']} Bäume{depth_note}, "
+            f"{scoring} {score_before:.4f} -> {score_after:.4f}, {report['speedup'] or 0:.1f}x schneller"
+        )
+
+        return pruned, report
+
+    def _batch_latency_ms(self, model: Any, X: np.ndarray, repeats: int = 3) -> float:
+        """
+        Beste Laufzeit von predict_proba (bzw. predict) auf latency_rows Zeilen
+        """
+        batch = X[np.arange(self.latency_rows) % len(X)]
+        predict = _predict_fn(model)
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            predict(batch)
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000
+
+    def _single_row_ms(self, model: Any, X: np.ndarray, rows: int = 50) -> float:
+        """
+        Median-Latenz eines Single-Row Aufrufs
+        """
+        predict = _predict_fn(model)
+        predict(X[:1])
+        timings = []
+        for i in range(min(rows, len(X))):
+            start = time.perf_counter()
+            predict(X[i:i + 1])
+            timings.append(time.perf_counter() - start)
+        return float(np.median(timings) * 1000)
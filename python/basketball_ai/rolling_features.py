@@ -0,0 +1,309 @@
+"""
+Rolling Features für Basketball Analytics
+Point-in-Time Fenster-Features (Summen, Mittel, EWMA, Acute:Chronic Workload) über Game Logs
+"""
+
+import logging
+from typing import Dict, List, Tuple, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _day_numbers(dates: pd.Series) -> np.ndarray:
+    """
+    Kalendertage als int64 (Tage seit Epoch), Uhrzeit wird ignoriert
+    """
+    return pd.to_datetime(dates).to_numpy().astype('datetime64[D]').astype(np.int64)
+
+
+class RollingFeatureEngine:
+    """
+    Vektorisierte Fenster-Features pro Spieler über sortierte Game-Log Arrays
+
+    Point-in-Time: Eine Zeile sieht nur Spiele von früheren Kalendertagen,
+    weder das eigene Spiel noch andere Spiele desselben Tages oder später.
+    Zeitfenster laufen über kumulative Summen und searchsorted auf einem
+    (Spieler, Tag)-Key; EWMA und Tage seit dem letzten Spiel über eine
+    Schleife pro Spieltag-Rang, vektorisiert über alle Spieler.
+
+    transform() merkt sich einen kompakten Zustand (Spiele im größten
+    Fenster + EWMA-Stand pro Spieler), mit dem update() neue Spiele
+    inkrementell berechnet, ohne die ganze Historie neu zu lesen.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Rolling Feature Engine
+
+        Args:
+            config: Konfiguration (rolling_player_column, rolling_date_column, rolling_columns,
+                rolling_windows_days, rolling_ewm_halflife_days, rolling_acwr)
+        """
+        self.player_column = config.get('rolling_player_column', 'player_id')
+        self.date_column = config.get('rolling_date_column', 'game_date')
+        # Quellspalte -> Präfix der Features (minutes_played -> minutes_last_7_days)
+        self.columns = config.get('rolling_columns', {'minutes_played': 'minutes', 'points': 'points'})
+        self.windows = sorted(config.get('rolling_windows_days', [7, 14, 28]))
+        self.ewm_halflives = config.get('rolling_ewm_halflife_days', [7])
+        # Acute:Chronic Workload Ratio: mittlere Tageslast acute / chronic
+        self.acwr = config.get('rolling_acwr', {'column': 'minutes_played', 'acute_days': 7, 'chronic_days': 28})
+
+        self.state = None
+
+    @property
+    def max_window(self) -> int:
+        windows = list(self.windows)
+        if self.acwr:
+            windows += [self.acwr['acute_days'], self.acwr['chronic_days']]
+        return max(windows)
+
+    def feature_names(self) -> List[str]:
+        names = []
+        for window in self.windows:
+            names.append(f"games_last_{window}_days")
+            for prefix in self.columns.values():
+                names += [f"{prefix}_last_{window}_days", f"{prefix}_avg_last_{window}_days"]
+        for halflife in self.ewm_halflives:
+            names += [f"{prefix}_ewm_{halflife}d" for prefix in self.columns.values()]
+        if self.acwr:
+            names.append(f"acwr_{self.columns.get(self.acwr['column'], self.acwr['column'])}")
+        names.append('days_since_last_game')
+        return names
+
+    def transform(self, games: pd.DataFrame) -> pd.DataFrame:
+        """
+        Features für alle Zeilen eines Game Logs (Index wie games)
+
+        Setzt den Zustand für spätere update()-Aufrufe neu.
+        """
+        players, _ = pd.factorize(games[self.player_column])
+        features, state = self._compute(
+            players, _day_numbers(games[self.date_column]), self._values(games), self._empty_ewm(players.max() + 1)
+        )
+        self.state = self._trim_state(games[self.player_column].to_numpy(), games, state)
+        logger.info(
+            f"Rolling Features: {len(games)} Spiele, {players.max() + 1} Spieler, "
+            f"{len(self.state['history'])} Spiele im Zustand"
+        )
+        return pd.DataFrame(features, index=games.index, columns=self.feature_names())
+
+    def update(self, new_games: pd.DataFrame) -> pd.DataFrame:
+        """
+        Features für neu eingetroffene Spiele auf Basis des gespeicherten Zustands
+
+        Neue Spiele müssen nach dem letzten bekannten Spieltag des jeweiligen
+        Spielers liegen, sonst wären frühere Features nicht mehr point-in-time.
+        """
+        if self.state is None:
+            return self.transform(new_games)
+
+        history = self.state['history']
+        new_days = _day_numbers(new_games[self.date_column])
+        known_last = pd.Series(self.state['last_day']).reindex(new_games[self.player_column].to_numpy()).to_numpy()
+        late = new_days <= np.nan_to_num(known_last, nan=-np.inf)
+        if late.any():
+            raise ValueError(
+                f"{int(late.sum())} neue Spiele liegen nicht nach dem letzten bekannten Spieltag des Spielers"
+            )
+
+        combined = pd.concat([history, new_games[history.columns]], ignore_index=True)
+        players, keys = pd.factorize(combined[self.player_column])
+        ewm = self._empty_ewm(len(keys))
+
+        # EWMA-Stand der bekannten Spieler übernehmen
+        known = np.array([key in self.state['ewm_index'] for key in keys], dtype=bool)
+        if known.any():
+            rows = np.array([self.state['ewm_index'][key] for key in keys[known]])
+            for name in ewm:
+                ewm[name][known] = self.state['ewm'][name][rows]
+
+        # Historie nur als Fenster-Kontext, EWMA enthält sie bereits
+        is_new = np.arange(len(combined)) >= len(history)
+        features, state = self._compute(
+            players, _day_numbers(combined[self.date_column]), self._values(combined), ewm, ewm_rows=is_new
+        )
+
+        self.state = self._trim_state(combined[self.player_column].to_numpy(), combined, state, keys=keys)
+        return pd.DataFrame(features[is_new], index=new_games.index, columns=self.feature_names())
+
+    def _values(self, games: pd.DataFrame) -> np.ndarray:
+        return games[list(self.columns)].to_numpy(dtype=np.float64)
+
+    def _empty_ewm(self, n_players: int) -> Dict[str, np.ndarray]:
+        n_columns = len(self.columns)
+        ewm = {'last_day': np.full(n_players, np.nan)}
+        for halflife in self.ewm_halflives:
+            ewm[f"sum_{halflife}"] = np.zeros((n_players, n_columns))
+            ewm[f"weight_{halflife}"] = np.zeros((n_players, n_columns))
+        return ewm
+
+    def _compute(
+        self,
+        players: np.ndarray,
+        days: np.ndarray,
+        values: np.ndarray,
+        ewm: Dict[str, np.ndarray],
+        ewm_rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Feature-Matrix in Eingabe-Reihenfolge und fortgeschriebener EWMA-Zustand
+
+        Args:
+            players: Spieler-Codes 0..n-1
+            days: Kalendertage
+            values: Quellspalten (NaN = nicht erfasst)
+            ewm: Start-Zustand pro Spieler, wird fortgeschrieben
+            ewm_rows: Nur diese Zeilen fließen in EWMA/Tage-seit-Spiel ein (Default: alle)
+        """
+        n_rows, n_columns = values.shape
+        order = np.lexsort((days, players))
+        players_s, days_s, values_s = players[order], days[order], values[order]
+        valid_s = ~np.isnan(values_s)
+
+        # Ein Key pro (Spieler, Tag); Abstand zwischen Spielern > größtes Fenster
+        span = int(days_s.max() - days_s.min()) if n_rows else 0
+        stride = span + self.max_window + 1
+        keys = players_s.astype(np.int64) * stride + (days_s - days_s.min() if n_rows else days_s)
+
+        cum_values = np.vstack([np.zeros((1, n_columns)), np.cumsum(np.where(valid_s, values_s, 0.0), axis=0)])
+        cum_valid = np.vstack([np.zeros((1, n_columns)), np.cumsum(valid_s, axis=0)])
+
+        # Erste Zeile des eigenen Tages = exklusives Fensterende
+        end = np.searchsorted(keys, keys, side='left')
+
+        features = np.empty((n_rows, len(self.feature_names())))
+        col = 0
+        window_sums = {}
+        for window in self.windows:
+            start = np.searchsorted(keys, keys - window, side='left')
+            sums = cum_values[end] - cum_values[start]
+            counts = cum_valid[end] - cum_valid[start]
+            window_sums[window] = sums
+
+            features[:, col] = end - start
+            col += 1
+            for j in range(n_columns):
+                features[:, col] = sums[:, j]
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    features[:, col + 1] = np.where(counts[:, j] > 0, sums[:, j] / counts[:, j], np.nan)
+                col += 2
+
+        ewm_features, days_since = self._ewm(players_s, days_s, values_s, valid_s, ewm,
+                                             None if ewm_rows is None else ewm_rows[order])
+        for block in ewm_features:
+            features[:, col:col + n_columns] = block
+            col += n_columns
+
+        if self.acwr:
+            j = list(self.columns).index(self.acwr['column'])
+            acute, chronic = self.acwr['acute_days'], self.acwr['chronic_days']
+            for window in (acute, chronic):
+                if window not in window_sums:
+                    window_sums[window] = cum_values[end] - cum_values[np.searchsorted(keys, keys - window, side='left')]
+            acute_sum, chronic_sum = window_sums[acute][:, j], window_sums[chronic][:, j]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                # Ohne chronische Last nicht definiert (NaN)
+                features[:, col] = np.where(
+                    chronic_sum > 0, (acute_sum / acute) / (chronic_sum / chronic), np.nan
+                )
+            col += 1
+
+        features[:, col] = days_since
+
+        # Zurück in Eingabe-Reihenfolge
+        result = np.empty_like(features)
+        result[order] = features
+        return result, ewm
+
+    def _ewm(
+        self,
+        players: np.ndarray,
+        days: np.ndarray,
+        values: np.ndarray,
+        valid: np.ndarray,
+        ewm: Dict[str, np.ndarray],
+        ewm_rows: Optional[np.ndarray]
+    ) -> Tuple[List[np.ndarray], np.ndarray]:
+        """
+        Zeitlich gewichtetes Mittel früherer Spieltage und Tage seit dem letzten Spiel
+
+        Spiele werden pro (Spieler, Tag) aggregiert. Rang k = k-ter Spieltag
+        des Spielers; pro Rang wird der Zustand aller Spieler auf einmal
+        fortgeschrieben (jeder Spieler kommt pro Rang höchstens einmal vor).
+        """
+        n_rows, n_columns = values.shape
+        if ewm_rows is None:
+            ewm_rows = np.ones(n_rows, dtype=bool)
+
+        new_day = np.ones(n_rows, dtype=bool)
+        new_day[1:] = (players[1:] != players[:-1]) | (days[1:] != days[:-1])
+        daily_starts = np.flatnonzero(new_day)
+        row_to_daily = np.cumsum(new_day) - 1
+
+        daily_players = players[daily_starts]
+        daily_days = days[daily_starts].astype(np.float64)
+        daily_sums = np.add.reduceat(np.where(valid, values, 0.0), daily_starts, axis=0) if n_rows else values
+        daily_counts = np.add.reduceat(valid.astype(np.float64), daily_starts, axis=0) if n_rows else values
+        daily_active = ewm_rows[daily_starts]
+
+        # Rang des Spieltags innerhalb des Spielers
+        first_of_player = np.ones(len(daily_starts), dtype=bool)
+        first_of_player[1:] = daily_players[1:] != daily_players[:-1]
+        player_start = np.maximum.accumulate(np.where(first_of_player, np.arange(len(daily_starts)), 0))
+        rank = np.arange(len(daily_starts)) - player_start
+
+        daily_ewm = [np.full((len(daily_starts), n_columns), np.nan) for _ in self.ewm_halflives]
+        daily_gap = np.full(len(daily_starts), np.nan)
+
+        by_rank = np.argsort(rank, kind='stable')
+        boundaries = np.searchsorted(rank[by_rank], np.arange(rank.max() + 2 if len(rank) else 1))
+
+        for k in range(len(boundaries) - 1):
+            entries = by_rank[boundaries[k]:boundaries[k + 1]]
+            entries = entries[daily_active[entries]]
+            if len(entries) == 0:
+                continue
+            p = daily_players[entries]
+            gap = daily_days[entries] - ewm['last_day'][p]
+            daily_gap[entries] = gap
+
+            for h, halflife in enumerate(self.ewm_halflives):
+                decay = np.nan_to_num(np.exp(-np.log(2) / halflife * gap), nan=0.0)[:, None]
+                sums = ewm[f"sum_{halflife}"][p] * decay
+                weights = ewm[f"weight_{halflife}"][p] * decay
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    daily_ewm[h][entries] = np.where(weights > 0, sums / weights, np.nan)
+                ewm[f"sum_{halflife}"][p] = sums + daily_sums[entries]
+                ewm[f"weight_{halflife}"][p] = weights + daily_counts[entries]
+
+            ewm['last_day'][p] = daily_days[entries]
+
+        return [block[row_to_daily] for block in daily_ewm], daily_gap[row_to_daily]
+
+    def _trim_state(
+        self,
+        player_keys: np.ndarray,
+        games: pd.DataFrame,
+        ewm: Dict[str, np.ndarray],
+        keys: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        """
+        Nur Spiele im größten Fenster vor dem letzten Spieltag pro Spieler behalten
+        """
+        if keys is None:
+            _, keys = pd.factorize(games[self.player_column])
+
+        columns = [self.player_column, self.date_column] + list(self.columns)
+        days = _day_numbers(games[self.date_column])
+        last_day = pd.Series(days).groupby(player_keys).transform('max').to_numpy()
+        history = games.loc[days > last_day - self.max_window, columns].reset_index(drop=True)
+
+        return {
+            'history': history,
+            'ewm': ewm,
+            'ewm_index': {key: i for i, key in enumerate(keys)},
+            'last_day': dict(zip(keys, ewm['last_day'])),
+        }
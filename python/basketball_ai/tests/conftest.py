@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Module im Paket importieren sich flach (z.B. "from fold_cache import ...")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
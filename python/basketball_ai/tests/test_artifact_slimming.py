@@ -0,0 +1,62 @@
+import io
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification, make_regression
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier, RandomForestRegressor
+from sklearn.tree import DecisionTreeClassifier
+
+from artifact_slimming import SlimTreeModel, restore_model, slim_tree_model
+
+
+def _round_trip(slim):
+    buffer = io.BytesIO()
+    joblib.dump(slim, buffer)
+    buffer.seek(0)
+    return restore_model(joblib.load(buffer))
+
+
+@pytest.mark.parametrize('model', [
+    RandomForestClassifier(n_estimators=20, random_state=0),
+    GradientBoostingClassifier(n_estimators=20, random_state=0),
+    DecisionTreeClassifier(random_state=0),
+])
+def test_classifier_round_trip(model):
+    X, y = make_classification(n_samples=400, n_features=8, n_classes=3, n_informative=5, random_state=0)
+    model.fit(X, y)
+
+    slim, report = slim_tree_model(model, X)
+    assert isinstance(slim, SlimTreeModel)
+    assert report['bytes_after'] < report['bytes_before']
+
+    restored = _round_trip(slim)
+    np.testing.assert_array_equal(restored.predict(X), model.predict(X))
+    np.testing.assert_array_equal(restored.predict_proba(X), model.predict_proba(X))
+    np.testing.assert_allclose(restored.feature_importances_, model.feature_importances_)
+
+
+def test_regressor_round_trip_keeps_node_statistics():
+    X, y = make_regression(n_samples=300, n_features=6, noise=5.0, random_state=0)
+    model = RandomForestRegressor(n_estimators=10, random_state=0).fit(X, y)
+
+    slim, _ = slim_tree_model(model, X)
+    restored = _round_trip(slim)
+
+    np.testing.assert_array_equal(restored.predict(X), model.predict(X))
+    for before, after in zip(model.estimators_, restored.estimators_):
+        np.testing.assert_array_equal(after.tree_.value, before.tree_.value)
+        np.testing.assert_array_equal(after.tree_.impurity, before.tree_.impurity)
+        np.testing.assert_array_equal(after.tree_.n_node_samples, before.tree_.n_node_samples)
+        np.testing.assert_array_equal(after.tree_.weighted_n_node_samples, before.tree_.weighted_n_node_samples)
+
+
+def test_non_tree_model_is_not_slimmed():
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = make_classification(n_samples=100, random_state=0)
+    model = LogisticRegression().fit(X, y)
+
+    slim, report = slim_tree_model(model, X)
+    assert slim is model
+    assert report is None
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from categorical_encoder import CategoricalEncoderPlan
+
+
+def _training_frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'points': rng.integers(0, 40, 200),
+        'position': rng.choice(['PG', 'SG', 'SF', 'PF', 'C'], 200, p=[0.4, 0.2, 0.2, 0.1, 0.1]),
+        'team': rng.choice([f't{i}' for i in range(20)], 200),
+    })
+    df.loc[:9, 'position'] = None
+    df.loc[:9, 'team'] = None
+    return df
+
+
+def _fill_mode(df):
+    # Wie MLTrainer._handle_missing_values
+    for col in ('position', 'team'):
+        df[col] = df[col].fillna(df[col].mode().iloc[0])
+    return df
+
+
+def test_missing_categorical_encoded_like_training():
+    df = _fill_mode(_training_frame())
+    plan = CategoricalEncoderPlan(max_onehot_categories=10).fit(df)
+    plan = CategoricalEncoderPlan.from_dict(plan.to_dict())
+
+    training_row = plan.transform(df.iloc[:1])
+    for record in ({'points': df['points'].iloc[0]}, {'points': df['points'].iloc[0], 'position': None, 'team': np.nan}):
+        encoded = plan.encode_records([record])
+        np.testing.assert_array_equal(encoded, training_row.to_numpy())
+
+
+def test_transform_fills_missing_with_training_mode():
+    df = _fill_mode(_training_frame())
+    plan = CategoricalEncoderPlan(max_onehot_categories=10).fit(df)
+
+    serving = df.iloc[:3].copy()
+    serving['position'] = None
+    expected = df.iloc[:3].copy()
+    expected['position'] = df['position'].mode().iloc[0]
+
+    np.testing.assert_array_equal(plan.transform(serving).to_numpy(), plan.transform(expected).to_numpy())
+
+
+def test_plan_without_fill_value_keeps_zero_encoding():
+    df = _fill_mode(_training_frame())
+    data = CategoricalEncoderPlan(max_onehot_categories=10).fit(df).to_dict()
+    for spec in data['columns']:
+        del spec['fill_value']
+    plan = CategoricalEncoderPlan.from_dict(data)
+
+    encoded = plan.encode_record({'points': 1, 'position': None})
+    assert all(encoded[name] == 0.0 for name in plan.columns[0]['output'])
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from data_loader import TrainingDataLoader
+
+
+def _write_csv(path, position):
+    n = len(position)
+    pd.DataFrame({
+        'points': np.arange(n) % 40,
+        'minutes_played': np.linspace(10, 40, n),
+        'position': position,
+        'win': np.arange(n) % 2,
+    }).to_csv(path, index=False)
+
+
+def test_category_column_empty_in_one_chunk(tmp_path):
+    path = tmp_path / 'games.csv'
+    # Zweiter Chunk hat keine Werte in 'position' (wird als float64 gelesen)
+    _write_csv(path, [['PG', 'SG', 'C', 'PF'][i % 4] for i in range(100)] + [None] * 100)
+
+    df = TrainingDataLoader({'csv_chunk_size': 100}).load_csv(path, keep_columns=['win'])
+
+    assert len(df) == 200
+    assert isinstance(df['position'].dtype, pd.CategoricalDtype)
+    assert sorted(df['position'].cat.categories) == ['C', 'PF', 'PG', 'SG']
+    assert df['position'].iloc[100:].isna().all()
+    assert df['position'].iloc[:4].tolist() == ['PG', 'SG', 'C', 'PF']
+
+
+def test_chunked_load_matches_single_chunk(tmp_path):
+    path = tmp_path / 'games.csv'
+    _write_csv(path, [['PG', 'SG', 'C'][i % 3] for i in range(300)])
+
+    chunked = TrainingDataLoader({'csv_chunk_size': 70}).load_csv(path, keep_columns=['win'])
+    single = TrainingDataLoader({'csv_chunk_size': 1000}).load_csv(path, keep_columns=['win'])
+
+    pd.testing.assert_frame_equal(chunked, single)
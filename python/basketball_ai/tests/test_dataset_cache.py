@@ -0,0 +1,23 @@
+import pandas as pd
+
+from dataset_cache import PreprocessedDatasetCache
+
+
+def _key(tmp_path, **config):
+    cache = PreprocessedDatasetCache({'dataset_cache_dir': str(tmp_path / 'cache'), **config})
+    data = pd.DataFrame({'points': [10, 12, 8], 'team': ['a', 'b', 'a'], 'win': [1, 0, 1]})
+    return cache.key(data, 'win', use_auto_features=True)
+
+
+def test_unrelated_config_key_keeps_the_cache_key(tmp_path):
+    base = _key(tmp_path, random_state=42)
+
+    assert _key(tmp_path, random_state=42, mlflow_uri='sqlite:///other.db', new_runtime_option=True) == base
+    assert _key(tmp_path, random_state=42, dataset_cache_max_entries=3) == base
+
+
+def test_pipeline_config_key_changes_the_cache_key(tmp_path):
+    base = _key(tmp_path, random_state=42)
+
+    assert _key(tmp_path, random_state=7) != base
+    assert _key(tmp_path, random_state=42, max_onehot_categories=3) != base
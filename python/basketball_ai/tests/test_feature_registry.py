@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from feature_registry import FEATURE_REGISTRY, INFERENCE_FEATURES, TRAINER_FEATURES
+
+
+def _stats():
+    return pd.DataFrame({
+        'points': [20, 0, 12],
+        'minutes': [30, 0, 24],
+        'shots_made': [8, 0, 5],
+        'shots_attempted': [16, 0, 10],
+        'rebounds': [5, 2, 7],
+        'assists': [4, 1, 3],
+        'turnovers': [2, 0, 4],
+        'steals': [1, 0, 2],
+        'blocks': [0, 1, 1],
+    })
+
+
+def test_trainer_features_match_formulas():
+    df = _stats()
+    plan = FEATURE_REGISTRY.plan(TRAINER_FEATURES, df.columns)
+    features = pd.DataFrame(plan.compute(df), columns=plan.names)
+
+    # 'minutes' wird über den Alias für minutes_played aufgelöst, Nenner 0 -> 0
+    np.testing.assert_allclose(features['shooting_percentage'], [0.5, 0.0, 0.5])
+    np.testing.assert_allclose(features['points_per_minute'], [20 / 30, 0.0, 0.5])
+    np.testing.assert_allclose(features['defensive_actions'], [1, 1, 3])
+    np.testing.assert_allclose(features['efficiency'], [4.5, 3.0, 2.5])
+
+
+def test_plan_skips_features_without_inputs():
+    plan = FEATURE_REGISTRY.plan(INFERENCE_FEATURES, ['points', 'steals', 'blocks'], model_type='player_performance')
+
+    assert plan.names == ['defensive_actions']
+
+
+def test_plan_is_cached_per_request_and_columns():
+    columns = tuple(_stats().columns)
+
+    assert FEATURE_REGISTRY.plan(TRAINER_FEATURES, columns) is FEATURE_REGISTRY.plan(TRAINER_FEATURES, columns)
+
+
+def test_missing_values_count_as_zero():
+    df = _stats().astype(float)
+    df.loc[0, 'steals'] = np.nan
+    plan = FEATURE_REGISTRY.plan(['defensive_actions'], df.columns)
+
+    np.testing.assert_allclose(plan.apply(df)['defensive_actions'], [0, 1, 3])
@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+
+from fold_cache import FoldCache
+
+
+def test_fingerprint_hashes_string_labels_by_value():
+    X = pd.DataFrame({'points': [10, 12, 8, 15]})
+    labels = ['win', 'loss', 'win', 'loss']
+
+    # Gleiche Labels in neu erzeugten Objekten -> gleicher Hash
+    first = FoldCache.fingerprint(X, np.array([str(label) for label in labels], dtype=object))
+    second = FoldCache.fingerprint(X, pd.Series([''.join(label) for label in labels]))
+
+    assert first == second
+    assert FoldCache.fingerprint(X, np.array(['loss', 'win', 'win', 'loss'], dtype=object)) != first
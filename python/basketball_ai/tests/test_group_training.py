@@ -0,0 +1,80 @@
+import io
+
+import joblib
+import numpy as np
+
+from group_training import GroupModelStore, build_group_model, group_slices
+
+
+def test_group_slices_cover_each_group_once():
+    groups = np.array(['b', 'a', 'c', 'a', 'b', 'a'])
+    order, sorted_groups, slices = group_slices(groups)
+
+    assert [key for key, _, _ in slices] == ['a', 'b', 'c']
+    for key, begin, end in slices:
+        assert set(sorted_groups[begin:end]) == {key}
+        assert sorted(order[begin:end]) == list(np.flatnonzero(groups == key))
+
+
+def test_store_round_trip(tmp_path):
+    rng = np.random.default_rng(0)
+    X, y = rng.random((40, 3)), rng.random(40)
+    model = build_group_model('linear', 'regression', {}).fit(X, y)
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+
+    store = GroupModelStore(tmp_path / 'groups.sqlite')
+    try:
+        store.set_metadata({'feature_names': ['a', 'b', 'c'], 'task': 'regression'})
+        store.put_many([{
+            'group_key': '7', 'family': 'linear', 'n_rows': 40,
+            'metrics': {'cv_r2': 0.1}, 'model_bytes': buffer.getvalue(),
+        }])
+
+        loaded = store.load(7)
+        assert store.groups() == ['7']
+        assert loaded['feature_names'] == ['a', 'b', 'c']
+        assert loaded['n_rows'] == 40
+        np.testing.assert_allclose(loaded['model'].predict(X), model.predict(X))
+    finally:
+        store.close()
+
+
+def test_retraining_replaces_store(tmp_path, monkeypatch):
+    import mlflow
+    import pandas as pd
+    from ml_trainer import MLTrainer
+
+    # MLflow-Artifacts und Optuna-Storage landen relativ zum Arbeitsverzeichnis
+    monkeypatch.chdir(tmp_path)
+    trainer = MLTrainer({
+        'models_dir': str(tmp_path / 'models'),
+        'mlflow_uri': f"sqlite:///{tmp_path / 'mlflow.db'}",
+        'mlflow_async_logging': False,
+        'dataset_cache_enabled': False,
+        'group_model_families': ['linear'],
+        'batch_max_workers': 1,
+    })
+    rng = np.random.default_rng(0)
+    games = pd.DataFrame({
+        'player': np.repeat(np.arange(6), 30),
+        'minutes_played': rng.random(180) * 40,
+        'rebounds': rng.random(180) * 10,
+    })
+    games['points'] = games['minutes_played'] * 0.5 + rng.normal(0, 1, 180)
+
+    try:
+        trainer.train_group_models(games, 'points', 'player', run_name='rerun')
+        result = trainer.train_group_models(
+            games[games['player'] < 2].drop(columns=['rebounds']), 'points', 'player', run_name='rerun'
+        )
+
+        store = GroupModelStore(result['store_path'])
+        try:
+            assert store.groups() == ['0', '1']
+            assert 'rebounds' not in store.metadata()['feature_names']
+        finally:
+            store.close()
+    finally:
+        if mlflow.active_run():
+            mlflow.end_run()
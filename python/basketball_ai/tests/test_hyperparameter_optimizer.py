@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import Ridge
+
+from fold_cache import fit_and_score_fold
+from hyperparameter_optimizer import HyperparameterOptimizer
+
+
+class _Tracker:
+    def create_run(self, name):
+        return 'run'
+
+    def log_metric(self, *args, **kwargs):
+        pass
+
+    def log_dict(self, *args, **kwargs):
+        pass
+
+    def terminate_run(self, *args, **kwargs):
+        pass
+
+
+def test_trials_use_the_requested_scoring(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.random((120, 3)), columns=['a', 'b', 'c'])
+    y = pd.Series(X['a'] * 10 + rng.normal(0, 0.1, 120))
+
+    scorings = []
+
+    def recording_fit_and_score(model, fold, scoring):
+        scorings.append(scoring)
+        return fit_and_score_fold(model, fold, scoring)
+
+    monkeypatch.setattr('hyperparameter_optimizer.fit_and_score_fold', recording_fit_and_score)
+    optimizer = HyperparameterOptimizer(
+        {'optuna_storage': f"sqlite:///{tmp_path / 'optuna.db'}", 'n_trials': 2}, tracker=_Tracker()
+    )
+    optimizer.optimize(
+        Ridge, X, y, 'ridge', cv_folds=3,
+        problem_type='regression', scoring='neg_mean_absolute_error'
+    )
+
+    assert scorings and set(scorings) == {'neg_mean_absolute_error'}
+    assert optimizer.optimization_history[-1]['study_name'] == 'ridge_regression_optimization_neg_mean_absolute_error'
+    assert optimizer.optimization_history[-1]['best_score'] < 0
@@ -0,0 +1,83 @@
+import sqlite3
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+from mlflow_logger import AsyncMLflowLogger
+
+
+class _Client:
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.batch_calls = 0
+        self.params = {}
+        self.metrics = {}
+        self.dicts = []
+
+    def log_batch(self, run_id, metrics=(), params=()):
+        self.batch_calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        for param in params:
+            if param.key == 'bad':
+                raise MlflowException(f"Changing param values is not allowed: {param.key}",
+                                      error_code=INVALID_PARAMETER_VALUE)
+        self.params.update({param.key: param.value for param in params})
+        self.metrics.update({metric.key: metric.value for metric in metrics})
+
+    def log_dict(self, run_id, dictionary, artifact_file):
+        self.dicts.append(artifact_file)
+
+
+def _logger(tmp_path, client):
+    logger = AsyncMLflowLogger({
+        'mlflow_journal_dir': str(tmp_path / 'journal'),
+        'mlflow_flush_interval': 0.01,
+        'mlflow_flush_retries': 3
+    })
+    logger.client = client
+    return logger
+
+
+def _log_entries(logger):
+    logger.log_param('good', 1, run_id='run')
+    logger.log_param('bad', 2, run_id='run')
+    logger.log_metric('accuracy', 0.9, run_id='run')
+    logger.log_dict({'a': 1}, 'report.json', run_id='run')
+
+
+def test_rejected_entry_is_dropped_and_acked(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = _Client()
+    logger = _logger(tmp_path, client)
+
+    _log_entries(logger)
+    assert logger.flush(timeout=10)
+
+    assert client.params == {'good': '1'}
+    assert client.metrics == {'accuracy': 0.9}
+    assert client.dicts == ['report.json']
+    assert logger.stats['dropped'] == 1
+    assert logger.stats['flushed'] == 4
+
+    # Alles bestätigt: kein Journal bleibt zum Nachliefern zurück
+    logger.close()
+    assert list((tmp_path / 'journal').glob('*.jsonl')) == []
+
+
+def test_transient_error_is_retried_without_rewriting_other_entries(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = _Client(failures=[sqlite3.OperationalError('database is locked')])
+    logger = _logger(tmp_path, client)
+
+    logger.log_param('good', 1, run_id='run')
+    logger.log_metric('accuracy', 0.9, run_id='run')
+    logger.log_dict({'a': 1}, 'report.json', run_id='run')
+    assert logger.flush(timeout=10)
+
+    assert client.batch_calls == 2
+    assert client.params == {'good': '1'}
+    assert client.dicts == ['report.json']
+    assert logger.stats['errors'] == 1
+    assert logger.stats['dropped'] == 0
+    logger.close()
@@ -0,0 +1,96 @@
+import io
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+
+from artifact_slimming import restore_model, slim_tree_model
+from model_pruning import ModelPruner, _cap_tree_depth
+
+
+def _restored_forest():
+    X, y = make_classification(n_samples=600, n_features=8, n_informative=5, random_state=0)
+    model = RandomForestClassifier(n_estimators=30, random_state=0).fit(X, y)
+    slim, _ = slim_tree_model(model, X)
+    buffer = io.BytesIO()
+    joblib.dump(slim, buffer)
+    buffer.seek(0)
+    return model, restore_model(joblib.load(buffer)), X, y
+
+
+def test_depth_cap_on_restored_forest_matches_original():
+    model, restored, X, _ = _restored_forest()
+
+    for before, after in zip(model.estimators_, restored.estimators_):
+        capped_before = _cap_tree_depth(before, 3)
+        capped_after = _cap_tree_depth(after, 3)
+        proba = capped_after.predict_proba(X)
+        np.testing.assert_allclose(proba.sum(axis=1), 1.0)
+        np.testing.assert_array_equal(proba, capped_before.predict_proba(X))
+
+
+def test_prune_restored_forest_keeps_valid_probabilities():
+    _, restored, X, y = _restored_forest()
+    pruner = ModelPruner({'prune_tolerance': 0.05, 'prune_depth_caps': [3, 4], 'profile_batch_rows': 100})
+
+    pruned, report = pruner.prune(restored, X[:300], y[:300], X[300:], y[300:], 'roc_auc')
+
+    np.testing.assert_allclose(pruned.predict_proba(X).sum(axis=1), 1.0)
+    if report['accepted']:
+        assert report['score_after'] >= report['score_before'] * (1 - 0.05)
+
+
+def _overfit_forest():
+    # Auswahl auf Trainingszeilen: dort halten auch sehr kleine Ensembles die Toleranz
+    X, y = make_classification(n_samples=1200, n_features=8, n_informative=4, flip_y=0.15, random_state=0)
+    model = RandomForestClassifier(n_estimators=40, random_state=0).fit(X[:600], y[:600])
+    return model, X, y
+
+
+@pytest.mark.parametrize('tolerance', [0.002, 0.02])
+def test_candidate_must_hold_tolerance_on_check_rows(tolerance):
+    model, X, y = _overfit_forest()
+    pruner = ModelPruner({'prune_tolerance': tolerance, 'profile_batch_rows': 100})
+
+    pruned, report = pruner.prune(model, X[:600], y[:600], X[600:], y[600:], 'roc_auc')
+
+    min_score = report['score_before'] - tolerance * abs(report['score_before'])
+    checked = [c for c in report['candidates'] if 'check_score' in c]
+    assert any(c['check_score'] < min_score for c in checked)
+
+    if report['accepted']:
+        assert report['score_after'] >= min_score
+        assert pruned is not model
+    else:
+        assert pruned is model
+
+
+def test_prune_model_does_not_save_rejected_candidate(tmp_path, monkeypatch):
+    import pandas as pd
+    from ml_trainer import MLTrainer
+
+    monkeypatch.chdir(tmp_path)
+    trainer = MLTrainer({
+        'models_dir': str(tmp_path / 'models'),
+        'mlflow_uri': f"sqlite:///{tmp_path / 'mlflow.db'}",
+        'mlflow_async_logging': False,
+        'dataset_cache_enabled': False,
+        'prune_tolerance': 0.002,
+    })
+    model, X, y = _overfit_forest()
+    model_path = trainer._save_model(model, 'random_forest', {}, name='forest', feature_names=[f'f{i}' for i in range(8)])
+    validation = pd.DataFrame(X[600:], columns=[f'f{i}' for i in range(8)]).assign(win=y[600:])
+
+    def reject(model, *args, **kwargs):
+        return model, {'scoring': 'roc_auc', 'tolerance': 0.002, 'accepted': False, 'candidates': []}
+
+    monkeypatch.setattr(trainer.model_pruner, 'prune', reject)
+    saved_before = set((tmp_path / 'models').glob('*.pkl'))
+
+    result = trainer.prune_model(str(model_path), validation, 'win')
+
+    assert result['model_path'] is None
+    assert result['report']['accepted'] is False
+    assert set((tmp_path / 'models').glob('*.pkl')) == saved_before
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rolling_features import RollingFeatureEngine
+
+CONFIG = {'rolling_acwr': {'column': 'minutes_played', 'acute_days': 7, 'chronic_days': 21}}
+
+
+def _game_log(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    games = pd.DataFrame({
+        'player_id': rng.integers(0, 12, n),
+        # Wenige Tage -> mehrere Spiele pro Spieler und Tag
+        'game_date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 90, n), unit='D'),
+        'minutes_played': rng.integers(0, 40, n).astype(float),
+        'points': rng.integers(0, 30, n).astype(float),
+    })
+    games.loc[rng.random(n) < 0.1, 'points'] = np.nan
+    return games.sample(frac=1, random_state=1)
+
+
+def _brute_force(games, index, windows=(7, 14, 28), halflife=7):
+    """
+    Direkte pandas-Berechnung für eine Zeile: nur Spiele früherer Kalendertage
+    """
+    row = games.loc[index]
+    day = row['game_date']
+    history = games[(games['player_id'] == row['player_id']) & (games['game_date'] < day)]
+    expected = {}
+
+    for window in windows:
+        in_window = history[history['game_date'] >= day - pd.Timedelta(days=window)]
+        expected[f'games_last_{window}_days'] = len(in_window)
+        for column, prefix in (('minutes_played', 'minutes'), ('points', 'points')):
+            expected[f'{prefix}_last_{window}_days'] = in_window[column].sum()
+            expected[f'{prefix}_avg_last_{window}_days'] = in_window[column].mean()
+
+    weights = 0.5 ** ((day - history['game_date']).dt.days / halflife)
+    for column, prefix in (('minutes_played', 'minutes'), ('points', 'points')):
+        valid = history[column].notna()
+        expected[f'{prefix}_ewm_{halflife}d'] = (
+            (history[column][valid] * weights[valid]).sum() / weights[valid].sum() if valid.any() else np.nan
+        )
+
+    acute = history[history['game_date'] >= day - pd.Timedelta(days=7)]['minutes_played'].sum() / 7
+    chronic = history[history['game_date'] >= day - pd.Timedelta(days=21)]['minutes_played'].sum() / 21
+    expected['acwr_minutes'] = acute / chronic if chronic > 0 else np.nan
+    expected['days_since_last_game'] = (day - history['game_date'].max()).days if len(history) else np.nan
+
+    return expected
+
+
+def test_transform_matches_brute_force():
+    games = _game_log()
+    features = RollingFeatureEngine(CONFIG).transform(games)
+
+    assert list(features.index) == list(games.index)
+    for index in games.index:
+        for name, value in _brute_force(games, index).items():
+            assert np.isclose(features.loc[index, name], value, equal_nan=True), (index, name)
+
+
+def test_features_ignore_same_day_and_future_games():
+    games = _game_log()
+    features = RollingFeatureEngine(CONFIG).transform(games)
+
+    cut = pd.Timestamp('2025-02-15')
+    changed = games.copy()
+    later = changed['game_date'] >= cut
+    changed.loc[later, ['minutes_played', 'points']] += 100
+    changed_features = RollingFeatureEngine(CONFIG).transform(changed)
+
+    # Zeilen am Stichtag und davor sehen keine Werte ab dem Stichtag
+    pd.testing.assert_frame_equal(features[games['game_date'] <= cut], changed_features[games['game_date'] <= cut])
+
+
+def test_incremental_update_matches_full_transform():
+    games = _game_log(n=600).sort_values('game_date')
+    cut = pd.Timestamp('2025-03-01')
+
+    engine = RollingFeatureEngine(CONFIG)
+    engine.transform(games[games['game_date'] < cut])
+    incremental = pd.concat([
+        engine.update(day_games) for _, day_games in games[games['game_date'] >= cut].groupby('game_date')
+    ])
+
+    full = RollingFeatureEngine(CONFIG).transform(games).loc[incremental.index]
+    np.testing.assert_allclose(incremental.to_numpy(), full.to_numpy(), equal_nan=True)
+
+
+def test_update_rejects_games_before_known_history():
+    games = _game_log().sort_values('game_date')
+    engine = RollingFeatureEngine(CONFIG)
+    engine.transform(games)
+
+    with pytest.raises(ValueError):
+        engine.update(games.head(3))
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ml_trainer import MLTrainer
+
+
+def _trainer(tmp_path, **config):
+    return MLTrainer({
+        'models_dir': str(tmp_path / 'models'),
+        'mlflow_uri': f"sqlite:///{tmp_path / 'mlflow.db'}",
+        'mlflow_async_logging': False,
+        'dataset_cache_enabled': False,
+        'checkpoint_training': True,
+        'slim_tree_artifacts': False,
+        **config,
+    })
+
+
+def _games():
+    rng = np.random.default_rng(0)
+    games = pd.DataFrame(rng.random((200, 4)), columns=['points', 'rebounds', 'assists', 'turnovers'])
+    games['win'] = (games['points'] + rng.normal(0, 0.2, 200) > 0.5).astype(int)
+    return games
+
+
+def _train(trainer, games):
+    return trainer.train_model(
+        games, 'win', model_type='random_forest', use_auto_features=False, use_hyperopt=False, cv_folds=3
+    )
+
+
+def test_resume_skips_completed_stages(tmp_path, monkeypatch):
+    import mlflow
+
+    monkeypatch.chdir(tmp_path)
+    games = _games()
+
+    reference = _train(_trainer(tmp_path, models_dir=str(tmp_path / 'reference'), checkpoint_training=False), games)
+    mlflow.end_run()
+
+    trainer = _trainer(tmp_path)
+    fit_model = trainer._fit_model
+
+    def interrupted_fit(*args, **kwargs):
+        raise RuntimeError('abgebrochen')
+
+    monkeypatch.setattr(trainer, '_fit_model', interrupted_fit)
+    with pytest.raises(RuntimeError):
+        _train(trainer, games)
+    mlflow.end_run()
+
+    [pending] = trainer.list_checkpoints()
+    assert pending['completed'] == ['preprocess', 'select', 'split', 'search']
+
+    search_calls = []
+    monkeypatch.setattr(trainer, '_search_model', lambda *args, **kwargs: search_calls.append(args))
+    monkeypatch.setattr(trainer, '_fit_model', fit_model)
+    resumed = trainer.resume_training(pending['checkpoint_id'])
+
+    assert search_calls == []
+    assert trainer.list_checkpoints() == []
+    np.testing.assert_allclose(resumed['model'].feature_importances_, reference['model'].feature_importances_)
+    assert resumed['test_metrics']['basic_metrics'] == reference['test_metrics']['basic_metrics']
+
+
+def test_finished_checkpoint_is_not_reused(tmp_path, monkeypatch):
+    import mlflow
+
+    monkeypatch.chdir(tmp_path)
+    games = _games()
+    trainer = _trainer(tmp_path, keep_checkpoints=True)
+
+    first = _train(trainer, games)
+    first_run = mlflow.last_active_run().info.run_id
+    second = _train(trainer, games)
+
+    assert second['model_path'] != first['model_path']
+    assert mlflow.last_active_run().info.run_id != first_run
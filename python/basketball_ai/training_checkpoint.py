@@ -0,0 +1,162 @@
+"""
+Training Checkpoints für Basketball Analytics
+Persistierte Stage-Ergebnisse, damit abgebrochene Trainings-Runs fortgesetzt werden können
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+# Reihenfolge der Pipeline-Stages in MLTrainer.train_model
+STAGES = ['preprocess', 'select', 'split', 'search', 'fit', 'evaluate', 'save']
+
+
+class TrainingCheckpoint:
+    """
+    Lokaler Checkpoint eines Trainings-Runs
+
+    Jede abgeschlossene Stage wird als joblib-Datei gespeichert und in
+    state.json vermerkt. Ein deaktivierter Checkpoint führt die Stages
+    nur aus, ohne etwas zu speichern.
+    """
+
+    def __init__(self, root: Path, checkpoint_id: str, enabled: bool = True):
+        """
+        Initialize Training Checkpoint
+
+        Args:
+            root: Verzeichnis für alle Checkpoints
+            checkpoint_id: ID des Trainings-Runs
+            enabled: False = keine Persistenz
+        """
+        self.checkpoint_id = checkpoint_id
+        self.enabled = enabled
+        self.directory = Path(root) / checkpoint_id
+        self.state = {
+            'checkpoint_id': checkpoint_id,
+            'created_at': datetime.now().isoformat(),
+            'completed': [],
+            'meta': {},
+        }
+
+        if enabled:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            state_path = self.directory / 'state.json'
+            if state_path.exists():
+                with open(state_path) as f:
+                    self.state = json.load(f)
+
+    @classmethod
+    def disabled(cls) -> 'TrainingCheckpoint':
+        return cls(Path('.'), 'disabled', enabled=False)
+
+    @property
+    def completed(self) -> List[str]:
+        return self.state['completed']
+
+    @property
+    def finished(self) -> bool:
+        return 'finished_at' in self.state['meta']
+
+    def has(self, stage: str) -> bool:
+        return self.enabled and stage in self.state['completed']
+
+    def run(self, stage: str, fn: Callable[[], Any]) -> Any:
+        """
+        Stage ausführen oder das gespeicherte Ergebnis laden
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Unbekannte Stage: {stage}")
+
+        if self.has(stage):
+            logger.info(f"Checkpoint {self.checkpoint_id[:12]}: Stage '{stage}' übersprungen (gespeichert)")
+            return joblib.load(self.directory / f"{stage}.joblib")
+
+        result = fn()
+
+        if self.enabled:
+            self._save_stage(stage, result)
+
+        return result
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        return self.state['meta'].get(key, default)
+
+    def set_meta(self, key: str, value: Any):
+        self.state['meta'][key] = value
+        if self.enabled:
+            self._write_state()
+
+    def finish(self, keep: bool = False):
+        """
+        Run als abgeschlossen markieren, Stage-Dateien optional behalten
+        """
+        if not self.enabled:
+            return
+
+        if keep:
+            self.state['meta']['finished_at'] = datetime.now().isoformat()
+            self._write_state()
+        else:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def clear(self):
+        """
+        Gespeicherte Stages und State verwerfen, der Run startet von vorn
+        """
+        if not self.enabled:
+            return
+
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.state = {
+            'checkpoint_id': self.checkpoint_id,
+            'created_at': datetime.now().isoformat(),
+            'completed': [],
+            'meta': {},
+        }
+
+    def _save_stage(self, stage: str, result: Any):
+        path = self.directory / f"{stage}.joblib"
+        tmp_path = path.with_suffix('.tmp')
+        joblib.dump(result, tmp_path)
+        os.replace(tmp_path, path)
+
+        self.state['completed'].append(stage)
+        self._write_state()
+        logger.info(f"Checkpoint {self.checkpoint_id[:12]}: Stage '{stage}' gespeichert")
+
+    def _write_state(self):
+        # Atomar, damit ein Absturz beim Schreiben keinen kaputten State hinterlässt
+        tmp_path = self.directory / 'state.json.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2, default=str)
+        os.replace(tmp_path, self.directory / 'state.json')
+
+
+def list_checkpoints(root: Path) -> List[Dict[str, Any]]:
+    """
+    Unvollständige Checkpoints (z.B. für einen Resume nach Absturz)
+    """
+    checkpoints = []
+
+    for state_path in sorted(Path(root).glob('*/state.json')):
+        with open(state_path) as f:
+            state = json.load(f)
+        if 'finished_at' not in state['meta']:
+            checkpoints.append({
+                'checkpoint_id': state['checkpoint_id'],
+                'created_at': state['created_at'],
+                'completed': state['completed'],
+                'params': state['meta'].get('params'),
+            })
+
+    return checkpoints
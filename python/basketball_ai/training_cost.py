@@ -0,0 +1,196 @@
+"""
+Training Cost Estimator für Basketball Analytics
+Schätzt Fit-Zeit und Speicher pro Algorithmus aus kurzen Timing-Probes
+"""
+
+import logging
+import time
+import tracemalloc
+from typing import Dict, List, Tuple, Any
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split
+
+from fold_cache import FoldSet
+
+logger = logging.getLogger(__name__)
+
+
+class TrainingCostEstimator:
+    """
+    Kostenmodell für AutoML-Kandidaten
+
+    Jeder Kandidat wird auf zwei kleinen Subsamples trainiert. Aus den
+    Messungen wird ein Potenzgesetz cost(n) = a * n^b angepasst und auf die
+    volle Cross-Validation plus finales Fit hochgerechnet. Kandidaten über
+    dem Budget werden auf ein Subsample begrenzt oder übersprungen.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize Training Cost Estimator
+
+        Args:
+            config: Konfiguration (candidate_time_budget_seconds, candidate_memory_budget_mb,
+                cost_probe_rows, cost_min_subsample_rows)
+        """
+        self.time_budget = config.get('candidate_time_budget_seconds', 600)
+        self.memory_budget_mb = config.get('candidate_memory_budget_mb')
+        self.probe_rows = config.get('cost_probe_rows', (250, 1000))
+        self.min_subsample_rows = config.get('cost_min_subsample_rows', 1000)
+        self.random_state = config.get('random_state', 42)
+
+        self.last_report = {}
+
+    def plan(
+        self,
+        candidates: List[Tuple[str, Any, bool]],
+        fold_set: FoldSet
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Kosten schätzen und pro Kandidat entscheiden: run, subsample oder skip
+
+        Args:
+            candidates: (Name, Model, benötigt Skalierung)
+            fold_set: Gecachte Folds des Datasets
+
+        Returns:
+            Pro Kandidat: action, max_fraction, Schätzungen und Begründung
+        """
+        n_full = len(fold_set.y)
+        n_fold_train = len(fold_set.folds[0][0])
+        small, large = self.probe_rows
+
+        report = {}
+
+        # Bei kleinen Datasets ist die Probe teurer als das Training selbst
+        if (self.time_budget is None and self.memory_budget_mb is None) or n_fold_train <= 2 * large:
+            for name, _, _ in candidates:
+                report[name] = {'action': 'run', 'max_fraction': 1.0, 'reason': 'kein Budget oder kleines Dataset'}
+            self.last_report = report
+            return report
+
+        for name, model, needs_scaling in candidates:
+            X_tr, y_tr, _, _ = fold_set.fold(0, scaled=needs_scaling)
+
+            try:
+                t_small, m_small = self._probe(model, X_tr, y_tr, small, fold_set.stratified)
+                t_large, m_large = self._probe(model, X_tr, y_tr, large, fold_set.stratified)
+            except Exception as e:
+                report[name] = {'action': 'skip', 'max_fraction': 0.0, 'reason': f"Probe fehlgeschlagen: {e}"}
+                continue
+
+            report[name] = self._decide(
+                n_full, fold_set.n_splits, (small, large), (t_small, t_large), (m_small, m_large)
+            )
+
+            logger.info(
+                f"Kosten {name}: ~{report[name]['estimated_seconds']:.1f}s, "
+                f"~{report[name]['estimated_memory_mb']:.0f} MB -> {report[name]['action']}"
+            )
+
+        self.last_report = report
+        return report
+
+    def _probe(
+        self,
+        model: Any,
+        X: np.ndarray,
+        y: np.ndarray,
+        n_rows: int,
+        stratified: bool = True
+    ) -> Tuple[float, float]:
+        """
+        Fit-Zeit (s) und Peak-Speicher (MB) auf einem Subsample
+
+        Zeit und Speicher in getrennten Fits: tracemalloc bremst
+        allokationslastige Fits stark und würde die Zeit-Schätzung verzerren.
+        tracemalloc erfasst numpy/sklearn-Allokationen, nicht den nativen
+        Speicher von xgboost/lightgbm.
+        """
+        positions = np.arange(len(y))
+        try:
+            keep, _ = train_test_split(
+                positions, train_size=n_rows, random_state=self.random_state,
+                stratify=y if stratified else None
+            )
+        except ValueError:
+            keep, _ = train_test_split(positions, train_size=n_rows, random_state=self.random_state)
+        X_probe, y_probe = X[np.sort(keep)], y[np.sort(keep)]
+
+        start = time.perf_counter()
+        clone(model).fit(X_probe, y_probe)
+        seconds = time.perf_counter() - start
+
+        tracemalloc.start()
+        try:
+            clone(model).fit(X_probe, y_probe)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return seconds, peak / 1024 ** 2
+
+    @staticmethod
+    def _power_law(n: Tuple[int, int], cost: Tuple[float, float], min_exp: float, max_exp: float) -> Tuple[float, float]:
+        """
+        cost(n) = a * n^b aus zwei Messpunkten, Exponent begrenzt gegen Messrauschen
+        """
+        ratio = max(cost[1], 1e-9) / max(cost[0], 1e-9)
+        exponent = float(np.clip(np.log(ratio) / np.log(n[1] / n[0]), min_exp, max_exp))
+        coefficient = max(cost[1], 1e-9) / n[1] ** exponent
+        return coefficient, exponent
+
+    def _decide(
+        self,
+        n_full: int,
+        n_splits: int,
+        probe_rows: Tuple[int, int],
+        seconds: Tuple[float, float],
+        memory_mb: Tuple[float, float]
+    ) -> Dict[str, Any]:
+        """
+        Hochrechnung auf CV + finales Fit und Entscheidung gegen das Budget
+        """
+        a, b = self._power_law(probe_rows, seconds, 1.0, 3.0)
+        c, m = self._power_law(probe_rows, memory_mb, 0.5, 2.0)
+
+        # n_splits Fits auf (k-1)/k der Zeilen plus ein Fit auf allen
+        fold_share = (n_splits - 1) / n_splits
+        time_factor = n_splits * fold_share ** b + 1
+
+        estimated_seconds = a * n_full ** b * time_factor
+        estimated_memory = c * n_full ** m
+
+        # Größte Zeilenzahl, die in beide Budgets passt
+        max_rows = float(n_full)
+        reasons = []
+
+        if self.time_budget is not None and estimated_seconds > self.time_budget:
+            max_rows = min(max_rows, (self.time_budget / (a * time_factor)) ** (1 / b))
+            reasons.append(f"Zeit ~{estimated_seconds:.0f}s > Budget {self.time_budget}s (n^{b:.2f})")
+
+        if self.memory_budget_mb is not None and estimated_memory > self.memory_budget_mb:
+            max_rows = min(max_rows, (self.memory_budget_mb / c) ** (1 / m))
+            reasons.append(f"Speicher ~{estimated_memory:.0f} MB > Budget {self.memory_budget_mb} MB")
+
+        if not reasons:
+            action, max_fraction = 'run', 1.0
+        elif max_rows >= self.min_subsample_rows:
+            action, max_fraction = 'subsample', max_rows / n_full
+            reasons.append(f"Subsample auf {int(max_rows)} Zeilen")
+        else:
+            action, max_fraction = 'skip', 0.0
+            reasons.append(f"auch {self.min_subsample_rows} Zeilen passen nicht ins Budget")
+
+        return {
+            'action': action,
+            'max_fraction': max_fraction,
+            'estimated_seconds': estimated_seconds,
+            'estimated_memory_mb': estimated_memory,
+            'time_exponent': b,
+            'memory_exponent': m,
+            'probe_seconds': list(seconds),
+            'reason': '; '.join(reasons) or 'im Budget',
+        }
@@ -5,6 +5,7 @@ Handles batch predictions for multiple entities efficiently
 """
 
 import argparse
+import hashlib
 import json
 import pickle
 import joblib
@@ -18,6 +19,9 @@ from typing import Dict, Any, List
 import warnings
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import multiprocessing as mp
+import os
+import sqlite3
+import time
 
 # Suppress sklearn warnings
 warnings.filterwarnings('ignore')
@@ -30,10 +34,15 @@ class BasketballBatchPredictor(BasketballMLPredictor):
     Batch prediction class extending the single prediction functionality
     """
     
+    DEADLINE_SAFETY_SECONDS = 0.25  # Reserved for writing the final output
+    PROGRESS_WRITE_INTERVAL_SECONDS = 1.0  # Minimum gap between progress rewrites of the output file
+    
     def __init__(self, model_path: str, model_type: str, model_algorithm: str):
         super().__init__(model_path, model_type, model_algorithm)
-        self.batch_size = 100  # Process in batches to manage memory
+        self.batch_size = None  # Chunk size; None derives it from the memory budget
+        self.memory_budget_mb = 256  # Transient memory allowed per scoring chunk
         self.max_workers = min(4, mp.cpu_count())  # Limit concurrent threads
+        self._model_version = None
     
     def make_batch_predictions(self, batch_input_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -47,14 +56,19 @@ class BasketballBatchPredictor(BasketballMLPredictor):
             
             # Process in chunks to manage memory
             results = []
+            batch_size = self.batch_size or self.plan_chunk_size()
             
-            for i in range(0, total_samples, self.batch_size):
-                batch_chunk = batch_input_data[i:i + self.batch_size]
+            for i in range(0, total_samples, batch_size):
+                batch_chunk = batch_input_data[i:i + batch_size]
                 chunk_results = self._process_batch_chunk(batch_chunk)
+                
+                # Chunk-local indices -> batch indices
+                for result in chunk_results:
+                    result['batch_index'] = result.get('batch_index', 0) + i
                 results.extend(chunk_results)
                 
                 # Progress update
-                processed = min(i + self.batch_size, total_samples)
+                processed = min(i + batch_size, total_samples)
                 print(f"Processed {processed}/{total_samples} samples")
             
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -68,6 +82,7 @@ class BasketballBatchPredictor(BasketballMLPredictor):
                 'model_algorithm': self.model_algorithm,
                 'timestamp': datetime.now().isoformat(),
                 'success_rate': sum(1 for r in results if 'error' not in r) / len(results),
+                'chunk_size': batch_size,
             }
             
             return {
@@ -144,6 +159,158 @@ class BasketballBatchPredictor(BasketballMLPredictor):
                 'timestamp': datetime.now().isoformat(),
             }
     
+    def estimate_row_bytes(self) -> int:
+        """
+        Estimate the transient memory one row costs while it is being scored
+        """
+        n_features = len(self.feature_names) if self.feature_names else getattr(self.model, 'n_features_in_', 32)
+        itemsize = np.dtype(self.preprocessing_params.get('dtype', 'float64')).itemsize
+        
+        # Row dicts -> one-row DataFrames (pandas block overhead dominates), engineered frame, scaled matrix
+        row_bytes = 4096 + n_features * 64 + n_features * itemsize * 2
+        if self.scaler is not None:
+            row_bytes += n_features * itemsize
+        
+        # Per-row scratch the model allocates during predict/predict_proba
+        n_classes = len(getattr(self.model, 'classes_', [])) or 1
+        if hasattr(self.model, 'estimators_') or hasattr(self.model, 'tree_'):
+            # sklearn trees re-validate X as float32 and accumulate class probabilities
+            row_bytes += n_features * 4 + n_classes * 8 * 2
+        if hasattr(self.model, 'support_vectors_'):
+            # Kernel row against every support vector
+            row_bytes += len(self.model.support_vectors_) * 8
+        if hasattr(self.model, 'hidden_layer_sizes'):
+            hidden = self.model.hidden_layer_sizes
+            row_bytes += sum(hidden if isinstance(hidden, (list, tuple)) else [hidden]) * 8
+        row_bytes += n_classes * 8 * 2  # predict_proba + predict outputs
+        
+        return int(row_bytes)
+    
+    def plan_chunk_size(self) -> int:
+        """
+        Initial chunk size derived from the memory budget and the per-row cost
+        """
+        budget_bytes = self.memory_budget_mb * 1024 * 1024
+        return int(np.clip(budget_bytes // self.estimate_row_bytes(), AdaptiveChunkSizer.MIN_CHUNK, AdaptiveChunkSizer.MAX_CHUNK))
+    
+    def _iter_scored_chunks(self, batch_input_data: List[Dict[str, Any]], sizer: 'AdaptiveChunkSizer'):
+        """
+        Score the batch chunk by chunk, letting the sizer adapt the chunk length as it goes
+        """
+        offset = 0
+        total_samples = len(batch_input_data)
+        
+        while offset < total_samples:
+            chunk = batch_input_data[offset:offset + sizer.chunk_size]
+            sizer.start()
+            chunk_start = time.perf_counter()
+            
+            scored = self._score_batch(chunk)
+            scored['valid_indices'] = [offset + i for i in scored['valid_indices']]
+            offset += len(chunk)
+            
+            # A chunk of only invalid rows is skipped (like those rows in a single pass)
+            # and not recorded, its near-zero time would skew the sizer
+            if not scored['valid_indices']:
+                continue
+            
+            sizer.record(len(chunk), time.perf_counter() - chunk_start)
+            yield scored
+    
+    def _score_batch(self, batch_input_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run feature engineering and the model over the whole batch in one vectorized pass
+        """
+        # Convert all input data to DataFrame for vectorized processing
+        df_list = []
+        valid_indices = []
+        
+        for i, input_data in enumerate(batch_input_data):
+            try:
+                if self.categorical_encoder is not None:
+                    input_data = self.categorical_encoder.encode_record(input_data)
+                df_row = pd.DataFrame([input_data])
+                df_list.append(df_row)
+                valid_indices.append(i)
+            except Exception as e:
+                print(f"Warning: Could not process input {i}: {e}")
+        
+        if not df_list:
+            return self._empty_scores()
+        
+        # Combine all data
+        batch_df = pd.concat(df_list, ignore_index=True)
+        
+        # Apply basketball feature engineering to entire batch
+        batch_df = self._apply_basketball_feature_engineering(batch_df)
+        batch_df = self._handle_missing_values(batch_df)
+        
+        # Ensure we have the right features
+        if self.feature_names:
+            for feature in self.feature_names:
+                if feature not in batch_df.columns:
+                    batch_df[feature] = 0
+            batch_df = batch_df[self.feature_names]
+        
+        # Apply scaling to entire batch
+        if self.scaler is not None:
+            batch_features = self.scaler.transform(batch_df)
+        else:
+            batch_features = batch_df.values
+        
+        # Make batch predictions
+        if hasattr(self.model, 'predict_proba'):
+            # Classification
+            batch_probabilities = self.model.predict_proba(batch_features)
+            batch_predictions = self.model.predict(batch_features)
+            batch_confidences = np.max(batch_probabilities, axis=1)
+            classes = getattr(self.model, 'classes_', range(batch_probabilities.shape[1]))
+        else:
+            # Regression
+            batch_predictions = self.model.predict(batch_features)
+            batch_probabilities = None
+            batch_confidences = np.full(len(batch_predictions), 0.8)  # Default confidence
+            classes = None
+        
+        return {
+            'valid_indices': valid_indices,
+            'predictions': batch_predictions,
+            'probabilities': batch_probabilities,
+            'confidences': batch_confidences,
+            'classes': classes,
+        }
+    
+    def _format_scored_row(self, scored: Dict[str, Any], row: int, input_data: Dict[str, Any],
+                           processing_time_ms: float) -> Dict[str, Any]:
+        """
+        Build the full basketball result for one row of a scored batch
+        """
+        prediction = scored['predictions'][row]
+        confidence = float(scored['confidences'][row])
+        
+        if scored['probabilities'] is not None:
+            prob_dict = {
+                str(cls): float(scored['probabilities'][row][j])
+                for j, cls in enumerate(scored['classes'])
+            }
+        else:
+            prob_dict = None
+        
+        # Generate basketball-specific output
+        basketball_output = self._generate_basketball_output(prediction, prob_dict, input_data)
+        
+        return {
+            'prediction': float(prediction) if isinstance(prediction, (int, float, np.number)) else str(prediction),
+            'confidence': confidence,
+            'probabilities': prob_dict,
+            'processing_time_ms': processing_time_ms,
+            'model_type': self.model_type,
+            'model_algorithm': self.model_algorithm,
+            'batch_index': scored['valid_indices'][row],
+            'timestamp': datetime.now().isoformat(),
+            **basketball_output
+        }
+    
     def make_optimized_batch_predictions(self, batch_input_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Optimized batch prediction using vectorized operations where possible
@@ -151,95 +318,28 @@ class BasketballBatchPredictor(BasketballMLPredictor):
         start_time = datetime.now()
         
         try:
-            # Convert all input data to DataFrame for vectorized processing
-            df_list = []
-            valid_indices = []
-            
-            for i, input_data in enumerate(batch_input_data):
-                try:
-                    df_row = pd.DataFrame([input_data])
-                    df_list.append(df_row)
-                    valid_indices.append(i)
-                except Exception as e:
-                    print(f"Warning: Could not process input {i}: {e}")
-            
-            if not df_list:
-                raise ValueError("No valid input data to process")
+            sizer = AdaptiveChunkSizer(self.batch_size or self.plan_chunk_size(), self.memory_budget_mb, self.estimate_row_bytes())
+            results = {}
             
-            # Combine all data
-            batch_df = pd.concat(df_list, ignore_index=True)
-            
-            # Apply basketball feature engineering to entire batch
-            batch_df = self._apply_basketball_feature_engineering(batch_df)
-            batch_df = self._handle_missing_values(batch_df)
-            
-            # Ensure we have the right features
-            if self.feature_names:
-                for feature in self.feature_names:
-                    if feature not in batch_df.columns:
-                        batch_df[feature] = 0
-                batch_df = batch_df[self.feature_names]
-            
-            # Apply scaling to entire batch
-            if self.scaler is not None:
-                batch_features = self.scaler.transform(batch_df)
-            else:
-                batch_features = batch_df.values
-            
-            # Make batch predictions
-            if hasattr(self.model, 'predict_proba'):
-                # Classification
-                batch_probabilities = self.model.predict_proba(batch_features)
-                batch_predictions = self.model.predict(batch_features)
-                batch_confidences = np.max(batch_probabilities, axis=1)
-                classes = getattr(self.model, 'classes_', range(batch_probabilities.shape[1]))
-            else:
-                # Regression
-                batch_predictions = self.model.predict(batch_features)
-                batch_probabilities = None
-                batch_confidences = np.full(len(batch_predictions), 0.8)  # Default confidence
-                classes = None
-            
-            # Format results
-            results = []
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-            
-            for i, valid_idx in enumerate(valid_indices):
-                prediction = batch_predictions[i]
-                confidence = float(batch_confidences[i])
+            for scored in self._iter_scored_chunks(batch_input_data, sizer):
+                chunk_time = sizer.history[-1]['seconds'] * 1000
                 
-                if batch_probabilities is not None:
-                    prob_dict = {str(cls): float(batch_probabilities[i][j]) for j, cls in enumerate(classes)}
-                else:
-                    prob_dict = None
-                
-                # Generate basketball-specific output
-                basketball_output = self._generate_basketball_output(
-                    prediction, prob_dict, batch_input_data[valid_idx]
-                )
-                
-                result = {
-                    'prediction': float(prediction) if isinstance(prediction, (int, float, np.number)) else str(prediction),
-                    'confidence': confidence,
-                    'probabilities': prob_dict,
-                    'processing_time_ms': processing_time / len(valid_indices),  # Approximate per-sample time
-                    'model_type': self.model_type,
-                    'model_algorithm': self.model_algorithm,
-                    'batch_index': valid_idx,
-                    'timestamp': datetime.now().isoformat(),
-                    **basketball_output
-                }
-                
-                results.append(result)
+                # Format results
+                for i, valid_idx in enumerate(scored['valid_indices']):
+                    results[valid_idx] = self._format_scored_row(
+                        scored, i, batch_input_data[valid_idx],
+                        chunk_time / len(scored['valid_indices'])  # Approximate per-sample time
+                    )
+            
+            valid_indices = list(results)
+            processing_time = sum(entry['seconds'] for entry in sizer.history) * 1000
             
             # Fill in results for invalid indices
             full_results = []
-            result_idx = 0
             
             for original_idx in range(len(batch_input_data)):
-                if original_idx in valid_indices:
-                    full_results.append(results[result_idx])
-                    result_idx += 1
+                if original_idx in results:
+                    full_results.append(results[original_idx])
                 else:
                     full_results.append({
                         'error': 'Invalid input data',
@@ -257,6 +357,7 @@ class BasketballBatchPredictor(BasketballMLPredictor):
                     'model_type': self.model_type,
                     'model_algorithm': self.model_algorithm,
                     'optimization_used': True,
+                    'chunking': sizer.report(),
                     'timestamp': datetime.now().isoformat(),
                 }
             }
@@ -266,6 +367,396 @@ class BasketballBatchPredictor(BasketballMLPredictor):
             print(f"Optimized batch prediction failed, falling back to individual predictions: {e}")
             return self.make_batch_predictions(batch_input_data)
     
+    @staticmethod
+    def _empty_scores() -> Dict[str, Any]:
+        """
+        Scored batch without any valid row
+        """
+        return {
+            'valid_indices': [],
+            'predictions': np.empty(0),
+            'probabilities': None,
+            'confidences': np.empty(0),
+            'classes': None,
+        }
+    
+    def _merge_scored_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Concatenate per-chunk score arrays into one scored batch
+        """
+        if not chunks:
+            return self._empty_scores()
+        
+        return {
+            'valid_indices': [i for chunk in chunks for i in chunk['valid_indices']],
+            'predictions': np.concatenate([chunk['predictions'] for chunk in chunks]),
+            'probabilities': (
+                np.concatenate([chunk['probabilities'] for chunk in chunks])
+                if chunks[0]['probabilities'] is not None else None
+            ),
+            'confidences': np.concatenate([chunk['confidences'] for chunk in chunks]),
+            'classes': chunks[0]['classes'],
+        }
+    
+    def default_rank_by(self) -> str:
+        """
+        Natural ranking score for the loaded model type
+        """
+        return {
+            'injury_risk': 'injury_probability',
+            'game_outcome': 'win_probability',
+            'player_performance': 'predicted_points',
+        }.get(self.model_type, 'confidence')
+    
+    def _rank_scores(self, scored: Dict[str, Any], rank_by: str) -> np.ndarray:
+        """
+        Extract the ranking score for every scored row as a float array
+        """
+        if rank_by in ('injury_probability', 'win_probability'):
+            probabilities = scored['probabilities']
+            if probabilities is None:
+                return np.asarray(scored['predictions'], dtype=float)
+            
+            # Same positive-class lookup as the basketball output ('1', then 'Win')
+            class_labels = [str(cls) for cls in scored['classes']]
+            for positive in ('1', 'Win'):
+                if positive in class_labels:
+                    return probabilities[:, class_labels.index(positive)]
+            return np.zeros(len(probabilities)) if rank_by == 'injury_probability' else np.full(len(probabilities), 0.5)
+        
+        if rank_by in ('predicted_points', 'prediction'):
+            return np.asarray(scored['predictions'], dtype=float)
+        
+        if rank_by == 'confidence':
+            return np.asarray(scored['confidences'], dtype=float)
+        
+        raise ValueError(f"Unsupported rank-by score: {rank_by}")
+    
+    def _summarize_unranked(self, scores: np.ndarray, rank_by: str) -> Dict[str, Any]:
+        """
+        Summary counts for rows that did not make the top-k
+        """
+        summary = {'count': int(len(scores))}
+        
+        if len(scores) == 0:
+            return summary
+        
+        summary.update({
+            'min_score': float(np.min(scores)),
+            'max_score': float(np.max(scores)),
+            'mean_score': float(np.mean(scores)),
+        })
+        
+        categorizer = {
+            'injury_probability': self._categorize_injury_risk,
+            'win_probability': self._categorize_game_outcome,
+            'predicted_points': self._categorize_performance,
+            'prediction': self._categorize_performance if self.model_type == 'player_performance' else None,
+        }.get(rank_by)
+        
+        if categorizer is not None:
+            category_counts = {}
+            for score in scores.tolist():
+                category = categorizer(score)
+                category_counts[category] = category_counts.get(category, 0) + 1
+            summary['category_counts'] = category_counts
+        
+        return summary
+    
+    def make_ranked_predictions(
+        self,
+        batch_input_data: List[Dict[str, Any]],
+        top_k: int,
+        rank_by: str = None,
+        include_summary: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Score the whole batch vectorized and build detailed output only for the top-k rows
+        """
+        start_time = datetime.now()
+        rank_by = rank_by or self.default_rank_by()
+        
+        sizer = AdaptiveChunkSizer(self.batch_size or self.plan_chunk_size(), self.memory_budget_mb, self.estimate_row_bytes())
+        scored = self._merge_scored_chunks(list(self._iter_scored_chunks(batch_input_data, sizer)))
+        scores = self._rank_scores(scored, rank_by)
+        valid_count = len(scores)
+        k = max(0, min(top_k, valid_count))
+        
+        # Partial sort: find the k-th largest score, ties at the cut go to the earliest rows
+        if 0 < k < valid_count:
+            kth_score = np.partition(scores, valid_count - k)[valid_count - k]
+            above = np.flatnonzero(scores > kth_score)
+            ties = np.flatnonzero(scores == kth_score)[:k - len(above)]
+            top_rows = np.concatenate([above, ties])
+        else:
+            top_rows = np.arange(valid_count)[:k]
+        
+        # Only the top-k block is fully ordered
+        top_rows = top_rows[np.lexsort((top_rows, -scores[top_rows]))]
+        
+        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        valid_indices = scored['valid_indices']
+        
+        results = []
+        for rank, row in enumerate(top_rows.tolist(), start=1):
+            result = self._format_scored_row(
+                scored, row, batch_input_data[valid_indices[row]],
+                processing_time / valid_count if valid_count else 0
+            )
+            result['rank'] = rank
+            result['rank_score'] = float(scores[row])
+            results.append(result)
+        
+        ranking = {
+            'rank_by': rank_by,
+            'top_k': top_k,
+            'returned': len(results),
+            'scored_samples': valid_count,
+        }
+        
+        if include_summary:
+            rest_mask = np.ones(valid_count, dtype=bool)
+            rest_mask[top_rows] = False
+            ranking['rest_summary'] = self._summarize_unranked(scores[rest_mask], rank_by)
+        
+        return {
+            'predictions': results,
+            'ranking': ranking,
+            'batch_metadata': {
+                'total_samples': len(batch_input_data),
+                'valid_samples': valid_count,
+                'batch_processing_time_seconds': (datetime.now() - start_time).total_seconds(),
+                'average_time_per_sample_ms': processing_time / valid_count if valid_count else 0,
+                'model_type': self.model_type,
+                'model_algorithm': self.model_algorithm,
+                'optimization_used': True,
+                'ranking_mode': True,
+                'chunking': sizer.report(),
+                'timestamp': datetime.now().isoformat(),
+            }
+        }
+    
+    def make_deadline_predictions(
+        self,
+        batch_input_data: List[Dict[str, Any]],
+        deadline_at: float,
+        output_file: str = None,
+        priority_key: str = 'priority'
+    ) -> Dict[str, Any]:
+        """
+        Score rows in priority order until the deadline, writing completed results as they finish
+        
+        deadline_at is a time.monotonic() timestamp. Rows not scored in time are listed in
+        'unprocessed_indices' so the caller can retry only the remainder.
+        """
+        start_time = datetime.now()
+        total_samples = len(batch_input_data)
+        
+        # Higher priority first, input order breaks ties
+        order = sorted(
+            range(total_samples),
+            key=lambda i: (-self._row_priority(batch_input_data[i], priority_key), i)
+        )
+        
+        sizer = AdaptiveChunkSizer(self.batch_size or self.plan_chunk_size(), self.memory_budget_mb, self.estimate_row_bytes())
+        results = {}
+        position = 0
+        deadline_hit = False
+        last_progress_write = time.monotonic()
+        
+        while position < total_samples:
+            remaining = deadline_at - time.monotonic() - self.DEADLINE_SAFETY_SECONDS
+            if remaining <= 0:
+                deadline_hit = True
+                break
+            
+            # Don't start a chunk that cannot finish in the remaining time
+            chunk_size = sizer.chunk_size
+            if sizer.history:
+                rows_per_second = sizer.history[-1]['rows_per_second']
+                chunk_size = max(1, min(chunk_size, int(rows_per_second * remaining * 0.8)))
+            
+            chunk_indices = order[position:position + chunk_size]
+            sizer.start()
+            chunk_start = time.perf_counter()
+            
+            try:
+                scored = self._score_batch([batch_input_data[i] for i in chunk_indices])
+                chunk_seconds = time.perf_counter() - chunk_start
+                
+                for row, local_index in enumerate(scored['valid_indices']):
+                    original_index = chunk_indices[local_index]
+                    results[original_index] = self._format_scored_row(
+                        scored, row, batch_input_data[original_index],
+                        chunk_seconds * 1000 / len(chunk_indices)
+                    )
+                    results[original_index]['batch_index'] = original_index
+            except Exception as e:
+                chunk_seconds = time.perf_counter() - chunk_start
+                for original_index in chunk_indices:
+                    results[original_index] = {
+                        'error': str(e),
+                        'batch_index': original_index,
+                        'timestamp': datetime.now().isoformat(),
+                    }
+            
+            for original_index in chunk_indices:
+                results.setdefault(original_index, {
+                    'error': 'Invalid input data',
+                    'batch_index': original_index,
+                    'timestamp': datetime.now().isoformat(),
+                })
+            
+            sizer.record(len(chunk_indices), chunk_seconds)
+            position += len(chunk_indices)
+            
+            # Each rewrite serializes every finished row, so throttle by time to keep I/O linear
+            if output_file and time.monotonic() - last_progress_write >= self.PROGRESS_WRITE_INTERVAL_SECONDS:
+                self._write_progress(output_file, self._deadline_result(
+                    results, order[position:], total_samples, start_time, deadline_at, sizer, 'in_progress'
+                ))
+                last_progress_write = time.monotonic()
+        
+        status = 'partial' if deadline_hit else 'complete'
+        print(f"Deadline mode: {len(results)}/{total_samples} samples processed ({status})")
+        
+        return self._deadline_result(results, order[position:], total_samples, start_time, deadline_at, sizer, status)
+    
+    def _deadline_result(self, results: Dict[int, Dict[str, Any]], unprocessed: List[int], total_samples: int,
+                         start_time: datetime, deadline_at: float, sizer: 'AdaptiveChunkSizer',
+                         status: str) -> Dict[str, Any]:
+        """
+        Assemble the (possibly partial) result of a deadline-bound run
+        """
+        predictions = [results[i] for i in sorted(results)]
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        return {
+            'predictions': predictions,
+            'unprocessed_indices': sorted(unprocessed),
+            'batch_metadata': {
+                'total_samples': total_samples,
+                'processed_samples': len(predictions),
+                'unprocessed_samples': len(unprocessed),
+                'status': status,
+                'deadline_remaining_ms': (deadline_at - time.monotonic()) * 1000,
+                'batch_processing_time_seconds': processing_time,
+                'average_time_per_sample_ms': (processing_time * 1000) / len(predictions) if predictions else 0,
+                'model_type': self.model_type,
+                'model_algorithm': self.model_algorithm,
+                'chunking': sizer.report(),
+                'timestamp': datetime.now().isoformat(),
+                'success_rate': sum(1 for r in predictions if 'error' not in r) / len(predictions) if predictions else 0,
+            }
+        }
+    
+    @staticmethod
+    def _row_priority(row: Any, priority_key: str) -> float:
+        """
+        Numeric priority of a row; missing or unparseable values (e.g. "high") count as 0
+        """
+        if not isinstance(row, dict):
+            return 0.0
+        try:
+            priority = float(row.get(priority_key) or 0)
+        except (TypeError, ValueError):
+            return 0.0
+        return priority if np.isfinite(priority) else 0.0
+    
+    @staticmethod
+    def _write_progress(output_file: str, result: Dict[str, Any]):
+        """
+        Atomically replace the output file so a reader never sees a half-written JSON
+        """
+        tmp_file = f"{output_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(result, f, default=str)
+        os.replace(tmp_file, output_file)
+    
+    def model_version(self) -> str:
+        """
+        Content hash of the loaded model file, used to invalidate stored results on retrain
+        """
+        if self._model_version is None:
+            digest = hashlib.sha256()
+            with open(self.model_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            digest.update(f"{self.model_type}:{self.model_algorithm}".encode())
+            self._model_version = digest.hexdigest()
+        return self._model_version
+    
+    def make_incremental_predictions(
+        self,
+        batch_input_data: List[Dict[str, Any]],
+        store: 'FingerprintStore',
+        entity_key: str = 'player_id'
+    ) -> Dict[str, Any]:
+        """
+        Only rescore rows whose inputs changed since the last run; serve the rest from the store
+        """
+        start_time = datetime.now()
+        model_version = self.model_version()
+        total_samples = len(batch_input_data)
+        
+        fingerprints = [FingerprintStore.fingerprint(row, model_version) for row in batch_input_data]
+        entity_ids = [
+            str(row[entity_key]) if isinstance(row, dict) and row.get(entity_key) is not None else None
+            for row in batch_input_data
+        ]
+        stored = store.lookup([e for e in entity_ids if e is not None], model_version)
+        
+        results = [None] * total_samples
+        changed_indices = []
+        
+        for i, (entity_id, fingerprint) in enumerate(zip(entity_ids, fingerprints)):
+            cached = stored.get(entity_id) if entity_id is not None else None
+            if cached is not None and cached[0] == fingerprint:
+                result = cached[1]
+                result['batch_index'] = i
+                result['from_fingerprint_store'] = True
+                results[i] = result
+            else:
+                changed_indices.append(i)
+        
+        print(f"Incremental rescoring: {len(changed_indices)} changed, {total_samples - len(changed_indices)} unchanged")
+        
+        if changed_indices:
+            changed_result = self.make_optimized_batch_predictions(
+                [batch_input_data[i] for i in changed_indices]
+            )
+            updates = []
+            
+            for local_index, prediction in enumerate(changed_result['predictions']):
+                original_index = changed_indices[local_index]
+                prediction['batch_index'] = original_index
+                results[original_index] = prediction
+                
+                if 'error' not in prediction and entity_ids[original_index] is not None:
+                    updates.append((entity_ids[original_index], fingerprints[original_index], prediction))
+            
+            store.save(updates, model_version)
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        return {
+            'predictions': results,
+            'batch_metadata': {
+                'total_samples': total_samples,
+                'recomputed_samples': len(changed_indices),
+                'reused_samples': total_samples - len(changed_indices),
+                'entity_key': entity_key,
+                'model_version': model_version,
+                'batch_processing_time_seconds': processing_time,
+                'average_time_per_sample_ms': (processing_time * 1000) / total_samples if total_samples else 0,
+                'model_type': self.model_type,
+                'model_algorithm': self.model_algorithm,
+                'incremental': True,
+                'timestamp': datetime.now().isoformat(),
+                'success_rate': sum(1 for r in results if 'error' not in r) / total_samples if total_samples else 0,
+            }
+        }
+    
     def analyze_batch_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze batch prediction results to provide insights
@@ -335,34 +826,509 @@ class BasketballBatchPredictor(BasketballMLPredictor):
         return analysis
 
 
+def _current_rss_bytes() -> int:
+    """
+    Resident set size of this process (0 if it cannot be determined)
+    """
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class AdaptiveChunkSizer:
+    """
+    Adjusts the scoring chunk size from observed throughput and RSS growth
+    """
+    
+    MIN_CHUNK = 32
+    MAX_CHUNK = 100000
+    
+    def __init__(self, initial_size: int, memory_budget_mb: float, row_bytes: int):
+        self.initial_size = int(initial_size)
+        self.chunk_size = self.initial_size
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self.row_bytes = row_bytes
+        self.chunk_start_rss = 0
+        self.history = []
+    
+    def start(self):
+        """
+        Mark the start of a chunk so its RSS growth can be measured
+        """
+        self.chunk_start_rss = _current_rss_bytes()
+    
+    def record(self, rows: int, seconds: float):
+        """
+        Record a finished chunk and pick the size of the next one
+        """
+        rss = _current_rss_bytes()
+        throughput = rows / seconds if seconds > 0 else float('inf')
+        self.history.append({
+            'size': rows,
+            'seconds': seconds,
+            'rows_per_second': throughput,
+            'rss_mb': rss / (1024 * 1024),
+            'rss_growth_mb': (rss - self.chunk_start_rss) / (1024 * 1024) if rss and self.chunk_start_rss else None,
+        })
+        
+        # Growth during this chunk only; accumulated results are not transient scratch
+        rss_growth = rss - self.chunk_start_rss if rss and self.chunk_start_rss else 0
+        
+        if rss_growth > self.memory_budget_bytes:
+            # Over budget: back off hard
+            self.chunk_size = max(self.MIN_CHUNK, self.chunk_size // 2)
+        elif rows == self.chunk_size and len(self.history) >= 2:
+            previous = self.history[-2]['rows_per_second']
+            if throughput >= previous and rss_growth < self.memory_budget_bytes / 2:
+                # Bigger chunks still pay off and memory has headroom
+                self.chunk_size = min(self.MAX_CHUNK, int(self.chunk_size * 1.5))
+            elif throughput < previous * 0.8:
+                self.chunk_size = max(self.MIN_CHUNK, int(self.chunk_size * 0.75))
+    
+    def report(self) -> Dict[str, Any]:
+        """
+        Chosen chunk sizes and their observed throughput
+        """
+        return {
+            'memory_budget_mb': self.memory_budget_bytes / (1024 * 1024),
+            'estimated_row_bytes': self.row_bytes,
+            'initial_chunk_size': self.initial_size,
+            'final_chunk_size': self.chunk_size,
+            'chunks': self.history,
+        }
+
+
+class FingerprintStore:
+    """
+    Local SQLite store of entity id -> (input fingerprint, model version, last result)
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.db_path))
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS prediction_fingerprints (
+                entity_id TEXT NOT NULL,
+                model_version TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                result TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (entity_id, model_version)
+            )
+            """
+        )
+        self.connection.commit()
+    
+    @staticmethod
+    def fingerprint(input_data: Any, model_version: str) -> str:
+        """
+        Stable hash of a row's input features combined with the model version
+        """
+        payload = json.dumps(input_data, sort_keys=True, default=str)
+        return hashlib.sha256(f"{model_version}:{payload}".encode()).hexdigest()
+    
+    def lookup(self, entity_ids: List[str], model_version: str) -> Dict[str, Any]:
+        """
+        Fetch stored (fingerprint, result) pairs for the given entities
+        """
+        found = {}
+        unique_ids = list(dict.fromkeys(entity_ids))
+        
+        # Stay below SQLite's bound-parameter limit
+        for i in range(0, len(unique_ids), 500):
+            chunk = unique_ids[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT entity_id, fingerprint, result FROM prediction_fingerprints "
+                f"WHERE model_version = ? AND entity_id IN ({placeholders})",
+                [model_version, *chunk]
+            )
+            for entity_id, fingerprint, result in rows:
+                found[entity_id] = (fingerprint, json.loads(result))
+        
+        return found
+    
+    def save(self, updates: List[Any], model_version: str):
+        """
+        Upsert fresh results for recomputed entities
+        """
+        now = datetime.now().isoformat()
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO prediction_fingerprints "
+            "(entity_id, model_version, fingerprint, result, updated_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                (entity_id, model_version, fingerprint, json.dumps(result, default=str), now)
+                for entity_id, fingerprint, result in updates
+            ]
+        )
+        self.connection.commit()
+    
+    def close(self):
+        self.connection.close()
+
+
+class ModelCache:
+    """
+    Shared cache of loaded predictors so each model file is only loaded once per run
+    """
+    
+    def __init__(self):
+        self._predictors = {}
+        self.loads = 0
+        self.hits = 0
+    
+    def get(self, model_path: str, model_type: str, model_algorithm: str) -> BasketballBatchPredictor:
+        """
+        Return the predictor for a model, loading it on first use
+        """
+        key = (str(Path(model_path).resolve()), model_type, model_algorithm)
+        
+        if key in self._predictors:
+            self.hits += 1
+        else:
+            self._predictors[key] = BasketballBatchPredictor(model_path, model_type, model_algorithm)
+            self.loads += 1
+        
+        return self._predictors[key]
+    
+    def __len__(self) -> int:
+        return len(self._predictors)
+
+
+class BasketballMixedBatchRouter:
+    """
+    Routes a batch whose rows name different models to one vectorized run per model
+    """
+    
+    MODEL_KEYS = ('model_path', 'model_type', 'model_algorithm')
+    
+    def __init__(self, model_cache: ModelCache = None, default_model: Dict[str, str] = None,
+                 max_workers: int = 4, optimize: bool = True, memory_budget_mb: float = 256,
+                 batch_size: int = None):
+        self.model_cache = model_cache or ModelCache()
+        self.default_model = {k: v for k, v in (default_model or {}).items() if v}
+        self.max_workers = max_workers
+        self.optimize = optimize
+        # Chunking options applied to every routed predictor (cached predictors are shared)
+        self.memory_budget_mb = memory_budget_mb
+        self.batch_size = batch_size
+    
+    @classmethod
+    def is_mixed_input(cls, input_data: Any) -> bool:
+        """
+        Check whether the input file uses the per-row or grouped model format
+        """
+        if isinstance(input_data, dict) and 'groups' in input_data:
+            return True
+        
+        rows = input_data.get('batch_data', input_data) if isinstance(input_data, dict) else input_data
+        return isinstance(rows, list) and any(
+            isinstance(row, dict) and 'model_path' in row for row in rows
+        )
+    
+    def expand_rows(self, input_data: Any) -> List[Dict[str, Any]]:
+        """
+        Flatten grouped or per-row input into rows of {model_path, model_type, model_algorithm, input_data}
+        """
+        if isinstance(input_data, dict) and 'groups' in input_data:
+            rows = []
+            for group in input_data['groups']:
+                spec = {k: group.get(k) for k in self.MODEL_KEYS}
+                for row_input in group.get('batch_data', []):
+                    rows.append({**spec, 'input_data': row_input})
+            return rows
+        
+        rows = input_data.get('batch_data', input_data) if isinstance(input_data, dict) else input_data
+        if not isinstance(rows, list):
+            raise ValueError("Input must contain 'groups', 'batch_data' as a list or be a list itself")
+        
+        expanded = []
+        for row in rows:
+            if isinstance(row, dict) and 'input_data' in row:
+                expanded.append(row)
+            elif isinstance(row, dict):
+                # Row carries its model spec inline next to the features
+                features = {k: v for k, v in row.items() if k not in self.MODEL_KEYS}
+                expanded.append({**{k: row.get(k) for k in self.MODEL_KEYS}, 'input_data': features})
+            else:
+                expanded.append({'input_data': row})
+        
+        return expanded
+    
+    def make_routed_predictions(
+        self,
+        rows: List[Dict[str, Any]],
+        deadline_at: float = None,
+        priority_key: str = 'priority',
+        store: 'FingerprintStore' = None,
+        entity_key: str = 'player_id',
+        output_file: str = None
+    ) -> Dict[str, Any]:
+        """
+        Group rows by model, run each group once and return results in the original order
+        
+        With deadline_at every group runs in deadline mode against the shared deadline, groups
+        holding the highest-priority rows first; rows not scored in time are listed in
+        'unprocessed_indices'. With a store every group is rescored incrementally.
+        """
+        start_time = datetime.now()
+        total_samples = len(rows)
+        results = [None] * total_samples
+        
+        # Group original indices by model spec, keeping first-seen order
+        groups = {}
+        for index, row in enumerate(rows):
+            spec = tuple(row.get(k) or self.default_model.get(k) for k in self.MODEL_KEYS)
+            
+            if not all(spec):
+                results[index] = {
+                    'error': 'Row does not name a model (model_path, model_type, model_algorithm)',
+                    'batch_index': index,
+                    'timestamp': datetime.now().isoformat(),
+                }
+                continue
+            
+            groups.setdefault(spec, []).append(index)
+        
+        group_order = list(groups.items())
+        if deadline_at is not None:
+            group_order.sort(key=lambda item: -max(
+                BasketballBatchPredictor._row_priority(rows[i]['input_data'], priority_key) for i in item[1]
+            ))
+        
+        print(f"Routing {total_samples} samples to {len(groups)} model groups")
+        
+        group_metadata = []
+        group_analysis = {}
+        unprocessed = []
+        last_progress_write = time.monotonic()
+        
+        for (model_path, model_type, model_algorithm), indices in group_order:
+            if deadline_at is not None and (
+                deadline_at - time.monotonic() - BasketballBatchPredictor.DEADLINE_SAFETY_SECONDS <= 0
+            ):
+                # Out of time: don't load the model, leave the whole group for a retry
+                unprocessed.extend(indices)
+                continue
+            
+            group_start = datetime.now()
+            group_inputs = [rows[i]['input_data'] for i in indices]
+            
+            try:
+                loads_before = self.model_cache.loads
+                predictor = self.model_cache.get(model_path, model_type, model_algorithm)
+                predictor.max_workers = self.max_workers
+                predictor.memory_budget_mb = self.memory_budget_mb
+                predictor.batch_size = self.batch_size
+                
+                if deadline_at is not None:
+                    group_result = predictor.make_deadline_predictions(group_inputs, deadline_at, priority_key=priority_key)
+                    unprocessed.extend(indices[i] for i in group_result['unprocessed_indices'])
+                    # Only scored rows are returned, each carrying its index within the group
+                    scored = [(p['batch_index'], p) for p in group_result['predictions']]
+                elif store is not None:
+                    group_result = predictor.make_incremental_predictions(group_inputs, store, entity_key)
+                    scored = enumerate(group_result['predictions'])
+                elif self.optimize:
+                    group_result = predictor.make_optimized_batch_predictions(group_inputs)
+                    scored = enumerate(group_result['predictions'])
+                else:
+                    group_result = predictor.make_batch_predictions(group_inputs)
+                    scored = enumerate(group_result['predictions'])
+                
+                for local_index, prediction in scored:
+                    prediction['batch_index'] = indices[local_index]
+                    prediction['model_path'] = model_path
+                    results[indices[local_index]] = prediction
+                
+                group_analysis[f"{model_type}:{Path(model_path).name}"] = predictor.analyze_batch_results(group_result)
+                cache_hit = self.model_cache.loads == loads_before
+                
+            except Exception as e:
+                for index in indices:
+                    results[index] = {
+                        'error': str(e),
+                        'batch_index': index,
+                        'model_path': model_path,
+                        'timestamp': datetime.now().isoformat(),
+                    }
+                cache_hit = False
+            
+            group_metadata.append({
+                'model_path': model_path,
+                'model_type': model_type,
+                'model_algorithm': model_algorithm,
+                'samples': len(indices),
+                'cache_hit': cache_hit,
+                'processing_time_seconds': (datetime.now() - group_start).total_seconds(),
+            })
+            
+            if output_file and deadline_at is not None and (
+                time.monotonic() - last_progress_write >= BasketballBatchPredictor.PROGRESS_WRITE_INTERVAL_SECONDS
+            ):
+                BasketballBatchPredictor._write_progress(output_file, self._routed_result(
+                    results, unprocessed, start_time, group_metadata, group_analysis, deadline_at, 'in_progress'
+                ))
+                last_progress_write = time.monotonic()
+        
+        status = None
+        if deadline_at is not None:
+            status = 'partial' if unprocessed else 'complete'
+        
+        return self._routed_result(results, unprocessed, start_time, group_metadata, group_analysis, deadline_at, status)
+    
+    def _routed_result(self, results: List[Any], unprocessed: List[int], start_time: datetime,
+                       group_metadata: List[Dict[str, Any]], group_analysis: Dict[str, Any],
+                       deadline_at: float = None, status: str = None) -> Dict[str, Any]:
+        """
+        Assemble the routed result; in deadline mode only scored rows are listed
+        """
+        total_samples = len(results)
+        predictions = [r for r in results if r is not None] if deadline_at is not None else results
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        result = {
+            'predictions': predictions,
+            'batch_metadata': {
+                'total_samples': total_samples,
+                'batch_processing_time_seconds': processing_time,
+                'average_time_per_sample_ms': (processing_time * 1000) / len(predictions) if predictions else 0,
+                'routing': 'mixed_model',
+                'model_groups': group_metadata,
+                'models_loaded': self.model_cache.loads,
+                'optimization_used': self.optimize,
+                'timestamp': datetime.now().isoformat(),
+                'success_rate': sum(1 for r in predictions if 'error' not in r) / len(predictions) if predictions else 0,
+            },
+            'analysis': {
+                'total_predictions': len(predictions),
+                'successful_predictions': sum(1 for r in predictions if 'error' not in r),
+                'failed_predictions': sum(1 for r in predictions if 'error' in r),
+                'by_model': group_analysis,
+            },
+        }
+        
+        if deadline_at is not None:
+            result['unprocessed_indices'] = sorted(unprocessed)
+            result['batch_metadata'].update({
+                'processed_samples': len(predictions),
+                'unprocessed_samples': len(unprocessed),
+                'status': status,
+                'deadline_remaining_ms': (deadline_at - time.monotonic()) * 1000,
+            })
+        
+        return result
+
+
 def main():
     """Main function for batch prediction"""
     parser = argparse.ArgumentParser(description='Basketball ML Batch Prediction')
-    parser.add_argument('--model-path', required=True, help='Path to trained model file')
+    parser.add_argument('--model-path', help='Path to trained model file (default model for mixed batches)')
     parser.add_argument('--input-file', required=True, help='Path to input JSON file with batch data')
     parser.add_argument('--output-file', required=True, help='Path to output JSON file')
-    parser.add_argument('--model-type', required=True, help='Type of model')
-    parser.add_argument('--model-algorithm', required=True, help='Algorithm used')
+    parser.add_argument('--model-type', help='Type of model')
+    parser.add_argument('--model-algorithm', help='Algorithm used')
     parser.add_argument('--optimize', action='store_true', help='Use optimized batch processing')
     parser.add_argument('--max-workers', type=int, default=4, help='Maximum number of worker threads')
+    parser.add_argument('--memory-budget-mb', type=float, default=256, help='Memory budget per scoring chunk; sets the chunk size')
+    parser.add_argument('--batch-size', type=int, help='Fixed chunk size (overrides the memory-budget sizing)')
+    parser.add_argument('--top-k', type=int, help='Only return the k highest-ranked rows (single-model input only)')
+    parser.add_argument('--rank-by', choices=['injury_probability', 'win_probability', 'predicted_points', 'prediction', 'confidence'],
+                        help='Score used for --top-k ranking (defaults to the model type\'s natural score)')
+    parser.add_argument('--rank-summary', action='store_true', help='Include summary counts for rows outside the top-k')
+    parser.add_argument('--deadline-ms', type=int, help='Stop cleanly after this many ms (from script start) and return partial results')
+    parser.add_argument('--priority-key', default='priority', help='Input field ordering rows in deadline mode (higher first)')
+    parser.add_argument('--fingerprint-store', help='SQLite file for incremental rescoring; unchanged rows are served from it')
+    parser.add_argument('--entity-key', default='player_id', help='Input field identifying the entity for incremental rescoring')
     
     args = parser.parse_args()
+    script_start = time.monotonic()
     
     try:
         # Load batch input data
         with open(args.input_file, 'r') as f:
             input_data = json.load(f)
         
-        batch_input_data = input_data.get('batch_data', input_data)
+        # Mixed-model batches name their model per row or per group
+        if BasketballMixedBatchRouter.is_mixed_input(input_data):
+            if args.top_k is not None:
+                # Scores of different models are not comparable, so there is no shared ranking
+                raise ValueError("--top-k is not supported for mixed-model input; rank each model's batch separately")
+            
+            router = BasketballMixedBatchRouter(
+                default_model={
+                    'model_path': args.model_path,
+                    'model_type': args.model_type,
+                    'model_algorithm': args.model_algorithm,
+                },
+                max_workers=args.max_workers,
+                optimize=args.optimize,
+                memory_budget_mb=args.memory_budget_mb,
+                batch_size=args.batch_size,
+            )
+            rows = router.expand_rows(input_data)
+            store = FingerprintStore(args.fingerprint_store) if args.fingerprint_store else None
+            try:
+                result = router.make_routed_predictions(
+                    rows,
+                    deadline_at=script_start + args.deadline_ms / 1000 if args.deadline_ms is not None else None,
+                    priority_key=args.priority_key,
+                    store=store,
+                    entity_key=args.entity_key,
+                    output_file=args.output_file,
+                )
+            finally:
+                if store is not None:
+                    store.close()
+            
+            # Atomic, since deadline mode may have left a progress snapshot that readers poll
+            BasketballBatchPredictor._write_progress(args.output_file, result)
+            
+            print(f"Mixed batch prediction completed. {len(rows)} samples across {len(router.model_cache)} models.")
+            print(f"Success rate: {result['analysis']['successful_predictions']}/{len(rows)}")
+            print(f"Output saved to {args.output_file}")
+            return
+        
+        if not (args.model_path and args.model_type and args.model_algorithm):
+            raise ValueError("--model-path, --model-type and --model-algorithm are required unless rows name their model")
+        
+        batch_input_data = input_data.get('batch_data', input_data) if isinstance(input_data, dict) else input_data
         if not isinstance(batch_input_data, list):
             raise ValueError("Input must contain 'batch_data' as a list or be a list itself")
         
         # Initialize batch predictor
         predictor = BasketballBatchPredictor(args.model_path, args.model_type, args.model_algorithm)
         predictor.max_workers = args.max_workers
+        predictor.memory_budget_mb = args.memory_budget_mb
+        predictor.batch_size = args.batch_size
         
         # Make batch predictions
-        if args.optimize:
+        if args.deadline_ms is not None:
+            result = predictor.make_deadline_predictions(
+                batch_input_data, script_start + args.deadline_ms / 1000,
+                args.output_file, args.priority_key
+            )
+        elif args.top_k is not None:
+            result = predictor.make_ranked_predictions(
+                batch_input_data, args.top_k, args.rank_by, args.rank_summary
+            )
+        elif args.fingerprint_store:
+            store = FingerprintStore(args.fingerprint_store)
+            try:
+                result = predictor.make_incremental_predictions(batch_input_data, store, args.entity_key)
+            finally:
+                store.close()
+        elif args.optimize:
             result = predictor.make_optimized_batch_predictions(batch_input_data)
         else:
             result = predictor.make_batch_predictions(batch_input_data)
@@ -370,9 +1336,8 @@ def main():
         # Add analysis
         result['analysis'] = predictor.analyze_batch_results(result)
         
-        # Save result
-        with open(args.output_file, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        # Save result (atomic, replacing any deadline-mode progress snapshot)
+        BasketballBatchPredictor._write_progress(args.output_file, result)
         
         print(f"Batch prediction completed successfully. {len(batch_input_data)} samples processed.")
         print(f"Success rate: {result.get('analysis', {}).get('successful_predictions', 0)}/{len(batch_input_data)}")
@@ -389,8 +1354,7 @@ def main():
             }
         }
         
-        with open(args.output_file, 'w') as f:
-            json.dump(error_result, f, indent=2)
+        BasketballBatchPredictor._write_progress(args.output_file, error_result)
         
         print(f"Batch prediction error: {str(e)}", file=sys.stderr)
         sys.exit(1)
@@ -6,7 +6,6 @@ Handles individual predictions using trained scikit-learn models
 
 import argparse
 import json
-import pickle
 import joblib
 import numpy as np
 import pandas as pd
@@ -35,6 +34,14 @@ except ImportError as e:
     print(f"Error importing ML libraries: {e}", file=sys.stderr)
     sys.exit(1)
 
+# Encoder plan and feature registry shared with the training pipeline (python/basketball_ai)
+TRAINING_PIPELINE_DIR = Path(__file__).resolve().parents[2] / 'python' / 'basketball_ai'
+if str(TRAINING_PIPELINE_DIR) not in sys.path:
+    sys.path.append(str(TRAINING_PIPELINE_DIR))
+from categorical_encoder import CategoricalEncoderPlan
+from artifact_slimming import restore_model
+from feature_registry import FEATURE_REGISTRY, INFERENCE_FEATURES
+
 class BasketballMLPredictor:
     """
     Main prediction class for basketball analytics
@@ -48,6 +55,8 @@ class BasketballMLPredictor:
         self.scaler = None
         self.feature_names = None
         self.preprocessing_params = None
+        self.categorical_encoder = None
+        self.inference_profile = None
         
         # Load model and associated components
         self._load_model()
@@ -56,20 +65,26 @@ class BasketballMLPredictor:
         """Load the trained model and associated components"""
         try:
             # Load main model file
-            if self.model_path.suffix == '.pkl':
-                with open(self.model_path, 'rb') as f:
-                    model_data = pickle.load(f)
-            elif self.model_path.suffix == '.joblib':
+            if self.model_path.suffix in ('.pkl', '.joblib'):
+                # joblib also reads plain pickles; MLTrainer writes joblib dumps as .pkl
                 model_data = joblib.load(self.model_path)
             else:
                 raise ValueError(f"Unsupported model file format: {self.model_path.suffix}")
             
             # Extract components from model data
             if isinstance(model_data, dict):
-                self.model = model_data['model']
+                # Slimmed tree artifacts are rebuilt into the sklearn estimator
+                self.model = restore_model(model_data['model'])
                 self.scaler = model_data.get('scaler')
                 self.feature_names = model_data.get('feature_names', [])
                 self.preprocessing_params = model_data.get('preprocessing_params', {})
+                
+                # Categorical encoding fitted during training (JSON plan)
+                if model_data.get('categorical_encoder'):
+                    self.categorical_encoder = CategoricalEncoderPlan.from_dict(model_data['categorical_encoder'])
+                
+                # Latency/throughput/size measured at save time (None for older artifacts)
+                self.inference_profile = model_data.get('inference_profile')
             else:
                 # Simple model without preprocessing components
                 self.model = model_data
@@ -81,11 +96,36 @@ class BasketballMLPredictor:
         except Exception as e:
             raise RuntimeError(f"Failed to load model: {str(e)}")
     
+    def describe(self) -> Dict[str, Any]:
+        """
+        Model metadata for model selection, including the inference profile
+        """
+        return {
+            'model_path': str(self.model_path),
+            'model_type': self.model_type,
+            'model_algorithm': self.model_algorithm,
+            'estimator': type(self.model).__name__,
+            'feature_count': len(self.feature_names or []),
+            'inference_profile': self.inference_profile,
+        }
+    
+    def fits_latency_budget(self, p99_ms: float) -> bool:
+        """
+        True if the measured single-row p99 latency is within the budget (unknown counts as fitting)
+        """
+        if not self.inference_profile:
+            return True
+        return self.inference_profile['single_row_p99_ms'] <= p99_ms
+    
     def preprocess_features(self, input_data: Dict[str, Any]) -> np.ndarray:
         """
         Preprocess input features for prediction
         """
         try:
+            # Apply the training-time categorical encoding
+            if self.categorical_encoder is not None:
+                input_data = self.categorical_encoder.encode_record(input_data)
+            
             # Convert to DataFrame for easier manipulation
             df = pd.DataFrame([input_data])
             
@@ -119,42 +159,15 @@ class BasketballMLPredictor:
     def _apply_basketball_feature_engineering(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply basketball-specific feature engineering
-        """
-        # Efficiency metrics
-        if 'points' in df.columns and 'field_goals_attempted' in df.columns:
-            df['shooting_efficiency'] = df['points'] / df['field_goals_attempted'].replace(0, 1)
-        
-        if 'assists' in df.columns and 'turnovers' in df.columns:
-            df['assist_to_turnover_ratio'] = df['assists'] / df['turnovers'].replace(0, 1)
         
-        if 'minutes' in df.columns and 'points' in df.columns:
-            df['points_per_minute'] = df['points'] / df['minutes'].replace(0, 1)
-        
-        # Usage and pace metrics
-        if 'field_goals_attempted' in df.columns and 'team_field_goals_attempted' in df.columns:
-            df['usage_rate'] = df['field_goals_attempted'] / df['team_field_goals_attempted'].replace(0, 1)
-        
-        # Defensive metrics
-        if 'steals' in df.columns and 'blocks' in df.columns:
-            df['defensive_actions'] = df['steals'] + df['blocks']
-        
-        # Physical load indicators (for injury risk)
-        if self.model_type == 'injury_risk':
-            if 'minutes_last_7_days' in df.columns and 'games_last_7_days' in df.columns:
-                df['avg_minutes_per_game'] = df['minutes_last_7_days'] / df['games_last_7_days'].replace(0, 1)
-            
-            if 'age' in df.columns and 'experience_years' in df.columns:
-                df['age_experience_interaction'] = df['age'] * df['experience_years']
-        
-        # Game context features
-        if self.model_type == 'game_outcome':
-            if 'home_wins' in df.columns and 'home_losses' in df.columns:
-                df['home_win_percentage'] = df['home_wins'] / (df['home_wins'] + df['home_losses']).replace(0, 1)
-            
-            if 'away_wins' in df.columns and 'away_losses' in df.columns:
-                df['away_win_percentage'] = df['away_wins'] / (df['away_wins'] + df['away_losses']).replace(0, 1)
-        
-        return df
+        Uses the shared feature registry, so formulas match training. With known
+        feature names only the engineered features the model uses are computed.
+        """
+        if self.feature_names:
+            plan = FEATURE_REGISTRY.plan(self.feature_names, df.columns)
+        else:
+            plan = FEATURE_REGISTRY.plan(INFERENCE_FEATURES, df.columns, model_type=self.model_type)
+        return plan.apply(df)
     
     def _handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -163,20 +176,25 @@ class BasketballMLPredictor:
         # Fill numeric columns with appropriate defaults
         numeric_columns = df.select_dtypes(include=[np.number]).columns
         
+        # Assign instead of chained inplace fillna (a no-op under pandas copy-on-write)
         for col in numeric_columns:
             if col.endswith('_percentage') or col.endswith('_rate'):
-                df[col].fillna(0.0, inplace=True)  # Rates default to 0
+                df[col] = df[col].fillna(0.0)  # Rates default to 0
             elif col.startswith('minutes'):
-                df[col].fillna(0.0, inplace=True)  # Minutes default to 0
+                df[col] = df[col].fillna(0.0)  # Minutes default to 0
             elif col in ['age', 'height', 'weight']:
-                df[col].fillna(df[col].median(), inplace=True)  # Physical stats use median
+                df[col] = df[col].fillna(df[col].median())  # Physical stats use median
             else:
-                df[col].fillna(0.0, inplace=True)  # Other numeric features default to 0
+                df[col] = df[col].fillna(0.0)  # Other numeric features default to 0
         
         # Fill categorical columns
         categorical_columns = df.select_dtypes(include=[object]).columns
         for col in categorical_columns:
-            df[col].fillna('Unknown', inplace=True)
+            if df[col].isna().all():
+                # Only nulls (e.g. a JSON null for a numeric stat): no category to keep
+                df[col] = 0.0
+            else:
+                df[col] = df[col].fillna('Unknown')
         
         return df
     
@@ -405,14 +423,25 @@ def main():
     """Main function to handle command line prediction"""
     parser = argparse.ArgumentParser(description='Basketball ML Prediction')
     parser.add_argument('--model-path', required=True, help='Path to trained model file')
-    parser.add_argument('--input-file', required=True, help='Path to input JSON file')
+    parser.add_argument('--input-file', help='Path to input JSON file (not needed with --describe)')
     parser.add_argument('--output-file', required=True, help='Path to output JSON file')
     parser.add_argument('--model-type', required=True, help='Type of model (player_performance, injury_risk, game_outcome)')
     parser.add_argument('--model-algorithm', required=True, help='Algorithm used (random_forest, logistic_regression, etc.)')
+    parser.add_argument('--describe', action='store_true', help='Write model metadata incl. inference profile instead of predicting')
     
     args = parser.parse_args()
     
+    if not args.describe and not args.input_file:
+        parser.error('--input-file is required unless --describe is given')
+    
     try:
+        if args.describe:
+            predictor = BasketballMLPredictor(args.model_path, args.model_type, args.model_algorithm)
+            with open(args.output_file, 'w') as f:
+                json.dump(predictor.describe(), f, indent=2, default=str)
+            print(f"Model description saved to {args.output_file}")
+            return
+        
         # Load input data
         with open(args.input_file, 'r') as f:
             input_data = json.load(f)